@@ -5,13 +5,13 @@ Receives and visualizes NMEA GPS data with thread-safe GUI updates.
 
 import os
 import sys
+import math
 import logging
-from datetime import datetime
+import threading
+from collections import OrderedDict, deque
 from typing import Optional, List
-from collections import deque
 
 import numpy as np
-import PIL.ImageQt
 import pyqtgraph as pg
 
 from PyQt6 import QtWidgets, QtCore, QtGui
@@ -19,10 +19,11 @@ from PyQt6.QtCore import pyqtSignal, QObject
 
 try:
     from config_loader import get_config
-    from coordinates import Coordinate, Position
+    from coordinates import Position
     from nmea_validator import NMEAValidator
     from gps_data_model import GPSDataModel, GPSPosition
     from gps_data_csv_storage import GPSDataCSVStorage
+    from gps_map_providers import MapTileCache
     import bert_utils.helper_udp
     import bert_utils.helper_maps
 except ImportError as e:
@@ -46,11 +47,15 @@ class MapManager(QObject):
 
     map_loaded = pyqtSignal(object)  # Emits PIL Image
 
+    # Maximum number of composed map images kept in memory
+    MAX_CACHED_MAPS = 16
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.config = get_config()
-        self.last_map_position: Optional[Position] = None
-        self.map_cache = {}
+        self._last_lat: Optional[float] = None
+        self._last_lon: Optional[float] = None
+        self.map_cache: OrderedDict = OrderedDict()
         self.loading = False
 
         # Map parameters from config
@@ -59,77 +64,126 @@ class MapManager(QObject):
         self.zoom_level = self.config.get('map.zoom_level', 13)
         self.update_threshold_km = self.config.get('map.update_threshold_km', 1.0)
 
-    def should_update_map(self, position: Position) -> bool:
+        # Composed maps are also kept on disk so they survive restarts.
+        # Cache keys are grid cells, so each grid size gets its own directory
+        cache_dir = os.path.join(
+            os.path.expanduser(self.config.get('map.cache_dir', '~/.cache/gps-receiver/maps')),
+            f"{self.delta_lat}_{self.delta_lon}")
+        self.disk_cache = MapTileCache(cache_dir=cache_dir,
+                                       max_size=self.config.get('map.cache_size', 100))
+
+    def should_update_map(self, lat: float, lon: float) -> bool:
         """
         Check if map should be updated based on position change.
 
         Args:
-            position: Current GPS position
+            lat: Current latitude in decimal degrees
+            lon: Current longitude in decimal degrees
 
         Returns:
             True if map update is needed
         """
-        if self.last_map_position is None:
+        if self._last_lat is None:
             return True
 
+        # Cheap bounding-box preflight: well inside the threshold box
+        # the exact distance can't reach the threshold either.
+        limit_km = self.update_threshold_km * 0.7
+        if (abs(lat - self._last_lat) * 111.0 < limit_km and
+                abs(lon - self._last_lon) * 111.0 * math.cos(math.radians(lat)) < limit_km):
+            return False
+
         # Calculate distance moved
-        distance_km = self.last_map_position.distance_to(position)
+        last = Position.from_decimal(self._last_lat, self._last_lon)
+        distance_km = last.distance_to(Position.from_decimal(lat, lon))
 
         return distance_km >= self.update_threshold_km
 
-    def load_map_async(self, position: Position) -> None:
+    def load_map_async(self, lat: float, lon: float) -> None:
         """
         Load map image asynchronously.
 
         Args:
-            position: GPS position for map center
+            lat: Map center latitude in decimal degrees
+            lon: Map center longitude in decimal degrees
         """
         if self.loading:
             logger.debug("Map load already in progress")
             return
 
-        if not self.should_update_map(position):
+        if not self.should_update_map(lat, lon):
             logger.debug("Map update not needed")
             return
 
         self.loading = True
 
         # Start loading in background thread
-        import threading
         thread = threading.Thread(
             target=self._load_map_worker,
-            args=(position,),
+            args=(lat, lon),
             daemon=True
         )
         thread.start()
 
-    def _load_map_worker(self, position: Position) -> None:
+    def _cache_key(self, lat: float, lon: float) -> tuple:
+        """
+        Quantize a position to the map grid used as cache key.
+
+        Args:
+            lat: Latitude in decimal degrees
+            lon: Longitude in decimal degrees
+
+        Returns:
+            Tuple of (lat cell, lon cell, zoom level)
+        """
+        return (math.floor(lat / self.delta_lat),
+                math.floor(lon / self.delta_lon),
+                self.zoom_level)
+
+    def _load_map_worker(self, lat: float, lon: float) -> None:
         """
         Worker thread for map loading.
 
         Args:
-            position: GPS position for map center
+            lat: Map center latitude in decimal degrees
+            lon: Map center longitude in decimal degrees
         """
         try:
-            lat, lon, _ = position.to_decimal_tuple()
+            key = self._cache_key(lat, lon)
 
-            logger.info(f"Loading map for position: {lat:.6f}, {lon:.6f}")
+            img = self.map_cache.get(key)
+            if img is not None:
+                self.map_cache.move_to_end(key)
+                logger.debug("Map cache hit for %s", key)
+            else:
+                img = self.disk_cache.get(*key)
 
-            # Load map image
-            img = bert_utils.helper_maps.get_image_osm_tile(
-                lat, lon,
-                self.delta_lat, self.delta_lon,
-                self.zoom_level
-            )
+            if img is None:
+                logger.info("Loading map for position: %.6f, %.6f", lat, lon)
+
+                # Load map image
+                img = bert_utils.helper_maps.get_image_osm_tile(
+                    lat, lon,
+                    self.delta_lat, self.delta_lon,
+                    self.zoom_level
+                )
+
+                self.disk_cache.set(*key, img)
+
+            if key not in self.map_cache:
+                self.map_cache[key] = img
+                if len(self.map_cache) > self.MAX_CACHED_MAPS:
+                    self.map_cache.popitem(last=False)
 
             # Emit signal with loaded image
             self.map_loaded.emit(img)
-            self.last_map_position = position
+            self._last_lat = lat
+            self._last_lon = lon
 
             logger.info("Map loaded successfully")
 
         except Exception as e:
-            logger.error(f"Error loading map: {e}", exc_info=True)
+            logger.error("Error loading map: %s", e, exc_info=True)
         finally:
             self.loading = False
 
@@ -140,7 +194,7 @@ class GPSPlotView(QObject):
     Manages plot widget and data display.
     """
 
-    def __init__(self, parent: QtWidgets.QWidget):
+    def __init__(self, parent: QtWidgets.QWidget, capacity: int = 1000):
         super().__init__(parent)
 
         # Create plot widget
@@ -151,6 +205,10 @@ class GPSPlotView(QObject):
         self.plot_widget.addLegend()
         self.plot_widget.showGrid(x=True, y=True)
 
+        # Let pyqtgraph decimate long tracks to the visible pixel width
+        self.plot_widget.setDownsampling(auto=True, mode='peak')
+        self.plot_widget.setClipToView(True)
+
         # Create plot lines
         pen_lat = pg.mkPen(color=(255, 0, 0), width=2)
         pen_lon = pg.mkPen(color=(0, 255, 0), width=2)
@@ -162,13 +220,53 @@ class GPSPlotView(QObject):
             [], [], name="Longitude", pen=pen_lon, symbol='s', symbolSize=5
         )
 
-        # Data storage
-        self.lon_data = deque(maxlen=1000)
-        self.lat_data = deque(maxlen=1000)
+        # Data storage: struct-of-arrays ring buffer. Every sample is written
+        # twice (at i and i + capacity) so the newest samples always form one
+        # contiguous slice that can be passed to pyqtgraph without copying.
+        self.capacity = capacity
+        self._lat = np.empty(2 * capacity, dtype=np.float64)
+        self._lon = np.empty(2 * capacity, dtype=np.float64)
+        self._write = 0
+        self._count = 0
+
+    def append(self, latitude: float, longitude: float) -> None:
+        """
+        Append a single position to the plot buffer.
+
+        Args:
+            latitude: Latitude in decimal degrees
+            longitude: Longitude in decimal degrees
+        """
+        i = self._write
+        self._lat[i] = self._lat[i + self.capacity] = latitude
+        self._lon[i] = self._lon[i + self.capacity] = longitude
+        self._write = (i + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def get_data(self):
+        """
+        Get buffered coordinates, oldest first.
+
+        Returns:
+            Tuple of (longitudes, latitudes) array views
+        """
+        start = self._write if self._count == self.capacity else 0
+        end = start + self._count
+        return self._lon[start:end], self._lat[start:end]
+
+    def redraw(self) -> None:
+        """Push the buffered coordinates to the plot."""
+        try:
+            lons, lats = self.get_data()
+            self.lat_line.setData(lons, lats)
+            logger.debug("Plot updated with %d positions", self._count)
+        except Exception as e:
+            logger.error("Error updating plot: %s", e)
 
     def update_plot(self, positions: List[GPSPosition]) -> None:
         """
-        Update plot with new position data.
+        Replace plot data with the given positions.
 
         Args:
             positions: List of GPS positions to plot
@@ -176,24 +274,92 @@ class GPSPlotView(QObject):
         if not positions:
             return
 
-        try:
-            # Extract coordinates
-            lons = [pos.longitude for pos in positions]
-            lats = [pos.latitude for pos in positions]
-
-            # Update plot data
-            self.lat_line.setData(lons, lats)
-
-            logger.debug(f"Plot updated with {len(positions)} positions")
+        # Keep only what fits into the ring
+        positions = positions[-self.capacity:]
+        count = len(positions)
+        self._lat[:count] = np.fromiter((pos.latitude for pos in positions),
+                                        dtype=np.float64, count=count)
+        self._lon[:count] = np.fromiter((pos.longitude for pos in positions),
+                                        dtype=np.float64, count=count)
+        self._lat[self.capacity:self.capacity + count] = self._lat[:count]
+        self._lon[self.capacity:self.capacity + count] = self._lon[:count]
+        self._write = count % self.capacity
+        self._count = count
 
-        except Exception as e:
-            logger.error(f"Error updating plot: {e}")
+        self.redraw()
 
     def clear(self) -> None:
         """Clear plot data."""
         self.lat_line.setData([], [])
-        self.lon_data.clear()
-        self.lat_data.clear()
+        self._write = 0
+        self._count = 0
+
+
+class SaveWorker(QtCore.QRunnable):
+    """
+    Writes GPS positions to CSV in a thread pool thread.
+    Reports the result through the owner's save signals.
+    """
+
+    def __init__(self, owner: QObject, storage: GPSDataCSVStorage,
+                 positions: List[GPSPosition], filename: str, append: bool):
+        super().__init__()
+        self.owner = owner
+        self.storage = storage
+        self.positions = positions
+        self.filename = filename
+        self.append = append
+
+    def run(self) -> None:
+        """Build export rows and write them."""
+        try:
+            # Build export columns in a single pass over the positions;
+            # missing optional values stay None and are written empty.
+            n = len(self.positions)
+            timestamps = [None] * n
+            speeds = [None] * n
+            courses = [None] * n
+            satellites = [None] * n
+            qualities = [None] * n
+            lats = np.empty(n, dtype=np.float64)
+            lons = np.empty(n, dtype=np.float64)
+            alts = np.empty(n, dtype=np.float64)
+
+            for i, p in enumerate(self.positions):
+                timestamps[i] = p.timestamp.isoformat()
+                lats[i] = p.latitude
+                lons[i] = p.longitude
+                alts[i] = p.altitude
+                speeds[i] = p.speed
+                courses[i] = p.course
+                satellites[i] = p.satellites
+                qualities[i] = p.quality
+
+            data = {
+                'timestamp': timestamps,
+                'latitude': lats,
+                'longitude': lons,
+                'altitude': alts,
+                'speed': speeds,
+                'course': courses,
+                # object dtype keeps integer columns with gaps from
+                # being widened to float
+                'satellites': np.array(satellites, dtype=object),
+                'quality': np.array(qualities, dtype=object)
+            }
+
+            if self.append:
+                filepath = self.storage.append_positions(data, self.filename)
+                logger.info("Appended %d positions to: %s", n, filepath)
+            else:
+                filepath = self.storage.save_positions(data, self.filename)
+                logger.info("Saved %d positions to: %s", n, filepath)
+
+            self.owner.save_finished.emit(str(filepath), n)
+
+        except Exception as e:
+            logger.error("Error saving data: %s", e, exc_info=True)
+            self.owner.save_failed.emit(str(e))
 
 
 class ReceiveNmea(QtWidgets.QMainWindow):
@@ -202,11 +368,15 @@ class ReceiveNmea(QtWidgets.QMainWindow):
     Implements MVC pattern with thread-safe updates.
     """
 
+    # Positions buffered between network and GUI thread; oldest are
+    # dropped when the GUI falls behind.
+    INBOX_SIZE = 256
+    # Maximum positions processed per drain tick
+    INBOX_BATCH = 64
+
     # Qt signals for thread-safe GUI updates
-    position_received = pyqtSignal(object)  # GPSPosition
-    update_plot_signal = pyqtSignal()
-    update_map_signal = pyqtSignal(object)  # Position
-    update_stats_signal = pyqtSignal(dict)
+    save_finished = pyqtSignal(str, int)  # file path, position count
+    save_failed = pyqtSignal(str)
 
     def __init__(self):
         super().__init__()
@@ -229,19 +399,38 @@ class ReceiveNmea(QtWidgets.QMainWindow):
         self.map_manager = MapManager(self)
         self.map_manager.map_loaded.connect(self.on_map_loaded)
 
-        # Initialize UDP receiver
-        self.init_network()
-
-        # Connect signals
-        self.position_received.connect(self.on_position_received_main_thread)
-        self.update_plot_signal.connect(self.update_plot)
-        self.update_map_signal.connect(self.request_map_update)
-        self.update_stats_signal.connect(self.update_statistics_display)
+        # Bounded hand-off from the network thread, drained on the GUI thread
+        self._inbox: deque = deque(maxlen=self.INBOX_SIZE)
+        self.dropped_count = 0
+        self._drain_timer = QtCore.QTimer(self)
+        self._drain_timer.setInterval(50)
+        self._drain_timer.timeout.connect(self.drain_inbox)
+        self._drain_timer.start()
+
+        # Display refresh is coalesced: new samples only set a flag, a single
+        # main-thread timer updates plot, statistics and map together.
+        self._needs_refresh = False
+        self._latest_pos = None
+        self._map_buffer: Optional[bytes] = None
+        refresh_interval = self.config.get('ui.plot_update_interval', 200)
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setSingleShot(False)
+        self._refresh_timer.setInterval(refresh_interval)
+        self._refresh_timer.timeout.connect(self.refresh_display)
+        self._refresh_timer.start()
+
+        # Connect signals (emitted from pool threads)
+        queued = QtCore.Qt.ConnectionType.QueuedConnection
+        self.save_finished.connect(self.on_save_finished, queued)
+        self.save_failed.connect(self.on_save_failed, queued)
 
         # Statistics
         self.received_count = 0
         self.error_count = 0
 
+        # Initialize UDP receiver last, callbacks may start right away
+        self.init_network()
+
         logger.info("ReceiveNmea initialized successfully")
 
     def init_ui(self) -> None:
@@ -271,7 +460,8 @@ class ReceiveNmea(QtWidgets.QMainWindow):
         main_layout.addWidget(self.map_widget)
 
         # GPS plot view
-        self.plot_view = GPSPlotView(self)
+        plot_capacity = self.config.get('gps.max_stored_positions', 1000)
+        self.plot_view = GPSPlotView(self, capacity=plot_capacity)
         main_layout.addWidget(self.plot_view.plot_widget)
 
         # Bottom controls
@@ -299,56 +489,94 @@ class ReceiveNmea(QtWidgets.QMainWindow):
         try:
             recv_port = self.config.get('network.receive_port', 19710)
             self.sock = bert_utils.helper_udp.UDPSocketClass(recv_port=recv_port)
-            self.sock.udp_recv_data.connect(self.on_receive_nmea)
-            logger.info(f"Listening on port {recv_port}")
+            # Prefer batched delivery when the socket class supports it
+            if hasattr(self.sock, 'udp_recv_batch'):
+                self.sock.udp_recv_batch.connect(self.on_receive_nmea_batch)
+            else:
+                self.sock.udp_recv_data.connect(self.on_receive_nmea)
+            logger.info("Listening on port %s", recv_port)
         except Exception as e:
-            logger.error(f"Failed to initialize network: {e}")
+            logger.error("Failed to initialize network: %s", e)
             QtWidgets.QMessageBox.critical(
                 self, "Network Error",
                 f"Failed to initialize UDP receiver: {e}"
             )
             raise
 
+    def on_receive_nmea_batch(self, messages: List[tuple]) -> None:
+        """
+        Handle a batch of received datagrams (called from network thread).
+
+        Args:
+            messages: List of (data, addr) tuples drained from the socket
+        """
+        for data, addr in messages:
+            self.on_receive_nmea(data, addr)
+
     def on_receive_nmea(self, nmea_str: str, addr: tuple) -> None:
         """
         Handle received NMEA data (called from network thread).
 
+        A datagram may carry several sentences separated by line breaks.
+
         Args:
-            nmea_str: NMEA sentence string
+            nmea_str: NMEA sentence string(s)
             addr: Sender address tuple
         """
-        try:
-            # Validate and parse NMEA
-            parsed = NMEAValidator.safe_parse(nmea_str, validate=True)
+        if isinstance(nmea_str, (bytes, bytearray)):
+            nmea_str = nmea_str.decode('ascii', errors='replace')
 
-            if parsed is None:
-                self.error_count += 1
-                logger.warning(f"Invalid NMEA received: {nmea_str}")
-                return
+        for sentence in nmea_str.splitlines():
+            if sentence:
+                self._process_sentence(sentence)
 
-            # Extract position info
-            pos_info = NMEAValidator.extract_position_info(parsed)
+    def _process_sentence(self, nmea_str: str) -> None:
+        """
+        Parse a single NMEA sentence and forward its position.
+
+        Args:
+            nmea_str: NMEA sentence string
+        """
+        try:
+            # Fast path for RMC/GGA fixes, pynmea2 for everything else
+            pos_info = NMEAValidator.parse_position(nmea_str, validate=True)
 
             if pos_info is None:
-                logger.debug("NMEA sentence contains no position data")
-                return
+                # Validate and parse NMEA
+                parsed = NMEAValidator.safe_parse(nmea_str, validate=True)
+
+                if parsed is None:
+                    self.error_count += 1
+                    logger.warning("Invalid NMEA received: %s", nmea_str)
+                    return
+
+                # Extract position info
+                pos_info = NMEAValidator.extract_position_info(parsed)
+
+                if pos_info is None:
+                    logger.debug("NMEA sentence contains no position data")
+                    return
 
             # Create GPSPosition object
-            position = GPSPosition(
-                latitude=pos_info['latitude'],
-                longitude=pos_info['longitude'],
-                altitude=pos_info.get('altitude', 0.0),
-                timestamp=pos_info.get('timestamp', datetime.now()),
-                satellites=pos_info.get('num_satellites'),
-                quality=pos_info.get('gps_quality')
-            )
+            position = GPSPosition.from_position_info(pos_info)
 
-            # Emit signal for main thread processing
-            self.position_received.emit(position)
+            # Hand over to main thread (drops oldest when full)
+            if len(self._inbox) == self.INBOX_SIZE:
+                self.dropped_count += 1
+            self._inbox.append(position)
 
         except Exception as e:
             self.error_count += 1
-            logger.error(f"Error processing NMEA: {e}", exc_info=True)
+            logger.error("Error processing NMEA: %s", e, exc_info=True)
+
+    def drain_inbox(self) -> None:
+        """Process buffered positions in the main GUI thread."""
+        for _ in range(min(len(self._inbox), self.INBOX_BATCH)):
+            try:
+                position = self._inbox.popleft()
+            except IndexError:
+                break
+            self.on_position_received_main_thread(position)
 
     def on_position_received_main_thread(self, position: GPSPosition) -> None:
         """
@@ -362,19 +590,11 @@ class ReceiveNmea(QtWidgets.QMainWindow):
         # Add to model (will trigger observer)
         self.gps_model.add_position(position)
 
-        # Update statistics display
-        self.update_stats_signal.emit(self.gps_model.get_statistics())
-
-        # Update plot
-        self.update_plot_signal.emit()
-
-        # Request map update (throttled)
-        pos = Position.from_decimal(
-            position.latitude,
-            position.longitude,
-            position.altitude
-        )
-        self.update_map_signal.emit(pos)
+        # Buffer sample and mark display for the next timer-driven refresh
+        self.plot_view.append(position.latitude, position.longitude)
+        self._latest_pos = (position.latitude, position.longitude,
+                            position.altitude or 0.0)
+        self._needs_refresh = True
 
     def on_model_updated(self, position: GPSPosition) -> None:
         """
@@ -383,22 +603,31 @@ class ReceiveNmea(QtWidgets.QMainWindow):
         Args:
             position: New GPS position
         """
-        logger.debug(f"Model updated with position: "
-                     f"{position.latitude:.6f}, {position.longitude:.6f}")
+        logger.debug("Model updated with position: %.6f, %.6f",
+                     position.latitude, position.longitude)
+
+    def refresh_display(self) -> None:
+        """Update plot, statistics and map if new positions arrived."""
+        if not self._needs_refresh:
+            return
+        self._needs_refresh = False
+
+        self.plot_view.redraw()
+        self.update_statistics_display(self.gps_model.get_statistics())
 
-    def update_plot(self) -> None:
-        """Update plot with current data."""
-        positions = self.gps_model.get_positions()
-        self.plot_view.update_plot(positions)
+        # Map manager throttles by distance moved
+        self.request_map_update(*self._latest_pos)
 
-    def request_map_update(self, position: Position) -> None:
+    def request_map_update(self, lat: float, lon: float, alt: float = 0.0) -> None:
         """
         Request map update for position.
 
         Args:
-            position: GPS position
+            lat: Latitude in decimal degrees
+            lon: Longitude in decimal degrees
+            alt: Altitude in meters (unused for map tiles)
         """
-        self.map_manager.load_map_async(position)
+        self.map_manager.load_map_async(lat, lon)
 
     def on_map_loaded(self, img) -> None:
         """
@@ -408,12 +637,18 @@ class ReceiveNmea(QtWidgets.QMainWindow):
             img: PIL Image object
         """
         try:
-            # Convert PIL image to QPixmap
-            pixmap = QtGui.QPixmap.fromImage(PIL.ImageQt.ImageQt(img))
+            # Convert PIL image to QPixmap with a single pixel copy.
+            # QImage wraps the buffer without copying, so keep it alive.
+            if img.mode != 'RGBA':
+                img = img.convert('RGBA')
+            self._map_buffer = img.tobytes('raw', 'RGBA')
+            qimg = QtGui.QImage(self._map_buffer, img.width, img.height,
+                                img.width * 4, QtGui.QImage.Format.Format_RGBA8888)
+            pixmap = QtGui.QPixmap.fromImage(qimg)
             self.map_widget.setPixmap(pixmap)
             logger.debug("Map image displayed")
         except Exception as e:
-            logger.error(f"Error displaying map: {e}")
+            logger.error("Error displaying map: %s", e)
 
     def update_statistics_display(self, stats: dict) -> None:
         """
@@ -429,14 +664,16 @@ class ReceiveNmea(QtWidgets.QMainWindow):
             avg_speed = stats.get('average_speed', 0.0)
 
             text = (f"Positions: {stored} stored, {self.received_count} received, "
-                    f"{self.error_count} errors | "
+                    f"{self.error_count} errors, {self.dropped_count} dropped | "
                     f"Distance: {distance:.1f}m | "
                     f"Avg Speed: {avg_speed * 3.6:.1f} km/h")
 
-            self.stats_label.setText(text)
+            # Avoid relayout/repaint when nothing visible changed
+            if text != self.stats_label.text():
+                self.stats_label.setText(text)
 
         except Exception as e:
-            logger.error(f"Error updating statistics: {e}")
+            logger.error("Error updating statistics: %s", e)
 
     def on_save_clicked(self) -> None:
         """Handle save button click."""
@@ -450,56 +687,61 @@ class ReceiveNmea(QtWidgets.QMainWindow):
                 )
                 return
 
-            # Prepare data for export as list of dicts
-            data = []
-            for p in positions:
-                data.append({
-                    'timestamp': p.timestamp.isoformat(),
-                    'latitude': p.latitude,
-                    'longitude': p.longitude,
-                    'altitude': p.altitude,
-                    'speed': p.speed if p.speed is not None else '',
-                    'course': p.course if p.course is not None else '',
-                    'satellites': p.satellites if p.satellites is not None else '',
-                    'quality': p.quality if p.quality is not None else ''
-                })
-
             # Determine filename
             base_filename = self.config.get('data.default_filename',
                                             'gps_positions.csv')
-            filename = base_filename
-
-            # Handle append mode
-            if self.save_checkbox.isChecked():
-                filepath = self.csv_storage.append_positions(data, filename)
-                logger.info(f"Appended {len(positions)} positions to: {filepath}")
-            else:
-                # Create new filename if file exists
-                output_dir = self.config.get('data.output_dir', 'config')
-                full_path = os.path.join(output_dir, filename)
-
-                if os.path.exists(full_path):
-                    base, ext = os.path.splitext(filename)
-                    counter = 1
-                    while os.path.exists(os.path.join(output_dir, filename)):
-                        filename = f"{base}_{counter}{ext}"
-                        counter += 1
-
-                filepath = self.csv_storage.save_positions(data, filename)
-                logger.info(f"Saved {len(positions)} positions to: {filepath}")
-
-            QtWidgets.QMessageBox.information(
-                self, "Success",
-                f"Data saved successfully to:\n{filepath}\n\n"
-                f"{len(positions)} positions saved"
-            )
+            # Without pyarrow a .parquet default is written as .csv
+            filename = self.csv_storage.output_filename(base_filename)
+            append = self.save_checkbox.isChecked()
+
+            if not append:
+                # Create new filename if file exists (one directory scan,
+                # no filesystem calls inside the loop)
+                with os.scandir(self.csv_storage.output_dir) as entries:
+                    existing = {entry.name for entry in entries}
+
+                base, ext = os.path.splitext(filename)
+                counter = 1
+                while filename in existing:
+                    filename = f"{base}_{counter}{ext}"
+                    counter += 1
+
+            # Write in a pool thread so large tracks don't block the UI
+            self.save_btn.setEnabled(False)
+            worker = SaveWorker(self, self.csv_storage, positions, filename, append)
+            QtCore.QThreadPool.globalInstance().start(worker)
 
         except Exception as e:
-            logger.error(f"Error saving data: {e}", exc_info=True)
-            QtWidgets.QMessageBox.critical(
-                self, "Save Error",
-                f"Failed to save data:\n{e}"
-            )
+            self.on_save_failed(str(e))
+
+    def on_save_finished(self, filepath: str, count: int) -> None:
+        """
+        Handle completed save (main thread).
+
+        Args:
+            filepath: Path of written file
+            count: Number of saved positions
+        """
+        self.save_btn.setEnabled(True)
+        QtWidgets.QMessageBox.information(
+            self, "Success",
+            f"Data saved successfully to:\n{filepath}\n\n"
+            f"{count} positions saved"
+        )
+
+    def on_save_failed(self, error: str) -> None:
+        """
+        Handle failed save (main thread).
+
+        Args:
+            error: Error message
+        """
+        self.save_btn.setEnabled(True)
+        logger.error("Error saving data: %s", error)
+        QtWidgets.QMessageBox.critical(
+            self, "Save Error",
+            f"Failed to save data:\n{error}"
+        )
 
     def on_clear_clicked(self) -> None:
         """Handle clear button click."""
@@ -515,12 +757,15 @@ class ReceiveNmea(QtWidgets.QMainWindow):
             self.plot_view.clear()
             self.received_count = 0
             self.error_count = 0
+            self.dropped_count = 0
             self.stats_label.setText("Data cleared. Waiting for GPS data...")
             logger.info("Data cleared")
 
     def closeEvent(self, event) -> None:
         """Handle window close event."""
         logger.info("Application closing")
+        self._drain_timer.stop()
+        self._refresh_timer.stop()
         event.accept()
 
 
@@ -541,7 +786,7 @@ def main():
         return app.exec()
 
     except Exception as e:
-        logger.error(f"Fatal error: {e}", exc_info=True)
+        logger.error("Fatal error: %s", e, exc_info=True)
         return 1
 
 
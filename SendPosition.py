@@ -4,16 +4,19 @@ Sends GPS positions as NMEA sentences via UDP with proper error handling.
 """
 
 import os
+import sys
+import socket
+import signal
 import logging
 import datetime
-from typing import Tuple
+import threading
+from typing import List, Optional
 
 try:
-    from config_loader import get_config
-    from coordinates import Coordinate, Position
+    from config_loader import get as config_get
     from nmea_validator import NMEAGenerator
     from gps_data_mat_play import PlayGPSMat
-    import bert_utils.helper_udp
+    from gps_udp_batch import send_batch
 except ImportError as e:
     print(f"Import error: {e}")
     print("Make sure all required modules are in the Python path")
@@ -37,24 +40,39 @@ class SendNmea:
     Sends GPS positions as NMEA sentences via UDP.
 
     Reads GPS data from MAT file and broadcasts as NMEA RMC sentences.
+    At high position rates consecutive sentences are coalesced into one
+    datagram, separated by CRLF like a serial NMEA stream, and the full
+    datagrams of one batch window are sent with a single sendmmsg call.
     """
 
+    # Positions closer together than this are coalesced (seconds)
+    BATCH_WINDOW = 0.01
+    # Keep coalesced datagrams below a typical Ethernet MTU
+    MAX_DATAGRAM = 1400
+    # Flush once this many full datagrams are queued
+    BATCH_SIZE = 16
+    # Log an INFO summary every N positions
+    LOG_EVERY = 100
+
+    # MAT positions are decimal degrees scaled by this factor
+    SCALE = 100000.0
+    LAT_MAX_SCALED = 90 * SCALE
+    LON_MAX_SCALED = 180 * SCALE
+
     def __init__(self):
         """Initialize NMEA sender with configuration."""
-        self.config = get_config()
-
         # Load configuration
-        data_file = self.config.get('gps.data_file', 'data/AguasVivasGPSData.mat')
+        data_file = config_get('gps.data_file', 'data/AguasVivasGPSData.mat')
         filename = os.path.join(os.getcwd(), data_file)
 
         if not os.path.exists(filename):
             raise FileNotFoundError(f"GPS data file not found: {filename}")
 
-        logger.info(f"Loading GPS data from: {filename}")
+        logger.info("Loading GPS data from: %s", filename)
 
         # Initialize GPS data player
-        start_timeout = self.config.get('gps.start_timeout', 5)
-        time_between = self.config.get('gps.time_between_positions', 1.0)
+        start_timeout = config_get('gps.start_timeout', 5)
+        time_between = config_get('gps.time_between_positions', 1.0)
 
         self.gps_mat = PlayGPSMat(
             filename,
@@ -66,23 +84,59 @@ class SendNmea:
         self.gps_mat.new_gps_pos.connect(self.on_new_pos)
 
         # Initialize UDP socket
-        udp_addr = self.config.get('network.udp_address', '127.0.0.1')
-        udp_port = self.config.get('network.udp_port', 19711)
-        recv_port = self.config.get('network.receive_port', 19710)
+        udp_addr = config_get('network.udp_address', '127.0.0.1')
+        udp_port = config_get('network.udp_port', 19711)
+        self._udp_addr = udp_addr
+        self._udp_port = udp_port
 
-        logger.info(f"Sending to: {udp_addr}:{udp_port}")
+        logger.info("Sending to: %s:%s", udp_addr, udp_port)
 
         try:
-            self.sock = bert_utils.helper_udp.UDPSocketClass(
-                addr=[[udp_addr, udp_port]],
-                recv_port=recv_port
-            )
+            self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+            self._set_send_buffer(
+                config_get('network.send_buffer_size', 12582912))
+            # Resolve the destination once; sends on a connected socket
+            # skip address lookup and per-packet route resolution
+            self.sock.connect((udp_addr, udp_port))
         except Exception as e:
             raise SendNmeaError(f"Failed to initialize UDP socket: {e}")
 
+        # Coalescing only pays off when positions arrive faster than the window
+        self.batch_enabled = time_between < self.BATCH_WINDOW
+        self._out = bytearray()
+        self._pending: List[bytes] = []
+        self._flush_timer: Optional[threading.Timer] = None
+        self._send_lock = threading.Lock()
+
         self.position_count = 0
         logger.info("SendNmea initialized successfully")
 
+    def _set_send_buffer(self, size: int) -> None:
+        """
+        Request a larger kernel send buffer to absorb bursts.
+
+        On Linux the effective size is capped by net.core.wmem_max,
+        raise it (sysctl) to get buffers beyond the system limit. Being
+        capped is the normal case with default sysctls, so it is only
+        logged at INFO.
+
+        Args:
+            size: Requested buffer size in bytes
+        """
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, size)
+        actual = self.sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF)
+        granted = actual
+        if sys.platform.startswith("linux"):
+            # Linux reports twice the granted size for bookkeeping overhead
+            granted //= 2
+        if granted < size:
+            logger.info("Send buffer capped at %d bytes "
+                        "(requested %d), raise net.core.wmem_max for more",
+                        granted, size)
+        else:
+            logger.debug("Send buffer size: %d bytes", granted)
+
     def on_new_pos(self, easting: float, northing: float) -> None:
         """
         Handle new GPS position from MAT file.
@@ -92,34 +146,34 @@ class SendNmea:
             northing: Northing coordinate (scaled)
         """
         try:
-            # Convert scaled values to decimal degrees
-            # Assuming the values are scaled by 100000
-            lat_decimal = float(northing) / 100000.0
-            lon_decimal = float(easting) / 100000.0
-
-            # Validate coordinates
-            if not (-90 <= lat_decimal <= 90):
-                logger.warning(f"Invalid latitude: {lat_decimal}")
+            # Validate on the scaled values, convert only accepted positions
+            if not (-self.LAT_MAX_SCALED <= northing <= self.LAT_MAX_SCALED and
+                    -self.LON_MAX_SCALED <= easting <= self.LON_MAX_SCALED):
+                logger.warning("Invalid position (scaled): E=%s, N=%s",
+                               easting, northing)
                 return
 
-            if not (-180 <= lon_decimal <= 180):
-                logger.warning(f"Invalid longitude: {lon_decimal}")
-                return
+            # Convert scaled values to decimal degrees
+            lat_decimal = float(northing) / self.SCALE
+            lon_decimal = float(easting) / self.SCALE
 
             # Generate NMEA sentence
-            nmea_str = self.generate_nmea(lat_decimal, lon_decimal)
+            nmea = self.generate_nmea(lat_decimal, lon_decimal)
 
             # Send via UDP
-            self.send_nmea(nmea_str)
+            self.send_nmea(nmea)
 
             self.position_count += 1
-            logger.info(f"Sent position #{self.position_count}: "
-                        f"Lat={lat_decimal:.6f}, Lon={lon_decimal:.6f}")
+            logger.debug("Sent position #%d: Lat=%.6f, Lon=%.6f",
+                         self.position_count, lat_decimal, lon_decimal)
+            if self.position_count % self.LOG_EVERY == 0:
+                logger.info("Sent %d positions", self.position_count)
 
         except Exception as e:
-            logger.error(f"Error processing new position: {e}", exc_info=True)
+            logger.error("Error processing new position: %s", e,
+                         exc_info=logger.isEnabledFor(logging.DEBUG))
 
-    def generate_nmea(self, latitude: float, longitude: float) -> str:
+    def generate_nmea(self, latitude: float, longitude: float) -> bytes:
         """
         Generate NMEA RMC sentence from coordinates.
 
@@ -128,40 +182,101 @@ class SendNmea:
             longitude: Longitude in decimal degrees
 
         Returns:
-            Complete NMEA RMC sentence with checksum
+            Complete NMEA RMC sentence with checksum as ASCII bytes
         """
         try:
+            # One clock read for both time and date fields
+            now = datetime.datetime.utcnow()
+
             # Use NMEAGenerator for proper formatting
-            nmea_sentence = NMEAGenerator.generate_rmc(
+            nmea_sentence = NMEAGenerator.generate_rmc_bytes(
                 latitude=latitude,
                 longitude=longitude,
-                timestamp=datetime.datetime.utcnow(),
+                timestamp=now,
                 speed=0.0,  # Could be calculated from position changes
                 course=0.0,
-                date=datetime.datetime.utcnow()
+                date=now
             )
 
-            logger.debug(f"Generated NMEA: {nmea_sentence}")
+            logger.debug("Generated NMEA: %r", nmea_sentence)
             return nmea_sentence
 
         except Exception as e:
-            logger.error(f"Error generating NMEA: {e}")
+            logger.error("Error generating NMEA: %s", e)
             raise SendNmeaError(f"NMEA generation failed: {e}")
 
-    def send_nmea(self, nmea_string: str) -> None:
+    def send_nmea(self, payload: bytes) -> None:
         """
         Send NMEA sentence via UDP.
 
+        Sends immediately at low rates, otherwise appends the sentence to
+        the outgoing datagram. A datagram the next sentence would not fit
+        into is queued; queued datagrams are sent together when BATCH_SIZE
+        are pending or the batch window elapsed.
+
         Args:
-            nmea_string: NMEA sentence to send
+            payload: NMEA sentence as ASCII bytes
         """
         try:
-            self.sock.send_data(nmea_string)
-            logger.debug(f"Sent NMEA: {nmea_string}")
-        except Exception as e:
-            logger.error(f"Error sending NMEA: {e}")
+            if not self.batch_enabled:
+                self.sock.send(payload)
+                logger.debug("Sent NMEA: %r", payload)
+                return
+
+            with self._send_lock:
+                if len(self._out) + len(payload) + 2 > self.MAX_DATAGRAM:
+                    self._pending.append(bytes(self._out))
+                    self._out.clear()
+                    if len(self._pending) >= self.BATCH_SIZE:
+                        self._flush_locked()
+
+                self._out += payload
+                self._out += b'\r\n'
+
+                if self._flush_timer is None:
+                    self._flush_timer = threading.Timer(self.BATCH_WINDOW,
+                                                        self._on_flush_timer)
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+        except OSError as e:
+            logger.error("Error sending NMEA: %s", e)
             raise SendNmeaError(f"UDP send failed: {e}")
 
+    def flush(self) -> None:
+        """Send the coalesced sentences now."""
+        with self._send_lock:
+            self._flush_locked()
+
+    def _on_flush_timer(self) -> None:
+        """Batch window elapsed, send whatever was coalesced."""
+        try:
+            self.flush()
+        except OSError as e:
+            logger.error("Error sending NMEA batch: %s", e)
+
+    def _flush_locked(self) -> None:
+        """Send queued and outgoing datagrams (caller holds the send lock)."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if self._out:
+            self._pending.append(bytes(self._out))
+            self._out.clear()
+        if not self._pending:
+            return
+        sent = send_batch(self.sock, self._pending)
+        logger.debug("Sent batch of %d coalesced datagrams", sent)
+        self._pending.clear()
+
+    def close(self) -> None:
+        """Flush pending sentences and close the socket."""
+        try:
+            self.flush()
+        except OSError as e:
+            logger.error("Error flushing NMEA batch: %s", e)
+        finally:
+            self.sock.close()
+
     def get_statistics(self) -> dict:
         """
         Get sender statistics.
@@ -171,40 +286,41 @@ class SendNmea:
         """
         return {
             'positions_sent': self.position_count,
-            'udp_address': self.config.get('network.udp_address'),
-            'udp_port': self.config.get('network.udp_port')
+            'udp_address': self._udp_addr,
+            'udp_port': self._udp_port
         }
 
 
 def main():
     """Main entry point."""
+    sender = None
     try:
         logger.info("Starting GPS Position Sender...")
         sender = SendNmea()
 
-        # Keep running
+        # Park the main thread until Ctrl+C, no periodic wakeups
+        stop = threading.Event()
+        signal.signal(signal.SIGINT, lambda *_: stop.set())
         logger.info("Sender is running. Press Ctrl+C to stop.")
+        stop.wait()
 
-        # In a real application, you might want to add a proper event loop
-        # or signal handling here
-        import time
-        while True:
-            time.sleep(1)
+        logger.info("Sender stopped by user")
+        sender.close()
 
     except KeyboardInterrupt:
         logger.info("Sender stopped by user")
+        if sender is not None:
+            sender.close()
     except FileNotFoundError as e:
-        logger.error(f"File not found: {e}")
+        logger.error("File not found: %s", e)
     except SendNmeaError as e:
-        logger.error(f"Send error: {e}")
+        logger.error("Send error: %s", e)
     except Exception as e:
-        logger.error(f"Unexpected error: {e}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         return 1
 
     return 0
 
 
 if __name__ == "__main__":
-    import sys
-
     sys.exit(main())
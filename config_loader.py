@@ -1,7 +1,8 @@
 import json
 import logging
 from pathlib import Path
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 
 class ConfigurationError(Exception):
     """Raised when configuration is invalid or missing."""
@@ -12,26 +13,43 @@ class Config:
     
     _instance = None
     _config_data = None
+    _flat: Dict[str, Any] = {}
 
     def __new__(cls, config_path: str = "config.json"):
         if cls._instance is None:
             cls._instance = super(Config, cls).__new__(cls)
             cls._instance._load_config(config_path)
+            cls._instance._flat = cls._flatten(cls._instance._config_data)
         return cls._instance
 
+    @staticmethod
+    def _flatten(data: Optional[dict], prefix: str = "",
+                 flat: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Index every value (and section) by its dotted path."""
+        if flat is None:
+            flat = {}
+        if not isinstance(data, dict):
+            return flat
+        for key, value in data.items():
+            path = f"{prefix}{key}"
+            flat[path] = value
+            if isinstance(value, dict):
+                Config._flatten(value, path + ".", flat)
+        return flat
+
     def _load_config(self, config_path: str) -> None:
         """Load configuration from JSON file."""
         config_file = Path(config_path)
 
         if not config_file.exists():
-            logging.warning(f"Config file {config_path} not found. Using defaults.")
+            logging.warning("Config file %s not found. Using defaults.", config_path)
             self._config_data = self._get_default_config()
             return
 
         try:
             with open(config_file, 'r', encoding='utf-8') as f:
                 self._config_data = json.load(f)
-                logging.info(f"Configuration loaded from {config_path}")
+                logging.info("Configuration loaded from %s", config_path)
         except json.JSONDecodeError as e:
             raise ConfigurationError(f"Error parsing JSON config: {e}")
         except Exception as e:
@@ -39,21 +57,12 @@ class Config:
 
     def get(self, path: str, default: Any = None) -> Any:
         """Get configuration value using dot notation."""
-        if self._config_data is None:
-            return default
-
-        keys = path.split('.')
-        value = self._config_data
-
-        for key in keys:
-            if isinstance(value, dict):
-                value = value.get(key)
-                if value is None:
-                    return default
-            else:
-                return default
+        value = self._flat.get(path)
+        return default if value is None else value
 
-        return value
+    def freeze(self) -> Mapping[str, Any]:
+        """Get read-only mapping of all values keyed by dotted path."""
+        return MappingProxyType(self._flat)
 
     def get_section(self, section: str) -> dict:
         """Get entire configuration section."""
@@ -119,3 +128,18 @@ class Config:
             raise ConfigurationError(f"Invalid map zoom level: {zoom}")
 
         return True
+
+
+def get_config() -> Config:
+    """Get the shared configuration instance."""
+    return Config()
+
+
+# Loaded once at import; read-only view keyed by dotted path
+CONFIG: Mapping[str, Any] = get_config().freeze()
+
+
+def get(path: str, default: Any = None) -> Any:
+    """Get configuration value by dotted path from the frozen CONFIG."""
+    value = CONFIG.get(path)
+    return default if value is None else value
@@ -4,8 +4,12 @@ Provides consistent coordinate conversion and validation.
 """
 
 from dataclasses import dataclass
-from typing import Literal, Tuple
-import math
+from typing import Iterable, List, Literal, Tuple
+
+import numpy as np
+
+from gps_kernels import (EARTH_RADIUS_KM, decimal_to_dm, decimal_to_dms,
+                         nmea_to_decimal, haversine_km)
 
 
 class CoordinateError(Exception):
@@ -13,7 +17,37 @@ class CoordinateError(Exception):
     pass
 
 
-@dataclass
+_LAT_HEMISPHERES = frozenset(('N', 'S'))
+_LON_HEMISPHERES = frozenset(('E', 'W'))
+_NEGATIVE_HEMISPHERES = frozenset(('S', 'W'))
+
+
+def haversine_km_array(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """
+    Vectorized great circle distance using the Haversine formula.
+
+    Inputs are broadcast against each other, so one reference point can be
+    compared with many candidates in a single call.
+
+    Args:
+        lat1: Latitude(s) of first point(s) in signed decimal degrees
+        lon1: Longitude(s) of first point(s) in signed decimal degrees
+        lat2: Latitude(s) of second point(s) in signed decimal degrees
+        lon2: Longitude(s) of second point(s) in signed decimal degrees
+
+    Returns:
+        Array of distances in kilometers
+    """
+    lat1 = np.radians(lat1)
+    lat2 = np.radians(lat2)
+    dlat = lat2 - lat1
+    dlon = np.radians(np.subtract(lon2, lon1))
+
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+@dataclass(slots=True, frozen=True)
 class Coordinate:
     """
     Represents a single coordinate (latitude or longitude).
@@ -35,16 +69,35 @@ class Coordinate:
         """Validate coordinate values after initialization."""
         self._validate()
 
+    @classmethod
+    def _create(cls, decimal: float, hemisphere: str) -> 'Coordinate':
+        """
+        Create Coordinate without validation.
+
+        Only for callers that already checked range and hemisphere.
+
+        Args:
+            decimal: Decimal degrees
+            hemisphere: Hemisphere indicator (N/S/E/W)
+
+        Returns:
+            Coordinate instance
+        """
+        coord = object.__new__(cls)
+        object.__setattr__(coord, 'decimal_degrees', decimal)
+        object.__setattr__(coord, 'hemisphere', hemisphere)
+        return coord
+
     def _validate(self) -> None:
         """Validate coordinate values are in valid range."""
         abs_value = abs(self.decimal_degrees)
 
-        if self.hemisphere in ('N', 'S'):
+        if self.hemisphere in _LAT_HEMISPHERES:
             if abs_value > 90:
                 raise CoordinateError(
                     f"Latitude {self.decimal_degrees} exceeds valid range [-90, 90]"
                 )
-        elif self.hemisphere in ('E', 'W'):
+        elif self.hemisphere in _LON_HEMISPHERES:
             if abs_value > 180:
                 raise CoordinateError(
                     f"Longitude {self.decimal_degrees} exceeds valid range [-180, 180]"
@@ -62,10 +115,7 @@ class Coordinate:
         Returns:
             Coordinate in DDDMM.MMMM format
         """
-        abs_val = abs(self.decimal_degrees)
-        degrees = int(abs_val)
-        minutes = (abs_val - degrees) * 60.0
-        return degrees * 100 + minutes
+        return decimal_to_dm(self.decimal_degrees)
 
     @property
     def degrees_minutes_seconds(self) -> Tuple[int, int, float]:
@@ -75,12 +125,7 @@ class Coordinate:
         Returns:
             Tuple of (degrees, minutes, seconds)
         """
-        abs_val = abs(self.decimal_degrees)
-        degrees = int(abs_val)
-        remaining = (abs_val - degrees) * 60.0
-        minutes = int(remaining)
-        seconds = (remaining - minutes) * 60.0
-        return (degrees, minutes, seconds)
+        return decimal_to_dms(self.decimal_degrees)
 
     @property
     def signed_decimal(self) -> float:
@@ -90,7 +135,7 @@ class Coordinate:
         Returns:
             Signed decimal degrees
         """
-        if self.hemisphere in ('S', 'W'):
+        if self.hemisphere in _NEGATIVE_HEMISPHERES:
             return -abs(self.decimal_degrees)
         return abs(self.decimal_degrees)
 
@@ -112,17 +157,7 @@ class Coordinate:
             48.1234
         """
         try:
-            value = float(nmea_value)
-
-            # Extract degrees (everything before last 2 digits of integer part)
-            degrees = int(value / 100)
-
-            # Extract minutes (last 2 digits + decimal part)
-            minutes = value - (degrees * 100)
-
-            # Convert to decimal degrees
-            decimal = degrees + minutes / 60.0
-
+            decimal = nmea_to_decimal(float(nmea_value))
             return cls(decimal, direction)
         except (ValueError, TypeError) as e:
             raise CoordinateError(f"Invalid NMEA value '{nmea_value}': {e}")
@@ -155,9 +190,9 @@ class Coordinate:
         """
         dm = self.degrees_minutes
         if lat_format:
-            return f"{dm:07.4f}"  # DDMM.MMMM
+            return "%09.4f" % dm  # DDMM.MMMM
         else:
-            return f"{dm:08.4f}"  # DDDMM.MMMM
+            return "%010.4f" % dm  # DDDMM.MMMM
 
     def __str__(self) -> str:
         """String representation."""
@@ -169,7 +204,7 @@ class Coordinate:
         return f"Coordinate({self.decimal_degrees}, '{self.hemisphere}')"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Position:
     """
     Represents a geographic position with latitude and longitude.
@@ -196,13 +231,20 @@ class Position:
 
         Returns:
             Position instance
+
+        Raises:
+            CoordinateError: If latitude or longitude is out of range
         """
-        lat_hem = 'N' if lat >= 0 else 'S'
-        lon_hem = 'E' if lon >= 0 else 'W'
+        # Hemispheres follow from the sign, so a single range check
+        # replaces the per-Coordinate validation
+        if abs(lat) > 90:
+            raise CoordinateError(f"Latitude {lat} exceeds valid range [-90, 90]")
+        if abs(lon) > 180:
+            raise CoordinateError(f"Longitude {lon} exceeds valid range [-180, 180]")
 
         return cls(
-            Coordinate(abs(lat), lat_hem),
-            Coordinate(abs(lon), lon_hem),
+            Coordinate._create(abs(lat), 'N' if lat >= 0 else 'S'),
+            Coordinate._create(abs(lon), 'E' if lon >= 0 else 'W'),
             alt
         )
 
@@ -250,27 +292,93 @@ class Position:
         Returns:
             Distance in kilometers
         """
-        R = 6371.0  # Earth radius in km
+        return haversine_km(self.latitude.signed_decimal,
+                            self.longitude.signed_decimal,
+                            other.latitude.signed_decimal,
+                            other.longitude.signed_decimal)
 
-        lat1 = math.radians(self.latitude.signed_decimal)
-        lon1 = math.radians(self.longitude.signed_decimal)
-        lat2 = math.radians(other.latitude.signed_decimal)
-        lon2 = math.radians(other.longitude.signed_decimal)
-
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
+    def distance_to_array(self, lats, lons) -> np.ndarray:
+        """
+        Calculate distances to many positions at once.
 
-        a = (math.sin(dlat / 2) ** 2 +
-             math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2)
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+        Args:
+            lats: Array of target latitudes in signed decimal degrees
+            lons: Array of target longitudes in signed decimal degrees
 
-        return R * c
+        Returns:
+            Array of distances in kilometers
+        """
+        return haversine_km_array(self.latitude.signed_decimal,
+                                  self.longitude.signed_decimal,
+                                  np.asarray(lats, dtype=np.float64),
+                                  np.asarray(lons, dtype=np.float64))
 
     def __str__(self) -> str:
         """String representation."""
         return f"Position({self.latitude}, {self.longitude}, {self.altitude}m)"
 
 
+@dataclass(slots=True)
+class PositionArray:
+    """
+    Struct-of-arrays container for many positions.
+
+    Stores signed decimal degrees in parallel float64 arrays so batch
+    consumers can work on whole columns instead of Position objects.
+
+    Attributes:
+        lat: Latitudes in signed decimal degrees
+        lon: Longitudes in signed decimal degrees
+        alt: Altitudes in meters
+    """
+
+    lat: np.ndarray
+    lon: np.ndarray
+    alt: np.ndarray
+
+    @classmethod
+    def from_positions(cls, positions: Iterable[Position]) -> 'PositionArray':
+        """
+        Create array container from Position objects.
+
+        Args:
+            positions: Iterable of positions
+
+        Returns:
+            PositionArray instance
+        """
+        rows = [p.to_decimal_tuple() for p in positions]
+        data = np.array(rows, dtype=np.float64).reshape(-1, 3)
+        return cls(data[:, 0].copy(), data[:, 1].copy(), data[:, 2].copy())
+
+    def to_positions(self) -> List[Position]:
+        """
+        Convert back to Position objects.
+
+        Returns:
+            List of positions
+        """
+        return [Position.from_decimal(lat, lon, alt)
+                for lat, lon, alt in zip(self.lat.tolist(), self.lon.tolist(),
+                                         self.alt.tolist())]
+
+    def distances_from(self, position: Position) -> np.ndarray:
+        """
+        Calculate distances from a position to all stored positions.
+
+        Args:
+            position: Reference position
+
+        Returns:
+            Array of distances in kilometers
+        """
+        return position.distance_to_array(self.lat, self.lon)
+
+    def __len__(self) -> int:
+        """Number of stored positions."""
+        return len(self.lat)
+
+
 class CoordinateConverter:
     """Utility class for various coordinate conversions."""
 
@@ -285,12 +393,25 @@ class CoordinateConverter:
         Returns:
             Tuple of (degrees, minutes, seconds)
         """
-        abs_val = abs(decimal)
-        degrees = int(abs_val)
+        return decimal_to_dms(decimal)
+
+    @staticmethod
+    def decimal_to_dms_array(decimal) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Convert an array of decimal degrees to degrees, minutes, seconds.
+
+        Args:
+            decimal: Array-like of decimal degrees (sign is ignored)
+
+        Returns:
+            Tuple of (degrees, minutes, seconds) arrays
+        """
+        abs_val = np.abs(np.asarray(decimal, dtype=np.float64))
+        degrees = np.floor(abs_val)
         remaining = (abs_val - degrees) * 60.0
-        minutes = int(remaining)
+        minutes = np.floor(remaining)
         seconds = (remaining - minutes) * 60.0
-        return (degrees, minutes, seconds)
+        return degrees.astype(np.int32), minutes.astype(np.int32), seconds
 
     @staticmethod
     def dms_to_decimal(degrees: int, minutes: int, seconds: float) -> float:
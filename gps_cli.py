@@ -1,22 +1,42 @@
 """
 Command-line interface for GPS Position System.
 Provides tools for recording, exporting, and managing GPS data.
+
+Heavy modules (pandas via the storage layer, networking, NMEA parsing,
+config loading) are imported inside the commands that need them, so
+`--help` and shell completion do not pay for them.
 """
 
 import asyncio
+import collections
+import functools
 import click
 import logging
-from pathlib import Path
-from datetime import datetime, timedelta
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from typing import Optional
 
-from gps_data_csv_storage import GPSDataCSVStorage
-from gps_network_async import AsyncNMEAReceiver, AsyncNMEASender
 from gps_structured_logging import setup_logging
-from config_loader import get_config
 
 logger = logging.getLogger(__name__)
 
+# record writes recorded fixes to disk in batches of this size
+RECORD_FLUSH_ROWS = 500
+# record prints every Nth fix (only on a terminal)
+RECORD_ECHO_EVERY = 10
+
+
+def run_async(func):
+    """Run an async click command to completion with asyncio.run()."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        from gps_network_async import install_fast_loop
+
+        install_fast_loop()
+        return asyncio.run(func(*args, **kwargs))
+    return wrapper
+
 
 @click.group()
 @click.option('--log-level', default='INFO',
@@ -35,37 +55,83 @@ def cli(log_level: str, json_logs: bool):
               help='Listen port')
 @click.option('--output', default='gps_positions.csv',
               help='Output CSV filename')
+@run_async
 async def record(duration: int, port: int, output: str):
     """Record GPS data from UDP stream."""
+    from gps_data_csv_storage import GPSDataCSVStorage
+    from gps_network_async import AsyncNMEAReceiver
+    from nmea_validator import NMEAValidator
+    from gps_kernels import NUMBA_AVAILABLE, parse_gga
+    import numpy as np
+
     click.echo(f"Recording GPS data for {duration} seconds on port {port}...")
     click.echo(f"Output: {output}")
 
-    config = get_config()
     storage = GPSDataCSVStorage()
     receiver = AsyncNMEAReceiver(port=port)
-    positions = []
+    loop = asyncio.get_running_loop()
+
+    # Fixes are written in batches on one worker thread (keeps order),
+    # so memory stays bounded and the loop never blocks on disk I/O
+    pending = collections.deque()
+    writer = ThreadPoolExecutor(max_workers=1)
+    writes = []
+    recorded = 0
+    # Progress lines are for humans, skip them when output is redirected
+    show_progress = sys.stdout.isatty()
+
+    def flush_pending():
+        """Hand buffered fixes to the writer thread."""
+        if not pending:
+            return
+        batch = list(pending)
+        pending.clear()
+        # First batch replaces an existing file, later ones append
+        writes.append(loop.run_in_executor(
+            writer, storage.save_positions, batch, output, bool(writes)
+        ))
+
+    def parse_fix(nmea_str: str):
+        """Return (lat, lon, alt, satellites, quality) or None."""
+        # Compiled GGA parser when Numba is installed (pure Python
+        # it is slower than the regex path, so skip it then)
+        if NUMBA_AVAILABLE and nmea_str[3:6] == 'GGA':
+            lat, lon, alt, sats, quality = parse_gga(
+                np.frombuffer(nmea_str.encode('ascii', 'replace'), dtype=np.uint8))
+            if lat == lat:
+                return (lat, lon, alt if alt == alt else 0.0,
+                        int(sats) if sats == sats else None, int(quality))
+
+        # Regex fast path for RMC/GGA, pynmea2 for everything else
+        info = NMEAValidator.parse_position(nmea_str)
+        if info is None:
+            parsed = NMEAValidator.safe_parse(nmea_str)
+            info = NMEAValidator.extract_position_info(parsed) if parsed else None
+        if info is None:
+            return None
+        return (info.latitude, info.longitude, info.altitude or 0.0,
+                info.num_satellites, info.gps_quality)
 
     def on_nmea(nmea_str: str, addr):
         """Handle NMEA data."""
+        nonlocal recorded
         try:
-            from nmea_validator import NMEAValidator
-
-            parsed = NMEAValidator.safe_parse(nmea_str)
-            if parsed:
-                info = NMEAValidator.extract_position_info(parsed)
-                if info:
-                    positions.append({
-                        'timestamp': datetime.now().isoformat(),
-                        'latitude': info.get('latitude'),
-                        'longitude': info.get('longitude'),
-                        'altitude': info.get('altitude', 0.0),
-                        'satellites': info.get('num_satellites'),
-                        'quality': info.get('gps_quality')
-                    })
-                    click.echo(
-                        f"Recorded: {info.get('latitude'):.6f}, "
-                        f"{info.get('longitude'):.6f}"
-                    )
+            fix = parse_fix(nmea_str)
+            if fix:
+                lat, lon, alt, sats, quality = fix
+                recorded += 1
+                pending.append({
+                    'timestamp': datetime.now().isoformat(),
+                    'latitude': lat,
+                    'longitude': lon,
+                    'altitude': alt,
+                    'satellites': sats,
+                    'quality': quality
+                })
+                if show_progress and recorded % RECORD_ECHO_EVERY == 0:
+                    click.echo(f"Recorded {recorded}: {lat:.6f}, {lon:.6f}")
+                if len(pending) >= RECORD_FLUSH_ROWS:
+                    flush_pending()
         except Exception as e:
             click.echo(f"Error: {e}", err=True)
 
@@ -85,18 +151,25 @@ async def record(duration: int, port: int, output: str):
         click.echo("Recording stopped by user")
         await receiver.stop()
 
-    # Save data
-    if positions:
-        filepath = storage.save_positions(positions, output)
-        click.echo(f"Saved {len(positions)} positions to {filepath}")
-    else:
-        click.echo("No positions recorded")
+    # Save remaining data
+    flush_pending()
+    try:
+        if writes:
+            filepath = (await asyncio.gather(*writes))[-1]
+            click.echo(f"Saved {recorded} positions to {filepath}")
+        else:
+            click.echo("No positions recorded")
+    finally:
+        writer.shutdown()
+        storage.close()
 
 
 @cli.command()
 @click.option('--file', required=True, help='CSV file to analyze')
 def stats(file: str):
     """Show statistics for GPS data file."""
+    from gps_data_csv_storage import GPSDataCSVStorage
+
     storage = GPSDataCSVStorage()
 
     try:
@@ -123,6 +196,8 @@ def stats(file: str):
 def filter_by_date(file: str, start: str, end: str,
                    output: Optional[str]):
     """Filter GPS data by date range."""
+    from gps_data_csv_storage import GPSDataCSVStorage
+
     try:
         start_dt = datetime.fromisoformat(start)
         end_dt = datetime.fromisoformat(end)
@@ -146,6 +221,8 @@ def filter_by_date(file: str, start: str, end: str,
 @click.option('--confirm', is_flag=True, help='Confirm deletion')
 def cleanup(file: str, days: int, confirm: bool):
     """Delete old GPS records."""
+    from gps_data_csv_storage import GPSDataCSVStorage
+
     storage = GPSDataCSVStorage()
 
     if not confirm:
@@ -164,6 +241,8 @@ def cleanup(file: str, days: int, confirm: bool):
 @cli.command()
 def list_files():
     """List all GPS data files."""
+    from gps_data_csv_storage import GPSDataCSVStorage
+
     storage = GPSDataCSVStorage()
     files = storage.list_files()
 
@@ -181,9 +260,11 @@ def list_files():
 @click.option('--lat', required=True, type=float, help='Latitude')
 @click.option('--lon', required=True, type=float, help='Longitude')
 @click.option('--speed', default=0.0, type=float, help='Speed in m/s')
+@run_async
 async def send(host: str, port: int, lat: float,
                lon: float, speed: float):
     """Send GPS position as NMEA."""
+    from gps_network_async import AsyncNMEASender
     from nmea_validator import NMEAGenerator
 
     try:
@@ -203,6 +284,8 @@ async def send(host: str, port: int, lat: float,
               help='Config file to validate')
 def validate_config(config: str):
     """Validate configuration file."""
+    from config_loader import get_config
+
     try:
         cfg = get_config()
         cfg.validate()
@@ -221,25 +304,40 @@ def validate_config(config: str):
         click.echo(f"✗ Configuration invalid: {e}", err=True)
 
 
+def _format_coord(value) -> str:
+    """Format a coordinate read as number or raw CSV string."""
+    if value is None or value == '':
+        return 'N/A'
+    if isinstance(value, str):
+        return value
+    return f"{value:.6f}"
+
+
 @cli.command()
 @click.option('--file', required=True, help='CSV file to view')
 @click.option('--lines', default=10, help='Number of lines to display')
 def view(file: str, lines: int):
     """View GPS data file."""
+    from gps_data_csv_storage import GPSDataCSVStorage
+
     storage = GPSDataCSVStorage()
 
     try:
-        positions = storage.load_positions(file)
+        # Raw CSV strings are enough for display
+        positions = storage.load_positions(file, typed=False)
 
         click.echo(f"\n=== {file} ({len(positions)} total) ===\n")
 
-        for i, pos in enumerate(positions[:lines], 1):
-            click.echo(
-                f"{i}. {pos.get('timestamp', 'N/A')} - "
-                f"Lat: {pos.get('latitude', 'N/A'):.6f}, "
-                f"Lon: {pos.get('longitude', 'N/A'):.6f}, "
-                f"Alt: {pos.get('altitude', 'N/A')}m"
-            )
+        # One write for all rows instead of one per line
+        rows = [
+            f"{i}. {pos.get('timestamp', 'N/A')} - "
+            f"Lat: {_format_coord(pos.get('latitude'))}, "
+            f"Lon: {_format_coord(pos.get('longitude'))}, "
+            f"Alt: {pos.get('altitude', 'N/A')}m"
+            for i, pos in enumerate(positions[:lines], 1)
+        ]
+        if rows:
+            click.echo('\n'.join(rows))
 
         if len(positions) > lines:
             click.echo(f"\n... and {len(positions) - lines} more")
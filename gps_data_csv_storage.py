@@ -5,13 +5,54 @@ Provides efficient CSV export with append mode and multiple formats.
 
 import csv
 import logging
+import os
+import shutil
+import tempfile
+import warnings
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import IO, List, Optional, Dict, Any, Sequence, Tuple, Union
 from datetime import datetime
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Column order used for all exports
+COLUMNS = [
+    'timestamp', 'latitude', 'longitude', 'altitude',
+    'speed', 'course', 'satellites', 'quality'
+]
+
+# Explicit column types for reading and binary (Parquet) export.
+# Coordinates stay float64, float32 would cost ~1 m of precision.
+COLUMN_DTYPES = {
+    'latitude': 'float64',
+    'longitude': 'float64',
+    'altitude': 'float32',
+    'speed': 'float32',
+    'course': 'float32',
+    'satellites': 'Int16',
+    'quality': 'Int8',
+}
+
+# Columns parsed to datetime while reading
+DATE_COLUMNS = ['timestamp']
+
+# Timestamp format used in CSV files
+CSV_DATE_FORMAT = '%Y-%m-%d %H:%M:%S.%f'
+
+# Appends smaller than this are streamed with csv.DictWriter
+SMALL_APPEND_ROWS = 64
+
+# Subdirectory of output_dir holding Parquet copies of parsed CSVs
+CACHE_DIR = '.cache'
+
 
 class CSVStorageError(Exception):
     """Raised when CSV operations fail."""
@@ -33,16 +74,37 @@ class GPSDataCSVStorage:
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        logger.info(f"CSV storage initialized: {self.output_dir}")
+        # Open append handles for small incremental writes, keyed by path
+        self._writers: Dict[Path, Tuple[IO[str], csv.DictWriter]] = {}
+        logger.info("CSV storage initialized: %s", self.output_dir)
+
+    def output_filename(self, filename: str) -> str:
+        """
+        Name save_positions() actually writes for a requested filename.
+
+        Args:
+            filename: Requested CSV or Parquet filename
 
-    def save_positions(self, positions: List[Dict[str, Any]],
+        Returns:
+            Filename with .parquet swapped to .csv if pyarrow is missing
+        """
+        path = Path(filename)
+        if path.suffix == '.parquet' and not PARQUET_AVAILABLE:
+            return str(path.with_suffix('.csv'))
+        return filename
+
+    def save_positions(self, positions: Union[List[Dict[str, Any]], Dict[str, Sequence]],
                       filename: str = "gps_positions.csv",
                       append: bool = False) -> str:
         """
         Save GPS positions to CSV file.
 
+        Files with a .parquet extension are written as Parquet instead
+        (falls back to CSV if pyarrow is not installed).
+
         Args:
-            positions: List of position dictionaries
+            positions: List of position dictionaries, or a mapping of
+                column name to column values
             filename: Output filename
             append: If True, append to existing file
 
@@ -58,35 +120,126 @@ class GPSDataCSVStorage:
                 return ""
 
             filepath = self.output_dir / filename
-            mode = 'a' if (append and filepath.exists()) else 'w'
-            write_header = not (append and filepath.exists())
 
+            # Per-fix appends skip the DataFrame round-trip
+            if (append and filepath.suffix == '.csv' and isinstance(positions, list)
+                    and len(positions) < SMALL_APPEND_ROWS):
+                return self._append_rows(filepath, positions)
+
+            self._close_writer(filepath)
             df = pd.DataFrame(positions)
 
             # Ensure correct column order
-            columns = [
-                'timestamp', 'latitude', 'longitude', 'altitude',
-                'speed', 'course', 'satellites', 'quality'
-            ]
-            df = df[[col for col in columns if col in df.columns]]
+            df = df[[col for col in COLUMNS if col in df.columns]]
+
+            if filepath.suffix == '.parquet':
+                if PARQUET_AVAILABLE:
+                    return self._save_parquet(df, filepath, append)
+                logger.warning("pyarrow not installed, saving as CSV instead")
+                filepath = self.output_dir / self.output_filename(filename)
+
+            mode = 'a' if (append and filepath.exists()) else 'w'
+            write_header = not (append and filepath.exists())
 
             # Save to CSV
             df.to_csv(filepath, mode=mode, header=write_header,
-                     index=False, date_format='%Y-%m-%d %H:%M:%S.%f')
+                     index=False, date_format=CSV_DATE_FORMAT)
 
-            logger.info(f"Saved {len(positions)} positions to {filepath}")
+            logger.info("Saved %d positions to %s", len(df), filepath)
             return str(filepath)
 
         except Exception as e:
-            logger.error(f"Error saving CSV: {e}", exc_info=True)
+            logger.error("Error saving CSV: %s", e, exc_info=True)
             raise CSVStorageError(f"Failed to save CSV: {e}")
 
-    def load_positions(self, filename: str) -> List[Dict[str, Any]]:
+    def _append_rows(self, filepath: Path, positions: List[Dict[str, Any]]) -> str:
+        """
+        Append a few positions through a cached csv.DictWriter.
+
+        The file handle stays open between calls and is flushed after
+        each append, so readers always see complete rows.
+
+        Args:
+            filepath: CSV file path
+            positions: List of position dictionaries
+
+        Returns:
+            Path to updated file
+        """
+        entry = self._writers.get(filepath)
+        if entry is None:
+            # Match the existing header, new files get all columns
+            fieldnames = COLUMNS
+            if filepath.exists() and filepath.stat().st_size > 0:
+                with open(filepath, newline='', encoding='utf-8') as f:
+                    fieldnames = next(csv.reader(f), COLUMNS)
+
+            handle = open(filepath, 'a', newline='', encoding='utf-8',
+                          buffering=1 << 16)
+            writer = csv.DictWriter(handle, fieldnames=fieldnames,
+                                    extrasaction='ignore')
+            if handle.tell() == 0:
+                writer.writeheader()
+            entry = self._writers[filepath] = (handle, writer)
+
+        handle, writer = entry
+        for position in positions:
+            timestamp = position.get('timestamp')
+            if isinstance(timestamp, datetime):
+                position = {**position,
+                            'timestamp': timestamp.strftime(CSV_DATE_FORMAT)}
+            writer.writerow(position)
+        handle.flush()
+
+        logger.debug("Appended %d positions to %s", len(positions), filepath)
+        return str(filepath)
+
+    def _close_writer(self, filepath: Path) -> None:
+        """Close the cached append handle for a file, if any."""
+        entry = self._writers.pop(filepath, None)
+        if entry is not None:
+            entry[0].close()
+
+    def close(self) -> None:
+        """Close all cached append handles."""
+        for filepath in list(self._writers):
+            self._close_writer(filepath)
+
+    def _save_parquet(self, df: pd.DataFrame, filepath: Path, append: bool) -> str:
+        """
+        Save positions DataFrame as zstd-compressed Parquet.
+
+        Args:
+            df: Positions DataFrame
+            filepath: Output path
+            append: If True, append to existing file
+
+        Returns:
+            Path to saved file
+        """
+        if 'timestamp' in df:
+            df['timestamp'] = pd.to_datetime(df['timestamp'])
+        for col, dtype in COLUMN_DTYPES.items():
+            if col in df:
+                df[col] = pd.to_numeric(df[col], errors='coerce').astype(dtype)
+
+        # Parquet files can't be appended in place, rewrite with old rows
+        if append and filepath.exists():
+            df = pd.concat([pd.read_parquet(filepath), df], ignore_index=True)
+
+        df.to_parquet(filepath, engine='pyarrow', compression='zstd', index=False)
+
+        logger.info("Saved %d positions to %s", len(df), filepath)
+        return str(filepath)
+
+    def load_positions(self, filename: str, typed: bool = False) -> List[Dict[str, Any]]:
         """
         Load GPS positions from CSV file.
 
         Args:
             filename: CSV filename to load
+            typed: If True, convert CSV columns to numbers and timestamps
+                via pandas; otherwise values are the raw CSV strings
 
         Returns:
             List of position dictionaries
@@ -95,26 +248,33 @@ class GPSDataCSVStorage:
             filepath = self.output_dir / filename
 
             if not filepath.exists():
-                logger.warning(f"File not found: {filepath}")
+                logger.warning("File not found: %s", filepath)
                 return []
 
-            df = pd.read_csv(filepath)
-            positions = df.to_dict('records')
-
-            logger.info(f"Loaded {len(positions)} positions from {filepath}")
+            if filepath.suffix == '.parquet':
+                positions = pd.read_parquet(filepath).to_dict('records')
+            elif typed:
+                positions = self._read_csv(filepath).to_dict('records')
+            else:
+                # Plain dict rows straight from the C csv reader
+                with open(filepath, newline='', encoding='utf-8',
+                          buffering=1 << 16) as f:
+                    positions = list(csv.DictReader(f))
+
+            logger.info("Loaded %d positions from %s", len(positions), filepath)
             return positions
 
         except Exception as e:
-            logger.error(f"Error loading CSV: {e}", exc_info=True)
+            logger.error("Error loading CSV: %s", e, exc_info=True)
             return []
 
-    def append_positions(self, positions: List[Dict[str, Any]],
+    def append_positions(self, positions: Union[List[Dict[str, Any]], Dict[str, Sequence]],
                         filename: str = "gps_positions.csv") -> str:
         """
         Append positions to existing CSV file.
 
         Args:
-            positions: List of position dictionaries
+            positions: List of position dictionaries or column mapping
             filename: CSV filename
 
         Returns:
@@ -122,7 +282,58 @@ class GPSDataCSVStorage:
         """
         return self.save_positions(positions, filename, append=True)
 
+    @staticmethod
+    def _read_csv(filepath: Path) -> pd.DataFrame:
+        """
+        Read positions CSV with fixed column types.
+
+        Supplying dtypes skips per-column type inference, timestamps are
+        parsed by the C engine while reading.
+
+        Args:
+            filepath: CSV file path
+
+        Returns:
+            Positions DataFrame
+        """
+        with open(filepath, newline='', encoding='utf-8') as f:
+            header = next(csv.reader(f), [])
+
+        return pd.read_csv(filepath, dtype=COLUMN_DTYPES, engine='c',
+                           parse_dates=[c for c in DATE_COLUMNS if c in header])
+
+    def _read_cached(self, filename: str) -> pd.DataFrame:
+        """
+        Read positions file, using a Parquet copy of CSVs when current.
+
+        The first read of a CSV stores the parsed frame under
+        output_dir/.cache, later reads use it until the CSV changes.
+
+        Args:
+            filename: CSV or Parquet filename
 
+        Returns:
+            Positions DataFrame
+        """
+        filepath = self.output_dir / filename
+        if filepath.suffix == '.parquet':
+            return pd.read_parquet(filepath)
+        if not PARQUET_AVAILABLE:
+            return self._read_csv(filepath)
+
+        cache_path = self.output_dir / CACHE_DIR / (filepath.name + '.parquet')
+        csv_mtime = filepath.stat().st_mtime_ns
+        if cache_path.exists() and cache_path.stat().st_mtime_ns > csv_mtime:
+            return pd.read_parquet(cache_path)
+
+        df = self._read_csv(filepath)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(cache_path, engine='pyarrow', compression='snappy',
+                          index=False)
+        except (OSError, ValueError) as e:
+            logger.warning("Could not write Parquet cache %s: %s", cache_path, e)
+        return df
 
     def get_statistics(self, filename: str) -> Dict[str, Any]:
         """
@@ -135,23 +346,35 @@ class GPSDataCSVStorage:
             Dictionary with statistics
         """
         try:
-            df = pd.read_csv(self.output_dir / filename)
+            df = self._read_cached(filename)
+
+            # Aggregate all coordinate columns over one float64 block
+            cols = [c for c in ('latitude', 'longitude', 'altitude') if c in df]
+            arr = df[cols].to_numpy(dtype=np.float64, na_value=np.nan)
+            if len(arr):
+                with warnings.catch_warnings():
+                    # All-NaN columns give NaN, like the pandas reductions
+                    warnings.simplefilter('ignore', RuntimeWarning)
+                    col_min = dict(zip(cols, np.nanmin(arr, axis=0).tolist()))
+                    col_mean = dict(zip(cols, np.nanmean(arr, axis=0).tolist()))
+                    col_max = dict(zip(cols, np.nanmax(arr, axis=0).tolist()))
+            else:
+                col_min = col_mean = col_max = dict.fromkeys(cols, float('nan'))
 
             stats = {
                 'record_count': len(df),
                 'time_span': None,
-                'avg_latitude': float(df['latitude'].mean()) if 'latitude' in df else None,
-                'avg_longitude': float(df['longitude'].mean()) if 'longitude' in df else None,
-                'avg_altitude': float(df['altitude'].mean()) if 'altitude' in df else None,
-                'min_latitude': float(df['latitude'].min()) if 'latitude' in df else None,
-                'max_latitude': float(df['latitude'].max()) if 'latitude' in df else None,
-                'min_longitude': float(df['longitude'].min()) if 'longitude' in df else None,
-                'max_longitude': float(df['longitude'].max()) if 'longitude' in df else None,
+                'avg_latitude': col_mean.get('latitude'),
+                'avg_longitude': col_mean.get('longitude'),
+                'avg_altitude': col_mean.get('altitude'),
+                'min_latitude': col_min.get('latitude'),
+                'max_latitude': col_max.get('latitude'),
+                'min_longitude': col_min.get('longitude'),
+                'max_longitude': col_max.get('longitude'),
             }
 
             if 'timestamp' in df:
                 try:
-                    df['timestamp'] = pd.to_datetime(df['timestamp'])
                     stats['time_span'] = (df['timestamp'].max() -
                                         df['timestamp'].min()).total_seconds()
                 except:
@@ -160,7 +383,7 @@ class GPSDataCSVStorage:
             return stats
 
         except Exception as e:
-            logger.error(f"Error calculating statistics: {e}")
+            logger.error("Error calculating statistics: %s", e)
             return {}
 
     def filter_by_date_range(self, filename: str,
@@ -178,8 +401,7 @@ class GPSDataCSVStorage:
             Filtered list of positions
         """
         try:
-            df = pd.read_csv(self.output_dir / filename)
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
+            df = self._read_cached(filename)
 
             mask = (df['timestamp'] >= start_date) & (df['timestamp'] <= end_date)
             filtered_df = df[mask]
@@ -187,7 +409,7 @@ class GPSDataCSVStorage:
             return filtered_df.to_dict('records')
 
         except Exception as e:
-            logger.error(f"Error filtering by date: {e}")
+            logger.error("Error filtering by date: %s", e)
             return []
 
     def delete_old_records(self, filename: str,
@@ -196,37 +418,101 @@ class GPSDataCSVStorage:
         Delete records older than specified days.
 
         Args:
-            filename: CSV filename
+            filename: CSV or Parquet filename
             days: Age threshold in days
 
         Returns:
             Number of deleted records
         """
         try:
-            df = pd.read_csv(self.output_dir / filename)
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
+            filepath = self.output_dir / filename
+            df = self._read_cached(filename)
 
             cutoff = datetime.now() - pd.Timedelta(days=days)
             original_count = len(df)
 
-            df = df[df['timestamp'] >= cutoff]
-
-            df.to_csv(self.output_dir / filename, index=False)
-
-            deleted = original_count - len(df)
-            logger.info(f"Deleted {deleted} records older than {days} days")
+            self._close_writer(filepath)
+            timestamps = df['timestamp']
+            if filepath.suffix == '.csv' and timestamps.is_monotonic_increasing:
+                # Append-only logs are time ordered: old rows form the head
+                deleted = int(timestamps.searchsorted(cutoff, side='left'))
+                if deleted:
+                    self._drop_head_rows(filepath, deleted)
+            else:
+                df = df[timestamps >= cutoff]
+                deleted = original_count - len(df)
+                if filepath.suffix == '.parquet':
+                    self._save_parquet(df, filepath, append=False)
+                else:
+                    df.to_csv(filepath, index=False, date_format=CSV_DATE_FORMAT)
+
+            logger.info("Deleted %d records older than %s days", deleted, days)
 
             return deleted
 
         except Exception as e:
-            logger.error(f"Error deleting old records: {e}")
+            logger.error("Error deleting old records: %s", e)
             return 0
 
+    def _drop_head_rows(self, filepath: Path, rows: int) -> None:
+        """
+        Remove the first data rows of a CSV without parsing it.
+
+        Keeps the header and copies the remaining bytes to a new file,
+        which then replaces the original. The tail is copied in the
+        kernel with os.sendfile() where supported.
+
+        Args:
+            filepath: CSV file path
+            rows: Number of data rows to drop
+        """
+        fd, tmp_name = tempfile.mkstemp(dir=filepath.parent, suffix='.tmp')
+        try:
+            with open(filepath, 'rb') as src, os.fdopen(fd, 'wb') as dst:
+                dst.write(src.readline())
+                for _ in range(rows):
+                    src.readline()
+                dst.flush()
+                self._copy_tail(src, dst, src.tell())
+            shutil.copymode(filepath, tmp_name)
+            os.replace(tmp_name, filepath)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+    @staticmethod
+    def _copy_tail(src: IO[bytes], dst: IO[bytes], offset: int) -> None:
+        """
+        Append src from offset to its end onto dst.
+
+        Args:
+            src: Source file opened for binary reading
+            dst: Destination file opened for binary writing (flushed)
+            offset: Start offset in src
+        """
+        remaining = os.fstat(src.fileno()).st_size - offset
+        if hasattr(os, 'sendfile'):
+            try:
+                while remaining > 0:
+                    sent = os.sendfile(dst.fileno(), src.fileno(), offset, remaining)
+                    if sent == 0:
+                        break
+                    offset += sent
+                    remaining -= sent
+                return
+            except OSError:
+                # Not supported for these files, copy the rest in user space
+                pass
+
+        src.seek(offset)
+        shutil.copyfileobj(src, dst, 1 << 16)
+
     def list_files(self) -> List[str]:
         """
-        List all CSV files in storage directory.
+        List all CSV and Parquet files in storage directory.
 
         Returns:
-            List of CSV filenames
+            List of filenames
         """
-        return [f.name for f in self.output_dir.glob("*.csv")]
+        return [f.name for f in self.output_dir.iterdir()
+                if f.suffix in ('.csv', '.parquet')]
@@ -3,13 +3,23 @@ Improved GPS MAT file player.
 Reads and plays back GPS data from MATLAB files with proper error handling.
 """
 
+import asyncio
 import threading
 import time
 import logging
 from typing import Optional, Callable
+import numpy as np
 import scipy.io
 import os
 
+try:
+    import h5py
+    H5PY_AVAILABLE = True
+except ImportError:
+    H5PY_AVAILABLE = False
+
+from gps_kernels import prepare_track
+
 try:
     import PySignal
 except ImportError:
@@ -17,17 +27,30 @@ except ImportError:
     class ClassSignal:
         def __init__(self):
             self.callbacks = []
+            # Immutable snapshot iterated by emit()
+            self._snapshot = ()
 
         def connect(self, callback):
             if callback not in self.callbacks:
                 self.callbacks.append(callback)
+                self._snapshot = tuple(self.callbacks)
+
+        def disconnect(self, callback):
+            if callback in self.callbacks:
+                self.callbacks.remove(callback)
+                self._snapshot = tuple(self.callbacks)
 
         def emit(self, *args, **kwargs):
-            for callback in self.callbacks:
+            callbacks = self._snapshot
+            done = 0
+            # One try around the loop, on error resume after the failing callback
+            while done < len(callbacks):
                 try:
-                    callback(*args, **kwargs)
+                    for callback in callbacks[done:]:
+                        done += 1
+                        callback(*args, **kwargs)
                 except Exception as e:
-                    logging.error(f"Error in signal callback: {e}")
+                    logging.error("Error in signal callback: %s", e)
 
 
     class PySignal:
@@ -35,24 +58,44 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Only these variables are read from the MAT file
+MAT_VARIABLES = ('Easting', 'Northing')
+
 
 class GPSDataError(Exception):
     """Raised when GPS data loading or processing fails."""
     pass
 
 
+def _has_receivers(signal) -> bool:
+    """Check whether anything is connected to a signal."""
+    # Fallback ClassSignal keeps 'callbacks', PySignal keeps '_slots'
+    slots = getattr(signal, 'callbacks', None)
+    if slots is None:
+        slots = getattr(signal, '_slots', None)
+    return True if slots is None else bool(slots)
+
+
 class PlayGPSMat:
     """
     Plays back GPS position data from MATLAB .mat files.
 
     Reads Easting/Northing coordinates and emits them at specified intervals.
-    Thread-safe with proper error handling.
+    Playback is an asyncio coroutine scheduled on absolute deadlines: inside
+    a running event loop it becomes a task (many players share one loop),
+    otherwise it runs on its own loop in a background thread.
     """
 
     new_gps_pos = PySignal.ClassSignal()
+    # Emits (easting_array, northing_array) slices of already played positions
+    new_gps_batch = PySignal.ClassSignal()
+
+    # Positions per new_gps_batch emission
+    BATCH_SIZE = 32
 
     def __init__(self, filename: str, start_timeout: float = 5.0,
-                 time_between_gps_pos: float = 1.0):
+                 time_between_gps_pos: float = 1.0,
+                 resample_to: Optional[int] = None):
         """
         Initialize GPS MAT player.
 
@@ -60,6 +103,8 @@ class PlayGPSMat:
             filename: Path to .mat file containing GPS data
             start_timeout: Delay before starting playback (seconds)
             time_between_gps_pos: Time between position emissions (seconds)
+            resample_to: If set, play a track linearly interpolated to this
+                many evenly spaced positions instead of the raw samples
 
         Raises:
             FileNotFoundError: If MAT file doesn't exist
@@ -74,29 +119,78 @@ class PlayGPSMat:
 
         # Load and validate GPS data
         try:
-            self.gps_data = scipy.io.loadmat(filename)
+            self.gps_data = self._load_mat(filename)
             self._validate_gps_data()
-            logger.info(f"Loaded GPS data from: {filename}")
+            # Flattened per-axis coordinate arrays (SoA), prepared once
+            self._east, self._north = prepare_track(self.gps_data['Easting'],
+                                                    self.gps_data['Northing'])
+            logger.info("Loaded GPS data from: %s", filename)
         except Exception as e:
             raise GPSDataError(f"Failed to load GPS data: {e}")
 
+        # Track emitted during playback, the raw arrays stay available
+        # for get_position_at()
+        if resample_to:
+            self._play_east, self._play_north = self._resample(resample_to)
+        else:
+            self._play_east, self._play_north = self._east, self._north
+
         # Playback control
         self._playing = False
         self._paused = False
         self._current_index = 0
         self._playback_thread: Optional[threading.Thread] = None
+        self._task: Optional[asyncio.Task] = None
+        self._start_delay = start_timeout
 
         # Statistics
         self.positions_sent = 0
 
-        # Start playback timer
         if start_timeout > 0:
-            timer = threading.Timer(start_timeout, self.start)
-            timer.daemon = True
-            timer.start()
-            logger.info(f"Playback will start in {start_timeout} seconds")
-        else:
-            self.start()
+            logger.info("Playback will start in %s seconds", start_timeout)
+        self.start()
+
+    @staticmethod
+    def _load_mat(filename: str) -> dict:
+        """
+        Read the coordinate variables from a MAT file.
+
+        MAT v5 files are read with scipy, skipping all other variables.
+        MAT v7.3 files are HDF5 and need h5py.
+
+        Args:
+            filename: Path to .mat file
+
+        Returns:
+            Dictionary of variable name to array
+
+        Raises:
+            GPSDataError: If the file is v7.3 and h5py is not installed
+        """
+        try:
+            return scipy.io.loadmat(filename, variable_names=MAT_VARIABLES)
+        except NotImplementedError:
+            # scipy refuses v7.3 files
+            if not H5PY_AVAILABLE:
+                raise GPSDataError("MAT v7.3 file requires h5py")
+
+        with h5py.File(filename, 'r') as f:
+            # Only the two datasets are read, element order is kept by ravel()
+            return {name: f[name][()] for name in MAT_VARIABLES if name in f}
+
+    def _resample(self, count: int) -> tuple:
+        """
+        Interpolate the track to evenly spaced positions, once.
+
+        Args:
+            count: Number of output positions (first and last sample kept)
+
+        Returns:
+            Tuple of (easting, northing) arrays
+        """
+        src = np.arange(self._east.size, dtype=np.float64)
+        dst = np.linspace(0.0, self._east.size - 1, count)
+        return np.interp(dst, src, self._east), np.interp(dst, src, self._north)
 
     def _validate_gps_data(self) -> None:
         """
@@ -126,7 +220,7 @@ class PlayGPSMat:
         if easting.size == 0:
             raise GPSDataError("GPS data arrays are empty")
 
-        logger.info(f"GPS data validated: {easting.size} positions")
+        logger.info("GPS data validated: %d positions", easting.size)
 
     def start(self) -> None:
         """Start GPS data playback."""
@@ -137,12 +231,20 @@ class PlayGPSMat:
         self._playing = True
         self._paused = False
 
-        # Start playback thread
-        self._playback_thread = threading.Thread(
-            target=self._playback_loop,
-            daemon=True
-        )
-        self._playback_thread.start()
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop is not None:
+            self._task = loop.create_task(self.run())
+        else:
+            # No event loop here, run one in a playback thread
+            self._playback_thread = threading.Thread(
+                target=self._playback_loop,
+                daemon=True
+            )
+            self._playback_thread.start()
 
         logger.info("GPS playback started")
 
@@ -151,7 +253,13 @@ class PlayGPSMat:
         self._playing = False
         self._paused = False
 
-        if self._playback_thread:
+        if self._task is not None:
+            loop = self._task.get_loop()
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(self._task.cancel)
+            self._task = None
+
+        if self._playback_thread and self._playback_thread is not threading.current_thread():
             self._playback_thread.join(timeout=2.0)
 
         logger.info("GPS playback stopped")
@@ -173,55 +281,84 @@ class PlayGPSMat:
         logger.info("GPS playback reset")
 
     def _playback_loop(self) -> None:
-        """Main playback loop (runs in separate thread)."""
-        try:
-            easting = self.gps_data['Easting']
-            northing = self.gps_data['Northing']
+        """Run playback on a private event loop (playback thread)."""
+        asyncio.run(self.run())
 
-            # Flatten arrays if needed
-            if easting.ndim > 1:
-                easting = easting.flatten()
-            if northing.ndim > 1:
-                northing = northing.flatten()
+    async def run(self) -> None:
+        """
+        Playback coroutine.
+
+        Positions are due at fixed deadlines on the loop clock, so time
+        spent in callbacks does not accumulate as drift.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            if self._start_delay > 0:
+                delay, self._start_delay = self._start_delay, 0
+                await asyncio.sleep(delay)
 
-            total_positions = len(easting)
+            east_arr = self._play_east
+            north_arr = self._play_north
+            total_positions = east_arr.size
+            deadline = loop.time()
+            batch_start = played_end = self._current_index
 
             for i in range(self._current_index, total_positions):
                 # Check if stopped
                 if not self._playing:
                     break
 
-                # Handle pause
-                while self._paused and self._playing:
-                    time.sleep(0.1)
+                # Handle pause, restart the schedule afterwards
+                if self._paused:
+                    while self._paused and self._playing:
+                        await asyncio.sleep(0.1)
+                    deadline = loop.time()
 
                 if not self._playing:
                     break
 
                 # Get current position
                 try:
-                    east = float(easting[i])
-                    north = float(northing[i])
+                    east = east_arr[i].item()
+                    north = north_arr[i].item()
 
-                    # Emit position
-                    self.new_gps_pos.emit(east, north)
+                    # Emit position; receivers are checked per emit so
+                    # listeners connected during playback are served
+                    if _has_receivers(self.new_gps_pos):
+                        self.new_gps_pos.emit(east, north)
                     self.positions_sent += 1
                     self._current_index = i
+                    played_end = i + 1
+
+                    if played_end - batch_start >= self.BATCH_SIZE:
+                        if _has_receivers(self.new_gps_batch):
+                            self.new_gps_batch.emit(east_arr[batch_start:played_end],
+                                                    north_arr[batch_start:played_end])
+                        batch_start = played_end
 
-                    logger.debug(f"Position {i + 1}/{total_positions}: "
-                                 f"E={east:.2f}, N={north:.2f}")
+                    logger.debug("Position %d/%d: E=%.2f, N=%.2f",
+                                 i + 1, total_positions, east, north)
 
                 except Exception as e:
-                    logger.error(f"Error emitting position {i}: {e}")
+                    logger.error("Error emitting position %s: %s", i, e)
+
+                # Wait until the next position is due
+                deadline += self.timeout
+                await asyncio.sleep(max(0.0, deadline - loop.time()))
 
-                # Wait before next position
-                time.sleep(self.timeout)
+            # Flush the partial batch
+            if played_end > batch_start and _has_receivers(self.new_gps_batch):
+                self.new_gps_batch.emit(east_arr[batch_start:played_end],
+                                        north_arr[batch_start:played_end])
 
-            logger.info(f"GPS playback completed: {self.positions_sent} positions sent")
+            logger.info("GPS playback completed: %d positions sent", self.positions_sent)
             self._playing = False
 
+        except asyncio.CancelledError:
+            self._playing = False
+            raise
         except Exception as e:
-            logger.error(f"Error in playback loop: {e}", exc_info=True)
+            logger.error("Error in playback loop: %s", e, exc_info=True)
             self._playing = False
 
     def get_statistics(self) -> dict:
@@ -231,11 +368,7 @@ class PlayGPSMat:
         Returns:
             Dictionary with playback statistics
         """
-        easting = self.gps_data.get('Easting', [])
-        if hasattr(easting, 'size'):
-            total = easting.size
-        else:
-            total = len(easting)
+        total = self._play_east.size
 
         return {
             'filename': self.filename,
@@ -260,18 +393,10 @@ class PlayGPSMat:
         Raises:
             IndexError: If index is out of range
         """
-        easting = self.gps_data['Easting']
-        northing = self.gps_data['Northing']
-
-        if easting.ndim > 1:
-            easting = easting.flatten()
-        if northing.ndim > 1:
-            northing = northing.flatten()
-
-        if not (0 <= index < len(easting)):
-            raise IndexError(f"Position index {index} out of range [0, {len(easting)})")
+        if not (0 <= index < self._east.size):
+            raise IndexError(f"Position index {index} out of range [0, {self._east.size})")
 
-        return (float(easting[index]), float(northing[index]))
+        return (self._east[index].item(), self._north[index].item())
 
     def __del__(self):
         """Cleanup on deletion."""
@@ -296,7 +421,7 @@ def main():
     filename = os.path.join(os.getcwd(), "data/AguasVivasGPSData.mat")
 
     if not os.path.exists(filename):
-        logger.error(f"Test file not found: {filename}")
+        logger.error("Test file not found: %s", filename)
         return 1
 
     try:
@@ -325,7 +450,7 @@ def main():
         return 0
 
     except Exception as e:
-        logger.error(f"Error: {e}", exc_info=True)
+        logger.error("Error: %s", e, exc_info=True)
         return 1
 
 
@@ -4,16 +4,26 @@ Part of MVC architecture for GPS Position System.
 """
 
 import logging
+from math import cos, inf, radians, sqrt
 from collections import deque
-from typing import List, Callable, Optional, Dict, Any
+from typing import List, Callable, Optional, Dict, Any, Sequence, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 import threading
 
+import numpy as np
+
+from coordinates import haversine_km_array
+from gps_kernels import (EARTH_RADIUS_KM, NUMBA_AVAILABLE, haversine_km,
+                         haversine_track_km)
+
 logger = logging.getLogger(__name__)
 
+# Meters per degree of arc on the sphere used by haversine_km
+METERS_PER_DEGREE = radians(1.0) * EARTH_RADIUS_KM * 1000.0
 
-@dataclass
+
+@dataclass(slots=True)
 class GPSPosition:
     """
     Represents a single GPS position reading.
@@ -37,6 +47,33 @@ class GPSPosition:
     satellites: Optional[int] = None
     quality: Optional[int] = None
 
+    @classmethod
+    def from_position_info(cls, info: Any) -> 'GPSPosition':
+        """
+        Create position from extracted NMEA position info.
+
+        NMEA sentences only carry the time of day, so the reception time
+        is used unless the info holds a full datetime.
+
+        Args:
+            info: PositionInfo from NMEAValidator
+
+        Returns:
+            GPSPosition instance
+        """
+        timestamp = info.timestamp
+        if not isinstance(timestamp, datetime):
+            timestamp = datetime.now()
+
+        return cls(
+            latitude=info.latitude,
+            longitude=info.longitude,
+            altitude=info.altitude or 0.0,
+            timestamp=timestamp,
+            satellites=info.num_satellites,
+            quality=info.gps_quality
+        )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert position to dictionary."""
         return {
@@ -60,23 +97,33 @@ class GPSPosition:
         Returns:
             Distance in meters
         """
-        import math
+        return haversine_km(self.latitude, self.longitude,
+                            other.latitude, other.longitude) * 1000.0
 
-        R = 6371000  # Earth radius in meters
+    def distance_to_fast(self, other: 'GPSPosition') -> float:
+        """
+        Calculate distance to a nearby position using an equirectangular
+        approximation.
 
-        lat1 = math.radians(self.latitude)
-        lon1 = math.radians(self.longitude)
-        lat2 = math.radians(other.latitude)
-        lon2 = math.radians(other.longitude)
+        Needs one cosine instead of the full Haversine; the error stays
+        negligible for consecutive fixes a few hundred meters apart.
 
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
+        Args:
+            other: Target position
 
-        a = (math.sin(dlat / 2) ** 2 +
-             math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2)
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+        Returns:
+            Distance in meters
+        """
+        dlon = other.longitude - self.longitude
+        if dlon > 180.0:
+            dlon -= 360.0
+        elif dlon < -180.0:
+            dlon += 360.0
 
-        return R * c
+        dlat = (other.latitude - self.latitude) * METERS_PER_DEGREE
+        dlon = (dlon * METERS_PER_DEGREE *
+                cos(radians((self.latitude + other.latitude) * 0.5)))
+        return sqrt(dlat * dlat + dlon * dlon)
 
 
 class GPSDataModel:
@@ -96,15 +143,35 @@ class GPSDataModel:
         """
         self.max_positions = max_positions
         self._positions = deque(maxlen=max_positions)
-        self._observers: List[Callable[[GPSPosition], None]] = []
+        # Replaced as a whole on (un)register so notification can iterate
+        # it without copying or locking
+        self._observers: Tuple[Callable[[GPSPosition], None], ...] = ()
         self._lock = threading.RLock()
+        # Bumped on every mutation; get_positions() reuses its snapshot
+        # while the version is unchanged.
+        self._version = 0
+        self._snapshot: Tuple[int, Tuple[GPSPosition, ...]] = (0, ())
+        # Column copies of the numeric fields in ring buffers, so the bulk
+        # getters slice arrays instead of walking position objects.
+        # Missing speeds are stored as NaN.
+        self._lat = np.empty(max_positions, dtype=np.float64)
+        self._lon = np.empty(max_positions, dtype=np.float64)
+        self._alt = np.empty(max_positions, dtype=np.float64)
+        self._speed = np.empty(max_positions, dtype=np.float64)
+        self._head = 0
+        self._count = 0
+        # Published under the lock, read without it by the cheap getters
+        self._latest: Optional[GPSPosition] = None
+        # Running sum over the stored known speeds for average_speed
+        self._speed_sum = 0.0
+        self._speed_count = 0
         self._stats = {
             'total_received': 0,
             'total_distance': 0.0,
             'average_speed': 0.0
         }
 
-        logger.info(f"GPS Data Model initialized (max positions: {max_positions})")
+        logger.info("GPS Data Model initialized (max positions: %d)", max_positions)
 
     def add_position(self, position: GPSPosition) -> None:
         """
@@ -115,9 +182,9 @@ class GPSDataModel:
         """
         with self._lock:
             # Calculate distance if we have a previous position
-            if len(self._positions) > 0:
-                prev_pos = self._positions[-1]
-                distance = prev_pos.distance_to(position)
+            prev_pos = self._latest
+            if prev_pos is not None:
+                distance = prev_pos.distance_to_fast(position)
                 self._stats['total_distance'] += distance
 
                 # Calculate speed if not provided
@@ -127,34 +194,63 @@ class GPSDataModel:
                         position.speed = distance / time_diff
 
             self._positions.append(position)
+            i = self._head
+            if self._count == self.max_positions:
+                # Slot i holds the position the deque just dropped
+                dropped = float(self._speed[i])
+                if dropped == dropped:  # not NaN
+                    self._speed_sum -= dropped
+                    self._speed_count -= 1
+            self._lat[i] = position.latitude
+            self._lon[i] = position.longitude
+            self._alt[i] = position.altitude
+            if position.speed is None:
+                self._speed[i] = np.nan
+            else:
+                self._speed[i] = position.speed
+                self._speed_sum += position.speed
+                self._speed_count += 1
+            self._head = (i + 1) % self.max_positions
+            self._count = min(self._count + 1, self.max_positions)
+            self._latest = position
+            self._version += 1
             self._stats['total_received'] += 1
 
-            # Update average speed
-            if position.speed is not None:
-                speeds = [p.speed for p in self._positions if p.speed is not None]
-                if speeds:
-                    self._stats['average_speed'] = sum(speeds) / len(speeds)
+            if self._speed_count:
+                self._stats['average_speed'] = self._speed_sum / self._speed_count
+            else:
+                self._stats['average_speed'] = 0.0
 
-            logger.debug(f"Added position: {position.latitude:.6f}, {position.longitude:.6f}")
+            logger.debug("Added position: %.6f, %.6f", position.latitude, position.longitude)
 
         # Notify observers outside lock to prevent deadlock
         self._notify_observers(position)
 
-    def get_positions(self, count: Optional[int] = None) -> List[GPSPosition]:
+    def get_positions(self, count: Optional[int] = None) -> Sequence[GPSPosition]:
         """
         Get stored positions.
 
+        The returned tuple is an immutable snapshot that is shared between
+        callers until the model changes. A current snapshot is returned
+        without taking the lock.
+
         Args:
             count: Number of recent positions to return (None for all)
 
         Returns:
-            List of GPS positions
+            Tuple of GPS positions
         """
-        with self._lock:
-            if count is None:
-                return list(self._positions)
-            else:
-                return list(self._positions)[-count:]
+        version, positions = self._snapshot
+        if version != self._version:
+            with self._lock:
+                version, positions = self._snapshot
+                if version != self._version:
+                    positions = tuple(self._positions)
+                    self._snapshot = (self._version, positions)
+
+        if count is None:
+            return positions
+        return positions[-count:]
 
     def get_latest_position(self) -> Optional[GPSPosition]:
         """
@@ -163,13 +259,11 @@ class GPSDataModel:
         Returns:
             Latest GPS position or None if no positions
         """
-        with self._lock:
-            return self._positions[-1] if self._positions else None
+        return self._latest
 
     def get_position_count(self) -> int:
         """Get number of stored positions."""
-        with self._lock:
-            return len(self._positions)
+        return self._count
 
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -197,6 +291,12 @@ class GPSDataModel:
         """Clear all stored positions."""
         with self._lock:
             self._positions.clear()
+            self._head = 0
+            self._count = 0
+            self._latest = None
+            self._speed_sum = 0.0
+            self._speed_count = 0
+            self._version += 1
             self._stats['total_distance'] = 0.0
             self._stats['average_speed'] = 0.0
             logger.info("GPS data cleared")
@@ -210,8 +310,8 @@ class GPSDataModel:
         """
         with self._lock:
             if callback not in self._observers:
-                self._observers.append(callback)
-                logger.debug(f"Observer registered: {callback.__name__}")
+                self._observers = self._observers + (callback,)
+                logger.debug("Observer registered: %s", callback.__name__)
 
     def unregister_observer(self, callback: Callable[[GPSPosition], None]) -> None:
         """
@@ -222,8 +322,8 @@ class GPSDataModel:
         """
         with self._lock:
             if callback in self._observers:
-                self._observers.remove(callback)
-                logger.debug(f"Observer unregistered: {callback.__name__}")
+                self._observers = tuple(o for o in self._observers if o != callback)
+                logger.debug("Observer unregistered: %s", callback.__name__)
 
     def _notify_observers(self, position: GPSPosition) -> None:
         """
@@ -232,30 +332,67 @@ class GPSDataModel:
         Args:
             position: New GPS position
         """
-        # Create copy of observers list to avoid issues during iteration
-        with self._lock:
-            observers = self._observers.copy()
-
-        for observer in observers:
+        for observer in self._observers:
             try:
                 observer(position)
             except Exception as e:
-                logger.error(f"Error notifying observer {observer.__name__}: {e}")
+                logger.error("Error notifying observer %s: %s", observer.__name__, e)
 
-    def get_latitude_data(self) -> List[float]:
-        """Get list of latitude values."""
+    def _ordered(self, column: np.ndarray) -> np.ndarray:
+        """
+        Copy a ring buffer column in insertion order.
+
+        Args:
+            column: One of the per-field ring buffers
+
+        Returns:
+            Array with the stored values, oldest first
+        """
+        if self._count < self.max_positions:
+            return column[:self._count].copy()
+        return np.concatenate((column[self._head:], column[:self._head]))
+
+    def get_latitude_data(self) -> np.ndarray:
+        """Get array of latitude values."""
         with self._lock:
-            return [pos.latitude for pos in self._positions]
+            return self._ordered(self._lat)
 
-    def get_longitude_data(self) -> List[float]:
-        """Get list of longitude values."""
+    def get_longitude_data(self) -> np.ndarray:
+        """Get array of longitude values."""
         with self._lock:
-            return [pos.longitude for pos in self._positions]
+            return self._ordered(self._lon)
+
+    def get_altitude_data(self) -> np.ndarray:
+        """Get array of altitude values."""
+        with self._lock:
+            return self._ordered(self._alt)
+
+    def get_speed_data(self) -> np.ndarray:
+        """Get array of speed values (NaN where unknown)."""
+        with self._lock:
+            return self._ordered(self._speed)
+
+    def get_bounds(self) -> Dict[str, float]:
+        """
+        Get bounding box of stored positions.
 
-    def get_altitude_data(self) -> List[float]:
-        """Get list of altitude values."""
+        Returns:
+            Dictionary with min/max lat/lon
+        """
         with self._lock:
-            return [pos.altitude for pos in self._positions]
+            n = self._count
+            if n == 0:
+                return {'min_lat': 0, 'max_lat': 0, 'min_lon': 0, 'max_lon': 0}
+
+            # Order does not matter here, so reduce the filled slots in place
+            lats = self._lat[:n]
+            lons = self._lon[:n]
+            return {
+                'min_lat': float(lats.min()),
+                'max_lat': float(lats.max()),
+                'min_lon': float(lons.min()),
+                'max_lon': float(lons.max())
+            }
 
     def get_timestamps(self) -> List[datetime]:
         """Get list of timestamps."""
@@ -272,6 +409,27 @@ class GPSDataModel:
         with self._lock:
             return [pos.to_dict() for pos in self._positions]
 
+    def export_columns(self) -> Dict[str, list]:
+        """
+        Export the numeric fields and timestamps column by column.
+
+        Cheaper and more compact than export_to_dict_list() since the
+        numeric columns come straight from the ring buffers.
+
+        Returns:
+            Dictionary of equally long lists, oldest position first;
+            unknown speeds are None
+        """
+        with self._lock:
+            speeds = self._ordered(self._speed).tolist()
+            return {
+                'latitude': self._ordered(self._lat).tolist(),
+                'longitude': self._ordered(self._lon).tolist(),
+                'altitude': self._ordered(self._alt).tolist(),
+                'speed': [None if v != v else v for v in speeds],
+                'timestamp': [pos.timestamp.isoformat() for pos in self._positions]
+            }
+
 
 class GPSTrack:
     """
@@ -290,10 +448,27 @@ class GPSTrack:
         self.name = name
         self.positions: List[GPSPosition] = []
         self.created_at = datetime.now()
+        # Running [min_lat, max_lat, min_lon, max_lon] over the first
+        # _bounded positions
+        self._bounds = [inf, -inf, inf, -inf]
+        self._bounded = 0
 
     def add_position(self, position: GPSPosition) -> None:
         """Add position to track."""
         self.positions.append(position)
+        if self._bounded == len(self.positions) - 1:
+            b = self._bounds
+            lat = position.latitude
+            lon = position.longitude
+            if lat < b[0]:
+                b[0] = lat
+            if lat > b[1]:
+                b[1] = lat
+            if lon < b[2]:
+                b[2] = lon
+            if lon > b[3]:
+                b[3] = lon
+            self._bounded += 1
 
     def get_total_distance(self) -> float:
         """
@@ -302,14 +477,19 @@ class GPSTrack:
         Returns:
             Total distance in meters
         """
-        if len(self.positions) < 2:
+        count = len(self.positions)
+        if count < 2:
             return 0.0
 
-        total = 0.0
-        for i in range(1, len(self.positions)):
-            total += self.positions[i - 1].distance_to(self.positions[i])
+        lats = np.fromiter((p.latitude for p in self.positions),
+                           dtype=np.float64, count=count)
+        lons = np.fromiter((p.longitude for p in self.positions),
+                           dtype=np.float64, count=count)
+        if NUMBA_AVAILABLE:
+            return haversine_track_km(lats, lons) * 1000.0
 
-        return total
+        legs = haversine_km_array(lats[:-1], lons[:-1], lats[1:], lons[1:])
+        return float(legs.sum()) * 1000.0
 
     def get_duration(self) -> float:
         """
@@ -344,17 +524,26 @@ class GPSTrack:
         Returns:
             Dictionary with min/max lat/lon
         """
-        if not self.positions:
+        count = len(self.positions)
+        if not count:
             return {'min_lat': 0, 'max_lat': 0, 'min_lon': 0, 'max_lon': 0}
 
-        lats = [p.latitude for p in self.positions]
-        lons = [p.longitude for p in self.positions]
-
+        if self._bounded != count:
+            # positions was changed directly, rebuild the running bounds
+            lats = np.fromiter((p.latitude for p in self.positions),
+                               dtype=np.float64, count=count)
+            lons = np.fromiter((p.longitude for p in self.positions),
+                               dtype=np.float64, count=count)
+            self._bounds = [float(lats.min()), float(lats.max()),
+                            float(lons.min()), float(lons.max())]
+            self._bounded = count
+
+        b = self._bounds
         return {
-            'min_lat': min(lats),
-            'max_lat': max(lats),
-            'min_lon': min(lons),
-            'max_lon': max(lons)
+            'min_lat': b[0],
+            'max_lat': b[1],
+            'min_lon': b[2],
+            'max_lon': b[3]
         }
 
 
@@ -0,0 +1,307 @@
+"""
+Numeric kernels for GPS Position System.
+Coordinate math as plain float functions, JIT-compiled when Numba is installed.
+Math functions are imported by name so the pure Python fallback
+avoids a module attribute lookup per call.
+"""
+
+from math import atan2, cos, radians, sin, sqrt
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback decorator when Numba is not available."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+
+EARTH_RADIUS_KM = 6371.0
+
+
+@njit(cache=True)
+def decimal_to_dm(decimal: float) -> float:
+    """
+    Convert decimal degrees to DDDMM.MMMM format.
+
+    Args:
+        decimal: Decimal degrees (sign is ignored)
+
+    Returns:
+        Degrees * 100 + decimal minutes
+    """
+    abs_val = abs(decimal)
+    degrees = int(abs_val)
+    minutes = (abs_val - degrees) * 60.0
+    return degrees * 100 + minutes
+
+
+@njit(cache=True)
+def decimal_to_dms(decimal: float) -> Tuple[int, int, float]:
+    """
+    Convert decimal degrees to degrees, minutes, seconds.
+
+    Args:
+        decimal: Decimal degrees (sign is ignored)
+
+    Returns:
+        Tuple of (degrees, minutes, seconds)
+    """
+    abs_val = abs(decimal)
+    degrees = int(abs_val)
+    remaining = (abs_val - degrees) * 60.0
+    minutes = int(remaining)
+    seconds = (remaining - minutes) * 60.0
+    return (degrees, minutes, seconds)
+
+
+@njit(cache=True)
+def nmea_to_decimal(value: float) -> float:
+    """
+    Convert NMEA DDDMM.MMMM value to decimal degrees.
+
+    Args:
+        value: Coordinate in NMEA degrees/minutes format
+
+    Returns:
+        Decimal degrees
+    """
+    degrees = int(value / 100)
+    minutes = value - (degrees * 100)
+    return degrees + minutes / 60.0
+
+
+@njit(cache=True)
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Great circle distance between two points using the Haversine formula.
+
+    Args:
+        lat1: Latitude of first point in signed decimal degrees
+        lon1: Longitude of first point in signed decimal degrees
+        lat2: Latitude of second point in signed decimal degrees
+        lon2: Longitude of second point in signed decimal degrees
+
+    Returns:
+        Distance in kilometers
+    """
+    lat1 = radians(lat1)
+    lat2 = radians(lat2)
+    dlat = lat2 - lat1
+    dlon = radians(lon2 - lon1)
+
+    sin_dlat = sin(dlat * 0.5)
+    sin_dlon = sin(dlon * 0.5)
+    a = sin_dlat * sin_dlat + cos(lat1) * cos(lat2) * sin_dlon * sin_dlon
+    c = 2 * atan2(sqrt(a), sqrt(1 - a))
+
+    return EARTH_RADIUS_KM * c
+
+
+@njit(cache=True, fastmath=True)
+def haversine_track_km(lat: np.ndarray, lon: np.ndarray) -> float:
+    """
+    Total length of a track along consecutive points.
+
+    Sums the Haversine distances between neighbours in a single loop; only
+    worthwhile compiled, callers use the NumPy version otherwise.
+
+    Args:
+        lat: Latitudes in signed decimal degrees (1-D float64)
+        lon: Longitudes in signed decimal degrees, same size as lat
+
+    Returns:
+        Track length in kilometers
+    """
+    total = 0.0
+    for i in range(1, lat.size):
+        total += haversine_km(lat[i - 1], lon[i - 1], lat[i], lon[i])
+    return total
+
+
+@njit(cache=True, parallel=True)
+def validate_positions_batch(lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+    """
+    Range check of many positions at once.
+
+    Args:
+        lat: Latitudes in signed decimal degrees (1-D float64)
+        lon: Longitudes in signed decimal degrees, same size as lat
+
+    Returns:
+        Boolean array, True where latitude and longitude are in range;
+        NaN (missing) coordinates are invalid
+    """
+    n = lat.size
+    valid = np.empty(n, dtype=np.bool_)
+    for i in prange(n):
+        valid[i] = abs(lat[i]) <= 90.0 and abs(lon[i]) <= 180.0
+    return valid
+
+
+@njit(cache=True)
+def prepare_track(easting: np.ndarray,
+                  northing: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Flatten coordinate arrays into contiguous per-axis arrays.
+
+    Args:
+        easting: Easting values, any shape
+        northing: Northing values, same size as easting
+
+    Returns:
+        Tuple of (easting, northing) as 1-D contiguous float64 arrays
+    """
+    east_in = np.ascontiguousarray(easting).ravel()
+    north_in = np.ascontiguousarray(northing).ravel()
+    n = east_in.size
+    east = np.empty(n, dtype=np.float64)
+    north = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        east[i] = east_in[i]
+        north[i] = north_in[i]
+    return east, north
+
+
+@njit(cache=True)
+def _hex_digit(c: int) -> int:
+    """Value of an ASCII hex digit, -1 if it is none."""
+    if 48 <= c <= 57:
+        return c - 48
+    if 65 <= c <= 70:
+        return c - 55
+    if 97 <= c <= 102:
+        return c - 87
+    return -1
+
+
+@njit(cache=True)
+def _parse_number(buf: np.ndarray, start: int, end: int) -> float:
+    """Parse an ASCII decimal number from buf[start:end], NaN if invalid."""
+    if start >= end:
+        return np.nan
+    sign = 1.0
+    i = start
+    if buf[i] == 45:  # '-'
+        sign = -1.0
+        i += 1
+    value = 0.0
+    divisor = 1.0
+    seen_dot = False
+    digits = 0
+    while i < end:
+        c = buf[i]
+        if 48 <= c <= 57:
+            value = value * 10.0 + (c - 48)
+            if seen_dot:
+                divisor *= 10.0
+            digits += 1
+        elif c == 46 and not seen_dot:  # '.'
+            seen_dot = True
+        else:
+            return np.nan
+        i += 1
+    if digits == 0:
+        return np.nan
+    return sign * value / divisor
+
+
+@njit(cache=True)
+def parse_gga(buf: np.ndarray) -> Tuple[float, float, float, float, float]:
+    """
+    Parse a GGA sentence from ASCII bytes.
+
+    Verifies the checksum and splits fields without creating strings.
+
+    Args:
+        buf: Sentence as a uint8 array (e.g. np.frombuffer(data, np.uint8))
+
+    Returns:
+        Tuple of (latitude, longitude, altitude, satellites, quality) with
+        signed decimal degrees; all NaN if the sentence is not a valid GGA
+        fix. Missing altitude or satellite count are NaN.
+    """
+    nan = np.nan
+    failed = (nan, nan, nan, nan, nan)
+
+    n = buf.size
+    while n > 0 and (buf[n - 1] == 10 or buf[n - 1] == 13 or buf[n - 1] == 32):
+        n -= 1
+    # '$' + talker + 'GGA'
+    if n < 10 or buf[0] != 36 or buf[3] != 71 or buf[4] != 71 or buf[5] != 65:
+        return failed
+
+    # Checksum over everything between '$' and '*', comma positions on the way
+    commas = np.empty(10, dtype=np.int64)
+    n_commas = 0
+    checksum = 0
+    star = -1
+    for i in range(1, n):
+        c = buf[i]
+        if c == 42:  # '*'
+            star = i
+            break
+        if c == 44 and n_commas < 10:  # ','
+            commas[n_commas] = i
+            n_commas += 1
+        checksum ^= c
+    if star < 0 or star + 3 != n or n_commas < 10:
+        return failed
+    high = _hex_digit(buf[star + 1])
+    low = _hex_digit(buf[star + 2])
+    if high < 0 or low < 0 or checksum != high * 16 + low:
+        return failed
+
+    # Field k lies between commas[k - 1] and commas[k]
+    lat_dir = buf[commas[2] + 1]
+    lon_dir = buf[commas[4] + 1]
+    if commas[3] - commas[2] != 2 or commas[5] - commas[4] != 2:
+        return failed
+    if (lat_dir != 78 and lat_dir != 83) or (lon_dir != 69 and lon_dir != 87):
+        return failed
+
+    lat_dm = _parse_number(buf, commas[1] + 1, commas[2])
+    lon_dm = _parse_number(buf, commas[3] + 1, commas[4])
+    quality = _parse_number(buf, commas[5] + 1, commas[6])
+    if lat_dm != lat_dm or lon_dm != lon_dm or quality != quality:
+        return failed
+
+    latitude = nmea_to_decimal(lat_dm)
+    longitude = nmea_to_decimal(lon_dm)
+    if lat_dir == 83:  # 'S'
+        latitude = -latitude
+    if lon_dir == 87:  # 'W'
+        longitude = -longitude
+    if abs(latitude) > 90.0 or abs(longitude) > 180.0:
+        return failed
+
+    satellites = _parse_number(buf, commas[6] + 1, commas[7])
+    altitude = _parse_number(buf, commas[8] + 1, commas[9])
+    return (latitude, longitude, altitude, satellites, quality)
+
+
+if __name__ == "__main__":
+    # Compile (or load cached) kernels once
+    print(f"Numba available: {NUMBA_AVAILABLE}")
+    print(f"decimal_to_dm(48.1234) = {decimal_to_dm(48.1234)}")
+    print(f"decimal_to_dms(48.1234) = {decimal_to_dms(48.1234)}")
+    print(f"nmea_to_decimal(4807.404) = {nmea_to_decimal(4807.404)}")
+    print(f"haversine_km(48, 11, 48.1, 11) = {haversine_km(48.0, 11.0, 48.1, 11.0)}")
+    track = np.array([48.0, 48.1, 48.2])
+    print(f"haversine_track_km(3 points) = {haversine_track_km(track, np.full(3, 11.0))}")
+    print(f"validate_positions_batch(3 points) = "
+          f"{validate_positions_batch(track, np.array([11.0, 181.0, np.nan]))}")
+    gga = b"$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,46.9,M,,*47"
+    print(f"parse_gga(...) = {parse_gga(np.frombuffer(gga, dtype=np.uint8))}")
+    print(f"prepare_track(3 points) = {prepare_track(np.ones((3, 1)), np.zeros((3, 1)))}")
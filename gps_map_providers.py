@@ -4,21 +4,52 @@ Supports OpenStreetMap, Google Maps, and other tile servers.
 """
 
 import logging
+import os
+from collections import OrderedDict
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple, Any
 from PIL import Image
 from io import BytesIO
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Concurrent tile downloads per provider
+TILE_FETCH_WORKERS = 8
+
+# Decoded tiles MapTileCache keeps in memory
+MEMORY_CACHE_SIZE = 64
+
 
 class MapProviderError(Exception):
     """Raised when map operations fail."""
     pass
 
 
+def _create_session(headers: dict) -> requests.Session:
+    """
+    Create an HTTP session that keeps tile server connections alive.
+
+    Args:
+        headers: Headers sent with every request
+
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    session.headers.update(headers)
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                          max_retries=Retry(total=2, backoff_factor=0.2))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
 class MapProvider(ABC):
     """
     Abstract base class for map providers.
@@ -26,6 +57,17 @@ class MapProvider(ABC):
     Defines interface for fetching map tiles and metadata.
     """
 
+    def __init__(self, max_workers: int = TILE_FETCH_WORKERS):
+        """
+        Initialize provider.
+
+        Args:
+            max_workers: Number of concurrent downloads in get_tiles
+        """
+        # Threads are only started once get_tiles is used
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix='tile-fetch')
+
     @abstractmethod
     def get_tile(self, x: int, y: int, zoom: int) -> Image.Image:
         """
@@ -41,6 +83,21 @@ class MapProvider(ABC):
         """
         pass
 
+    def get_tiles(self, tiles: Sequence[Tuple[int, int, int]]) -> List[Image.Image]:
+        """
+        Fetch several tiles concurrently.
+
+        Args:
+            tiles: Sequence of (x, y, zoom) tile coordinates
+
+        Returns:
+            Tile images in the order of tiles
+
+        Raises:
+            MapProviderError: If any tile cannot be fetched
+        """
+        return list(self._executor.map(lambda tile: self.get_tile(*tile), tiles))
+
     @abstractmethod
     def get_attribution(self) -> str:
         """Get map attribution text."""
@@ -60,7 +117,7 @@ class MapProvider(ABC):
 class OSMProvider(MapProvider):
     """OpenStreetMap tile provider."""
 
-    TILE_URL = "http://a.tile.openstreetmap.org/{zoom}/{x}/{y}.png"
+    TILE_URL = "http://a.tile.openstreetmap.org/%d/%d/%d.png"
     ATTRIBUTION = "© OpenStreetMap contributors"
     NAME = "OpenStreetMap"
 
@@ -71,23 +128,27 @@ class OSMProvider(MapProvider):
         Args:
             timeout: Request timeout in seconds
         """
+        super().__init__()
         self.timeout = timeout
         self.headers = {
             "User-Agent": "GPS-Position-System/1.0"
         }
+        self._session = _create_session(self.headers)
 
     def get_tile(self, x: int, y: int, zoom: int) -> Image.Image:
         """Fetch OSM tile."""
         try:
-            url = self.TILE_URL.format(zoom=zoom, x=x, y=y)
-            response = requests.get(url, headers=self.headers,
-                                    timeout=self.timeout)
+            url = self.TILE_URL % (zoom, x, y)
+            response = self._session.get(url, timeout=self.timeout)
             response.raise_for_status()
 
-            return Image.open(BytesIO(response.content))
+            # Decode here, in the fetching thread, not on first use
+            image = Image.open(BytesIO(response.content))
+            image.load()
+            return image
 
         except Exception as e:
-            logger.error(f"Error fetching OSM tile: {e}")
+            logger.error("Error fetching OSM tile: %s", e)
             raise MapProviderError(f"Failed to fetch tile: {e}")
 
     def get_attribution(self) -> str:
@@ -106,29 +167,33 @@ class OSMProvider(MapProvider):
 class CartoDarkProvider(MapProvider):
     """Carto Dark Mode tile provider."""
 
-    TILE_URL = "https://a.basemaps.cartocdn.com/dark_all/{zoom}/{x}/{y}.png"
+    TILE_URL = "https://a.basemaps.cartocdn.com/dark_all/%d/%d/%d.png"
     ATTRIBUTION = "© CARTO, © OpenStreetMap contributors"
     NAME = "Carto Dark"
 
     def __init__(self, timeout: int = 5):
         """Initialize Carto provider."""
+        super().__init__()
         self.timeout = timeout
         self.headers = {
             "User-Agent": "GPS-Position-System/1.0"
         }
+        self._session = _create_session(self.headers)
 
     def get_tile(self, x: int, y: int, zoom: int) -> Image.Image:
         """Fetch Carto tile."""
         try:
-            url = self.TILE_URL.format(zoom=zoom, x=x, y=y)
-            response = requests.get(url, headers=self.headers,
-                                    timeout=self.timeout)
+            url = self.TILE_URL % (zoom, x, y)
+            response = self._session.get(url, timeout=self.timeout)
             response.raise_for_status()
 
-            return Image.open(BytesIO(response.content))
+            # Decode here, in the fetching thread, not on first use
+            image = Image.open(BytesIO(response.content))
+            image.load()
+            return image
 
         except Exception as e:
-            logger.error(f"Error fetching Carto tile: {e}")
+            logger.error("Error fetching Carto tile: %s", e)
             raise MapProviderError(f"Failed to fetch tile: {e}")
 
     def get_attribution(self) -> str:
@@ -158,10 +223,17 @@ class MapProviderFactory:
         'carto': CartoDarkProvider,
     }
 
+    # One shared instance per provider class, so all callers use the same
+    # HTTP connection pool and fetch threads
+    _instances: Dict[type, MapProvider] = {}
+
     @classmethod
     def create(cls, provider_name: str = 'osm') -> MapProvider:
         """
-        Create map provider instance.
+        Get map provider instance.
+
+        Repeated calls for the same provider (under any of its names)
+        return the same instance.
 
         Args:
             provider_name: Provider name (case-insensitive)
@@ -178,8 +250,11 @@ class MapProviderFactory:
                 f"Available: {available}"
             )
 
-        logger.info(f"Created map provider: {provider_name}")
-        return provider_class()
+        provider = cls._instances.get(provider_class)
+        if provider is None:
+            provider = cls._instances[provider_class] = provider_class()
+            logger.info("Created map provider: %s", provider_name)
+        return provider
 
     @classmethod
     def register(cls, name: str, provider_class: type) -> None:
@@ -191,7 +266,7 @@ class MapProviderFactory:
             provider_class: Provider class
         """
         cls._providers[name.lower()] = provider_class
-        logger.info(f"Registered map provider: {name}")
+        logger.info("Registered map provider: %s", name)
 
     @classmethod
     def list_providers(cls) -> list[str]:
@@ -202,36 +277,75 @@ class MapProviderFactory:
 class MapTileCache:
     """
     Caches map tiles to reduce network requests.
+
+    Keeps an in-memory LRU index of the tiles on disk, so eviction does
+    not need to scan the cache directory, and the most recently used tiles
+    already decoded in front of it.
     """
 
-    def __init__(self, cache_dir: str = ".map_cache", max_size: int = 100):
+    def __init__(self, cache_dir: str = ".map_cache", max_size: int = 100,
+                 memory_size: int = MEMORY_CACHE_SIZE):
         """
         Initialize tile cache.
 
         Args:
             cache_dir: Cache directory path
             max_size: Maximum cached tiles
+            memory_size: Maximum decoded tiles kept in memory
         """
         self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(exist_ok=True)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Tile paths are built by string concatenation, not Path joins
+        self._path_prefix = os.path.join(str(self.cache_dir), "tile_")
         self.max_size = max_size
-        self.cache_index = {}
+        # "zoom_x_y" -> tile path, least recently used first
+        self.cache_index: OrderedDict[str, Path] = OrderedDict()
+        self.memory_size = memory_size
+        self._mem_cache: OrderedDict[str, Image.Image] = OrderedDict()
+
+        # Tiles left from earlier runs, oldest first
+        existing = sorted(self.cache_dir.glob("tile_*.png"),
+                          key=lambda p: p.stat().st_mtime)
+        for path in existing:
+            self.cache_index[path.stem[len("tile_"):]] = path
+
+    @staticmethod
+    def _key(x: int, y: int, zoom: int) -> str:
+        """Get index key for tile."""
+        return f"{zoom}_{x}_{y}"
 
     def get_tile_path(self, x: int, y: int, zoom: int) -> Path:
         """Get cache file path for tile."""
-        return self.cache_dir / f"tile_{zoom}_{x}_{y}.png"
+        return Path(self._path_prefix + self._key(x, y, zoom) + ".png")
 
     def get(self, x: int, y: int, zoom: int) -> Optional[Image.Image]:
         """Get cached tile."""
-        try:
-            path = self.get_tile_path(x, y, zoom)
+        key = self._key(x, y, zoom)
+        path = self.cache_index.get(key)
+        if path is None:
+            return None
+
+        image = self._mem_cache.get(key)
+        if image is not None:
+            self._mem_cache.move_to_end(key)
+            self.cache_index.move_to_end(key)
+            return image
 
-            if path.exists():
-                logger.debug(f"Cache hit: {path}")
-                return Image.open(path)
+        try:
+            image = Image.open(path)
+            # Decode now, the file would otherwise be read on first use
+            image.load()
+            self.cache_index.move_to_end(key)
+            self._remember(key, image)
+            logger.debug("Cache hit: %s", path)
+            return image
+
+        except FileNotFoundError:
+            # Removed behind our back
+            self.cache_index.pop(key, None)
 
         except Exception as e:
-            logger.warning(f"Cache read error: {e}")
+            logger.warning("Cache read error: %s", e)
 
         return None
 
@@ -239,36 +353,45 @@ class MapTileCache:
             image: Image.Image) -> None:
         """Cache tile image."""
         try:
+            key = self._key(x, y, zoom)
+
             # Enforce cache size limit
-            if len(self.cache_index) >= self.max_size:
-                self._evict_oldest()
+            if key not in self.cache_index:
+                while self.cache_index and len(self.cache_index) >= self.max_size:
+                    self._evict_oldest()
 
             path = self.get_tile_path(x, y, zoom)
             image.save(path)
 
-            self.cache_index[str(path)] = True
-            logger.debug(f"Cached tile: {path}")
+            self.cache_index[key] = path
+            self.cache_index.move_to_end(key)
+            self._remember(key, image)
+            logger.debug("Cached tile: %s", path)
 
         except Exception as e:
-            logger.warning(f"Cache write error: {e}")
+            logger.warning("Cache write error: %s", e)
+
+    def _remember(self, key: str, image: Image.Image) -> None:
+        """Keep decoded tile in memory, dropping the least recently used."""
+        self._mem_cache[key] = image
+        self._mem_cache.move_to_end(key)
+        while len(self._mem_cache) > self.memory_size:
+            self._mem_cache.popitem(last=False)
 
     def _evict_oldest(self) -> None:
-        """Remove oldest cached tile."""
+        """Remove least recently used cached tile."""
         if not self.cache_index:
             return
 
-        oldest = min(
-            self.cache_dir.glob("tile_*.png"),
-            key=lambda p: p.stat().st_mtime
-        )
-
-        oldest.unlink()
-        del self.cache_index[str(oldest)]
-        logger.debug(f"Evicted cached tile: {oldest}")
+        key, oldest = self.cache_index.popitem(last=False)
+        self._mem_cache.pop(key, None)
+        oldest.unlink(missing_ok=True)
+        logger.debug("Evicted cached tile: %s", oldest)
 
     def clear(self) -> None:
         """Clear cache."""
         for f in self.cache_dir.glob("tile_*.png"):
             f.unlink()
         self.cache_index.clear()
+        self._mem_cache.clear()
         logger.info("Cache cleared")
@@ -5,24 +5,45 @@ Provides system-wide metrics collection without external dependencies.
 
 import logging
 import time
-from typing import Dict, Any, List
+from typing import Deque, Dict, Any, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 from collections import deque
 import json
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Number of recent measurements kept per timer
+TIMER_WINDOW = 1000
+
 
-@dataclass
+@dataclass(slots=True)
 class MetricPoint:
-    """Single metric data point."""
-    timestamp: datetime
+    """
+    Single metric data point.
+
+    Attributes:
+        timestamp: Wall clock time in nanoseconds since the epoch
+        value: Measured value
+        tags: Optional tags
+    """
+    timestamp: int
     value: float
-    tags: Dict[str, str] = field(default_factory=dict)
+    tags: Optional[Dict[str, str]] = None
+
+    @property
+    def time(self) -> datetime:
+        """Timestamp as local datetime."""
+        return datetime.fromtimestamp(self.timestamp / 1e9)
 
 
-@dataclass
+@dataclass(slots=True)
 class Metric:
     """Aggregated metric data."""
     name: str
@@ -47,7 +68,7 @@ class Metric:
         )
 
         self.points.append(
-            MetricPoint(datetime.now(), value)
+            MetricPoint(time.time_ns(), value)
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -75,7 +96,9 @@ class MetricsCollector:
         """Initialize metrics collector."""
         self.metrics: Dict[str, Metric] = {}
         self.counters: Dict[str, int] = {}
-        self.timers: Dict[str, List[float]] = {}
+        self.timers: Dict[str, Deque[float]] = {}
+        # Running sum over each timer window for O(1) averages
+        self._timer_sums: Dict[str, float] = {}
         self.start_time = datetime.now()
 
     def record_metric(self, name: str, value: float,
@@ -92,7 +115,7 @@ class MetricsCollector:
             self.metrics[name] = Metric(name, unit)
 
         self.metrics[name].add_value(value)
-        logger.debug(f"Metric {name}: {value} {unit}")
+        logger.debug("Metric %s: %s %s", name, value, unit)
 
     def increment_counter(self, name: str, amount: int = 1) -> None:
         """
@@ -114,7 +137,7 @@ class MetricsCollector:
         Returns:
             Start time (use with stop_timer)
         """
-        return time.time()
+        return time.perf_counter()
 
     def stop_timer(self, name: str, start_time: float) -> float:
         """
@@ -127,16 +150,18 @@ class MetricsCollector:
         Returns:
             Elapsed time in milliseconds
         """
-        elapsed = (time.time() - start_time) * 1000.0  # Convert to ms
-
-        if name not in self.timers:
-            self.timers[name] = []
+        elapsed = (time.perf_counter() - start_time) * 1000.0  # Convert to ms
 
-        self.timers[name].append(elapsed)
+        times = self.timers.get(name)
+        if times is None:
+            times = self.timers[name] = deque(maxlen=TIMER_WINDOW)
+            self._timer_sums[name] = 0.0
 
-        # Keep only last 1000 measurements
-        if len(self.timers[name]) > 1000:
-            self.timers[name] = self.timers[name][-1000:]
+        # The deque drops its oldest measurement once the window is full
+        if len(times) == TIMER_WINDOW:
+            self._timer_sums[name] -= times[0]
+        times.append(elapsed)
+        self._timer_sums[name] += elapsed
 
         self.record_metric(f"{name}_ms", elapsed, "ms")
 
@@ -154,7 +179,7 @@ class MetricsCollector:
             'metrics': {name: m.to_dict() for name, m in self.metrics.items()},
             'counters': self.counters,
             'timers_avg': {
-                name: sum(times) / len(times)
+                name: self._timer_sums[name] / len(times)
                 for name, times in self.timers.items()
                 if times
             },
@@ -163,30 +188,34 @@ class MetricsCollector:
 
     def get_summary(self) -> str:
         """Get metrics summary as formatted string."""
-        summary = "=== GPS System Metrics ===\n"
+        lines = ["=== GPS System Metrics ==="]
 
         for name, metric in self.metrics.items():
-            summary += (
+            lines.append(
                 f"{name}: current={metric.current_value:.2f}, "
                 f"avg={metric.avg_value:.2f}, "
                 f"min={metric.min_value:.2f}, "
-                f"max={metric.max_value:.2f} {metric.unit}\n"
+                f"max={metric.max_value:.2f} {metric.unit}"
             )
 
-        summary += "\nCounters:\n"
+        lines.append("\nCounters:")
         for name, value in self.counters.items():
-            summary += f"{name}: {value}\n"
+            lines.append(f"{name}: {value}")
 
-        summary += "\nTimers (avg ms):\n"
+        lines.append("\nTimers (avg ms):")
         for name, times in self.timers.items():
             if times:
-                avg = sum(times) / len(times)
-                summary += f"{name}: {avg:.2f}ms (min={min(times):.2f}, max={max(times):.2f})\n"
+                avg = self._timer_sums[name] / len(times)
+                lines.append(f"{name}: {avg:.2f}ms (min={min(times):.2f}, max={max(times):.2f})")
 
-        return summary
+        lines.append("")
+        return "\n".join(lines)
 
     def export_json(self) -> str:
         """Export metrics as JSON."""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(self.get_all_metrics(), default=str,
+                                option=orjson.OPT_INDENT_2).decode()
         return json.dumps(self.get_all_metrics(), indent=2, default=str)
 
     def reset(self) -> None:
@@ -194,6 +223,7 @@ class MetricsCollector:
         self.metrics.clear()
         self.counters.clear()
         self.timers.clear()
+        self._timer_sums.clear()
         self.start_time = datetime.now()
 
 
@@ -5,12 +5,25 @@ Provides efficient non-blocking UDP reception with proper error handling.
 
 import asyncio
 import logging
+import multiprocessing
+import os
 import socket
-from typing import Callable, Optional
+from typing import Callable, List, Optional, Tuple
 from dataclasses import dataclass
 
+from gps_udp_batch import RECV_BATCH, RecvBatch, send_batch
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Requested kernel socket buffer size, absorbs bursts of NMEA datagrams
+DEFAULT_SOCKET_BUFFER = 4 * 1024 * 1024
+
 
 @dataclass
 class NetworkStats:
@@ -22,17 +35,78 @@ class NetworkStats:
     avg_latency_ms: float = 0.0
 
 
+def install_fast_loop() -> bool:
+    """
+    Use uvloop for event loops created from now on, if it is installed.
+
+    Must be called before the loop is started (e.g. before asyncio.run);
+    a custom event loop policy that is already set is left alone.
+
+    Returns:
+        True if uvloop is in use
+    """
+    if not UVLOOP_AVAILABLE:
+        return False
+
+    policy = asyncio.get_event_loop_policy()
+    if isinstance(policy, uvloop.EventLoopPolicy):
+        return True
+    if type(policy) is not asyncio.DefaultEventLoopPolicy:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.debug("Using uvloop event loop")
+    return True
+
+
+def set_socket_buffer(sock: socket.socket, option: int, size: int) -> int:
+    """
+    Request a kernel socket buffer size and report what was granted.
+
+    The kernel caps the size at net.core.rmem_max / wmem_max (Linux
+    reports twice the requested value for bookkeeping overhead).
+
+    Args:
+        sock: Socket to configure
+        option: socket.SO_RCVBUF or socket.SO_SNDBUF
+        size: Requested size in bytes
+
+    Returns:
+        Effective buffer size in bytes
+    """
+    name = 'SO_RCVBUF' if option == socket.SO_RCVBUF else 'SO_SNDBUF'
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, option, size)
+    except OSError as e:
+        logger.warning("Could not set %s to %d bytes: %s", name, size, e)
+    effective = sock.getsockopt(socket.SOL_SOCKET, option)
+
+    if effective < size:
+        logger.warning("%s clamped to %d bytes (requested %d), raise "
+                       "net.core.%s to allow more", name, effective, size,
+                       'rmem_max' if option == socket.SO_RCVBUF else 'wmem_max')
+    else:
+        logger.debug("%s is %d bytes", name, effective)
+    return effective
+
+
 class AsyncNMEAReceiver:
     """
     Asynchronous NMEA data receiver using asyncio.
 
     Provides efficient non-blocking UDP socket handling with
     automatic reconnection and statistics tracking.
+
+    Runs on any asyncio loop; call install_fast_loop() before starting
+    the loop to run it on uvloop when that is installed.
     """
 
     def __init__(self, host: str = "127.0.0.1",
                  port: int = 19710,
-                 buffer_size: int = 4096):
+                 buffer_size: int = 4096,
+                 rcvbuf_bytes: int = DEFAULT_SOCKET_BUFFER,
+                 reuse_port: bool = False,
+                 raw: bool = False):
         """
         Initialize async receiver.
 
@@ -40,14 +114,36 @@ class AsyncNMEAReceiver:
             host: Listen address
             port: Listen port
             buffer_size: UDP buffer size
+            rcvbuf_bytes: Requested kernel receive buffer (SO_RCVBUF)
+            reuse_port: Share the port with other receivers (SO_REUSEPORT),
+                the kernel then spreads senders across them
+            raw: Pass sentences to callbacks as bytes instead of decoding
+                them to str
         """
         self.host = host
         self.port = port
         self.buffer_size = buffer_size
+        self.rcvbuf = rcvbuf_bytes
+        self.reuse_port = reuse_port
+        self.raw = raw
+        # Reused for every datagram, see receive_loop()
+        self._buffer = bytearray(buffer_size)
+        self._batch: Optional[RecvBatch] = None
+        # Reader registration of the batched loop, undone by stop()
+        self._reader_fd: Optional[int] = None
+        self._readable = asyncio.Event()
+        # Created by the first send_data() call
+        self._send_sock: Optional[socket.socket] = None
+        # Loop the receiver runs on, set by receive_loop()/send_data()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         self.socket: Optional[socket.socket] = None
         self.is_running = False
         self.stats = NetworkStats()
         self.callbacks: list[Callable] = []
+        # Split by kind and frozen at registration, so dispatch needs no type
+        # check and a registration during dispatch cannot change the iteration
+        self._sync_callbacks: Tuple[Callable, ...] = ()
+        self._async_callbacks: Tuple[Callable, ...] = ()
 
     def register_callback(self, callback: Callable) -> None:
         """
@@ -57,6 +153,10 @@ class AsyncNMEAReceiver:
             callback: Async function to call on data reception
         """
         self.callbacks.append(callback)
+        if asyncio.iscoroutinefunction(callback):
+            self._async_callbacks += (callback,)
+        else:
+            self._sync_callbacks += (callback,)
 
     async def start(self) -> None:
         """Start the async receiver."""
@@ -64,63 +164,153 @@ class AsyncNMEAReceiver:
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if self.reuse_port:
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
             self.socket.bind((self.host, self.port))
+            set_socket_buffer(self.socket, socket.SO_RCVBUF, self.rcvbuf)
             self.socket.setblocking(False)
 
-            logger.info(f"Async receiver started on {self.host}:{self.port}")
+            logger.info("Async receiver started on %s:%d", self.host, self.port)
 
             await self.receive_loop()
 
         except Exception as e:
-            logger.error(f"Receiver error: {e}", exc_info=True)
+            # Tracebacks are costly to format, only attach them when debugging
+            logger.error("Receiver error: %s", e,
+                         exc_info=logger.isEnabledFor(logging.DEBUG))
             self.stats.errors += 1
         finally:
             await self.stop()
 
     async def receive_loop(self) -> None:
-        """Main receive loop."""
-        loop = asyncio.get_event_loop()
+        """
+        Main receive loop.
+
+        Waits for the socket to become readable, then drains all queued
+        datagrams (up to RECV_BATCH) in one go, with a single recvmmsg()
+        call where available. Falls back to one awaited receive per
+        datagram on event loops without add_reader().
+        """
+        loop = self._loop = asyncio.get_running_loop()
+        if self._batch is None:
+            self._batch = RecvBatch(RECV_BATCH, self.buffer_size)
+        readable = self._readable
+        fd = self.socket.fileno()
+        try:
+            loop.add_reader(fd, readable.set)
+        except NotImplementedError:
+            await self._receive_loop_single(loop)
+            return
+        self._reader_fd = fd
+
+        try:
+            while self.is_running:
+                try:
+                    batch = self._batch.recv(self.socket)
+                    if not batch:
+                        readable.clear()
+                        await readable.wait()
+                        continue
+
+                    for data, addr in batch:
+                        self.stats.packets_received += 1
+                        self.stats.bytes_received += len(data)
+                        await self._dispatch(data, addr)
+
+                except Exception as e:
+                    logger.error("Receive loop error: %s", e)
+                    self.stats.errors += 1
+                    await asyncio.sleep(0.1)
+        finally:
+            if self._reader_fd is not None:
+                loop.remove_reader(self._reader_fd)
+                self._reader_fd = None
+
+    async def _receive_loop_single(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Receive loop with one awaited receive per datagram.
+
+        Datagrams are received into one preallocated buffer and decoded
+        straight from a memoryview of it, no per-packet bytes object.
+
+        Args:
+            loop: Running event loop
+        """
+        view = memoryview(self._buffer)
+        # sock_recvfrom_into is Python 3.11+
+        recvfrom_into = getattr(loop, 'sock_recvfrom_into', None)
 
         while self.is_running:
             try:
                 # Non-blocking receive
-                data, addr = await loop.sock_recvfrom(
-                    self.socket, self.buffer_size
-                )
+                if recvfrom_into is not None:
+                    nbytes, addr = await recvfrom_into(self.socket, self._buffer)
+                    data = view[:nbytes]
+                else:
+                    data, addr = await loop.sock_recvfrom(
+                        self.socket, self.buffer_size
+                    )
+                    nbytes = len(data)
 
                 self.stats.packets_received += 1
-                self.stats.bytes_received += len(data)
+                self.stats.bytes_received += nbytes
+                await self._dispatch(data, addr)
 
-                # Decode and process
-                try:
-                    nmea_str = data.decode('utf-8').strip()
+            except Exception as e:
+                logger.error("Receive loop error: %s", e)
+                self.stats.errors += 1
+                await asyncio.sleep(0.1)
 
-                    # Call registered callbacks
-                    for callback in self.callbacks:
-                        if asyncio.iscoroutinefunction(callback):
-                            await callback(nmea_str, addr)
-                        else:
-                            callback(nmea_str, addr)
+    async def _dispatch(self, data, addr) -> None:
+        """
+        Split a datagram into sentences and pass them to the callbacks.
 
-                except UnicodeDecodeError:
-                    logger.warning(f"Invalid UTF-8 from {addr}")
-                    self.stats.errors += 1
+        Args:
+            data: Datagram payload (bytes-like)
+            addr: Sender address
+        """
+        # One copy out of the receive buffer, which is reused for the next
+        # datagram; raw mode skips the decode
+        if self.raw:
+            payload = bytes(data)
+        else:
+            try:
+                payload = str(data, 'utf-8')
+            except UnicodeDecodeError:
+                logger.warning("Invalid UTF-8 from %s", addr)
+                self.stats.errors += 1
+                return
 
-            except BlockingIOError:
-                await asyncio.sleep(0.001)
+        # A datagram may carry several sentences
+        for nmea_str in payload.splitlines():
+            nmea_str = nmea_str.strip()
+            if not nmea_str:
+                continue
 
-            except Exception as e:
-                logger.error(f"Receive loop error: {e}")
-                self.stats.errors += 1
-                await asyncio.sleep(0.1)
+            # Call registered callbacks
+            for callback in self._sync_callbacks:
+                callback(nmea_str, addr)
+            for callback in self._async_callbacks:
+                await callback(nmea_str, addr)
 
     async def stop(self) -> None:
         """Stop the receiver."""
         self.is_running = False
 
+        if self._reader_fd is not None:
+            # Unregister before the fd is closed and wake the loop
+            self._loop.remove_reader(self._reader_fd)
+            self._reader_fd = None
+            self._readable.set()
+
         if self.socket:
             self.socket.close()
 
+        if self._send_sock is not None:
+            self._send_sock.close()
+            self._send_sock = None
+        self._loop = None
+
         logger.info("Async receiver stopped")
 
     async def send_data(self, data: str,
@@ -135,17 +325,20 @@ class AsyncNMEAReceiver:
             port: Destination port
         """
         try:
-            loop = asyncio.get_event_loop()
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            loop = self._loop
+            if loop is None:
+                loop = self._loop = asyncio.get_running_loop()
+            if self._send_sock is None:
+                self._send_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                self._send_sock.setblocking(False)
 
             message = data.encode('utf-8')
-            await loop.sock_sendto(sock, message, (host, port))
+            await loop.sock_sendto(self._send_sock, message, (host, port))
 
-            sock.close()
-            logger.debug(f"Sent {len(message)} bytes to {host}:{port}")
+            logger.debug("Sent %d bytes to %s:%d", len(message), host, port)
 
         except Exception as e:
-            logger.error(f"Send error: {e}")
+            logger.error("Send error: %s", e)
             self.stats.errors += 1
 
     def get_stats(self) -> NetworkStats:
@@ -157,24 +350,91 @@ class AsyncNMEAReceiver:
         self.stats = NetworkStats()
 
 
+def _run_shard(index: int, host: str, port: int,
+               setup: Callable[[AsyncNMEAReceiver], None]) -> None:
+    """Worker process of run_sharded()."""
+    if hasattr(os, 'sched_setaffinity'):
+        cpus = sorted(os.sched_getaffinity(0))
+        os.sched_setaffinity(0, {cpus[index % len(cpus)]})
+
+    receiver = AsyncNMEAReceiver(host, port, reuse_port=True)
+    setup(receiver)
+
+    install_fast_loop()
+    try:
+        asyncio.run(receiver.start())
+    except KeyboardInterrupt:
+        pass
+
+
+def run_sharded(n_workers: int,
+                setup: Callable[[AsyncNMEAReceiver], None],
+                host: str = "127.0.0.1",
+                port: int = 19710) -> List[multiprocessing.Process]:
+    """
+    Receive on one port with several processes.
+
+    Each worker binds its own receiver with SO_REUSEPORT, the kernel
+    distributes senders over them by flow hash. Workers are pinned to one
+    CPU each where the platform allows it.
+
+    Args:
+        n_workers: Number of receiver processes
+        setup: Picklable (module-level) function called with the worker's
+            receiver to register its callbacks
+        host: Listen address
+        port: Listen port
+
+    Returns:
+        Started worker processes
+
+    Raises:
+        RuntimeError: If the platform has no SO_REUSEPORT
+    """
+    if not hasattr(socket, 'SO_REUSEPORT'):
+        raise RuntimeError("SO_REUSEPORT is not supported on this platform")
+
+    ctx = multiprocessing.get_context('spawn')
+    workers = []
+    for index in range(n_workers):
+        worker = ctx.Process(target=_run_shard, args=(index, host, port, setup),
+                             name=f"nmea-receiver-{index}", daemon=True)
+        worker.start()
+        workers.append(worker)
+
+    logger.info("Started %d receiver workers on %s:%d", n_workers, host, port)
+    return workers
+
+
 class AsyncNMEASender:
     """
     Asynchronous NMEA sender using asyncio.
     """
 
     def __init__(self, host: str = "127.0.0.1",
-                 port: int = 19711):
+                 port: int = 19711,
+                 sndbuf_bytes: int = DEFAULT_SOCKET_BUFFER):
         """
         Initialize async sender.
 
         Args:
             host: Destination host
             port: Destination port
+            sndbuf_bytes: Requested kernel send buffer (SO_SNDBUF)
         """
         self.host = host
         self.port = port
         self.stats = NetworkStats()
 
+        # Resolved destination for send_batch()
+        self._addr: Optional[Tuple[str, int]] = None
+        # Loop of the first send, dropped by aclose()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # One socket for all messages, closed by aclose()
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        set_socket_buffer(self._sock, socket.SO_SNDBUF, sndbuf_bytes)
+        self._sock.setblocking(False)
+
     async def send_message(self, message: str) -> bool:
         """
         Send NMEA message asynchronously.
@@ -186,13 +446,12 @@ class AsyncNMEASender:
             True if successful
         """
         try:
-            loop = asyncio.get_event_loop()
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            loop = self._loop
+            if loop is None:
+                loop = self._loop = asyncio.get_running_loop()
 
             data = message.encode('utf-8')
-            await loop.sock_sendto(sock, data, (self.host, self.port))
-
-            sock.close()
+            await loop.sock_sendto(self._sock, data, (self.host, self.port))
 
             self.stats.packets_received += 1
             self.stats.bytes_received += len(data)
@@ -200,7 +459,7 @@ class AsyncNMEASender:
             return True
 
         except Exception as e:
-            logger.error(f"Send error: {e}")
+            logger.error("Send error: %s", e)
             self.stats.errors += 1
             return False
 
@@ -224,3 +483,41 @@ class AsyncNMEASender:
             await asyncio.sleep(delay_ms / 1000.0)
 
         return sent
+
+    async def send_batch(self, messages: list[str]) -> int:
+        """
+        Send several messages at once, without delay between them.
+
+        Uses one sendmmsg() call per MAX_BATCH messages on Linux.
+
+        Args:
+            messages: List of NMEA sentences
+
+        Returns:
+            Number of successfully sent messages
+        """
+        if not messages:
+            return 0
+
+        try:
+            if self._addr is None:
+                # sendmmsg needs a numeric address
+                self._addr = (socket.gethostbyname(self.host), self.port)
+
+            payloads = [message.encode('utf-8') for message in messages]
+            sent = send_batch(self._sock, payloads, self._addr)
+
+            self.stats.packets_received += sent
+            self.stats.bytes_received += sum(len(p) for p in payloads[:sent])
+
+            return sent
+
+        except Exception as e:
+            logger.error("Batch send error: %s", e)
+            self.stats.errors += 1
+            return 0
+
+    async def aclose(self) -> None:
+        """Close the sender socket."""
+        self._sock.close()
+        self._loop = None
@@ -5,6 +5,7 @@ Provides robust error handling for unreliable connections.
 
 import asyncio
 import logging
+import random
 import time
 from enum import Enum
 from typing import Callable, Optional, Any, TypeVar, Coroutine
@@ -75,6 +76,15 @@ class CircuitBreaker:
         self.success_count = 0
         self.last_failure_time: Optional[datetime] = None
         self.last_state_change = datetime.now()
+        # Monotonic twin of last_state_change for the recovery timeout,
+        # immune to wall clock jumps
+        self._state_change_ns = time.monotonic_ns()
+
+    def _set_state(self, state: CircuitState) -> None:
+        """Switch state and remember when it happened."""
+        self.state = state
+        self._state_change_ns = time.monotonic_ns()
+        self.last_state_change = datetime.now()
 
     def record_success(self) -> None:
         """Record successful operation."""
@@ -82,8 +92,7 @@ class CircuitBreaker:
 
         if self.state == CircuitState.HALF_OPEN:
             logger.info("Circuit breaker: HALF_OPEN -> CLOSED")
-            self.state = CircuitState.CLOSED
-            self.last_state_change = datetime.now()
+            self._set_state(CircuitState.CLOSED)
 
     def record_failure(self) -> None:
         """Record failed operation."""
@@ -93,8 +102,7 @@ class CircuitBreaker:
         if (self.state == CircuitState.CLOSED and
                 self.failure_count >= self.config.failure_threshold):
             logger.warning("Circuit breaker: CLOSED -> OPEN")
-            self.state = CircuitState.OPEN
-            self.last_state_change = datetime.now()
+            self._set_state(CircuitState.OPEN)
 
     def can_attempt(self) -> bool:
         """Check if operation can be attempted."""
@@ -103,12 +111,11 @@ class CircuitBreaker:
 
         if self.state == CircuitState.OPEN:
             # Check if recovery timeout expired
-            elapsed = (datetime.now() - self.last_state_change).total_seconds() * 1000
-            if elapsed >= self.config.recovery_timeout_ms:
+            elapsed_ns = time.monotonic_ns() - self._state_change_ns
+            if elapsed_ns >= self.config.recovery_timeout_ms * 1_000_000:
                 logger.info("Circuit breaker: OPEN -> HALF_OPEN")
-                self.state = CircuitState.HALF_OPEN
+                self._set_state(CircuitState.HALF_OPEN)
                 self.failure_count = 0
-                self.last_state_change = datetime.now()
                 return True
             return False
 
@@ -142,6 +149,8 @@ class ResilientNetworkClient:
         self.circuit_config = circuit_config or CircuitBreakerConfig()
         self.circuit_breaker = CircuitBreaker(self.circuit_config)
         self.stats = RetryStats()
+        # Own generator for jitter instead of the shared module-level one
+        self._rng = random.Random()
 
     async def execute_with_retry(self,
                                  operation: Callable[..., Coroutine],
@@ -159,7 +168,7 @@ class ResilientNetworkClient:
             Operation result
         """
         if not self.circuit_breaker.can_attempt():
-            logger.error(f"Circuit breaker OPEN: rejecting request")
+            logger.error("Circuit breaker OPEN: rejecting request")
             raise RuntimeError("Circuit breaker is open")
 
         last_error = None
@@ -175,7 +184,7 @@ class ResilientNetworkClient:
                 self.circuit_breaker.record_success()
 
                 if attempt > 0:
-                    logger.info(f"Operation succeeded on attempt {attempt + 1}")
+                    logger.info("Operation succeeded on attempt %d", attempt + 1)
 
                 return result
 
@@ -186,16 +195,13 @@ class ResilientNetworkClient:
 
                 if attempt < self.retry_config.max_retries - 1:
                     delay = self._calculate_backoff(attempt)
-                    logger.warning(
-                        f"Attempt {attempt + 1} failed: {e}. "
-                        f"Retrying in {delay}ms..."
-                    )
+                    logger.warning("Attempt %d failed: %s. Retrying in %sms...",
+                                   attempt + 1, e, delay)
                     self.stats.retries_triggered += 1
                     await asyncio.sleep(delay / 1000.0)
                 else:
-                    logger.error(
-                        f"Operation failed after {self.retry_config.max_retries} attempts"
-                    )
+                    logger.error("Operation failed after %d attempts",
+                                 self.retry_config.max_retries)
 
         self.stats.last_error = str(last_error)
         self.stats.last_error_time = datetime.now()
@@ -221,8 +227,7 @@ class ResilientNetworkClient:
 
         # Add jitter
         if self.retry_config.jitter_enabled:
-            import random
-            jitter = random.uniform(0, delay * 0.1)
+            jitter = self._rng.random() * delay * 0.1
             delay += jitter
 
         return delay
@@ -6,22 +6,50 @@ Provides JSON logging, contextual logging, and log aggregation support.
 import logging
 import json
 import sys
+from collections import defaultdict, deque
 from typing import Any, Dict, Optional
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Shared extra for records without context, never modified
+_EMPTY_EXTRA = {'context': {}}
+
 
 class JSONFormatter(logging.Formatter):
     """
     Custom JSON formatter for structured logging.
 
     Outputs logs as JSON for easy parsing and aggregation.
+    Serializes with orjson when it is installed.
     """
 
-    def format(self, record: logging.LogRecord) -> str:
-        """Format log record as JSON."""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Last formatted timestamp, bursts of records share the millisecond.
+        # Handlers serialize format() calls, so no lock is needed.
+        self._last_ts_ms = -1
+        self._last_ts_str = ""
+
+    def _timestamp(self, created: float) -> str:
+        """Local ISO timestamp with millisecond resolution, cached per ms."""
+        ms = int(created * 1000)
+        if ms != self._last_ts_ms:
+            self._last_ts_str = datetime.fromtimestamp(ms / 1000).isoformat(
+                timespec='milliseconds')
+            self._last_ts_ms = ms
+        return self._last_ts_str
+
+    def to_dict(self, record: logging.LogRecord) -> Dict[str, Any]:
+        """Convert log record to the dictionary that format() serializes."""
         log_data = {
-            'timestamp': datetime.fromtimestamp(record.created).isoformat(),
+            'timestamp': self._timestamp(record.created),
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
@@ -38,6 +66,14 @@ class JSONFormatter(logging.Formatter):
         if hasattr(record, 'context'):
             log_data.update(record.context)
 
+        return log_data
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format log record as JSON."""
+        log_data = self.to_dict(record)
+
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(log_data).decode()
         return json.dumps(log_data)
 
 
@@ -73,7 +109,14 @@ class ContextLogger:
 
     def _log(self, level: int, msg: str, **kwargs) -> None:
         """Internal logging method with context."""
-        extra = {'context': {**self.context, **kwargs}}
+        # Skip building the context for suppressed levels
+        if not self.logger.isEnabledFor(level):
+            return
+
+        if self.context or kwargs:
+            extra = {'context': {**self.context, **kwargs}}
+        else:
+            extra = _EMPTY_EXTRA
         self.logger.log(level, msg, extra=extra)
 
     def debug(self, msg: str, **kwargs) -> None:
@@ -97,16 +140,57 @@ class ContextLogger:
         self._log(logging.CRITICAL, msg, **kwargs)
 
 
+class _AggregatorHandler(logging.Handler):
+    """Handler feeding log records into a LogAggregator."""
+
+    def __init__(self, aggregator: 'LogAggregator'):
+        super().__init__()
+        self.aggregator = aggregator
+        self.setFormatter(JSONFormatter())
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.aggregator.ingest(self.formatter.to_dict(record))
+        except Exception:
+            self.handleError(record)
+
+
 class LogAggregator:
     """
     Aggregates logs for analysis and monitoring.
+
+    Keeps the most recent records, indexed by level and module.
     """
 
-    def __init__(self):
-        """Initialize log aggregator."""
-        self.logs: list[Dict[str, Any]] = []
-        self.handler = logging.StreamHandler()
-        self.handler.setFormatter(JSONFormatter())
+    def __init__(self, max_logs: int = 10000):
+        """
+        Initialize log aggregator.
+
+        Args:
+            max_logs: Number of most recent records to keep
+        """
+        self.logs: deque[Dict[str, Any]] = deque(maxlen=max_logs)
+        # Records per level / module in arrival order, same objects as in logs
+        self._by_level: Dict[str, deque] = defaultdict(deque)
+        self._by_module: Dict[str, deque] = defaultdict(deque)
+        self.handler = _AggregatorHandler(self)
+
+    def ingest(self, log: Dict[str, Any]) -> None:
+        """
+        Add a log record.
+
+        Args:
+            log: Record as produced by JSONFormatter.to_dict()
+        """
+        if len(self.logs) == self.logs.maxlen:
+            # The oldest record is also first in its index entries
+            oldest = self.logs[0]
+            self._by_level[oldest.get('level')].popleft()
+            self._by_module[oldest.get('module')].popleft()
+
+        self.logs.append(log)
+        self._by_level[log.get('level')].append(log)
+        self._by_module[log.get('module')].append(log)
 
     def attach_to_logger(self, logger_name: str) -> None:
         """
@@ -120,29 +204,64 @@ class LogAggregator:
 
     def get_logs_by_level(self, level: str) -> list[Dict]:
         """Get logs by level."""
-        return [log for log in self.logs if log.get('level') == level]
+        return list(self._by_level.get(level, ()))
 
     def get_logs_by_module(self, module: str) -> list[Dict]:
         """Get logs by module."""
-        return [log for log in self.logs if log.get('module') == module]
+        return list(self._by_module.get(module, ()))
 
     def export_json(self) -> str:
         """Export logs as JSON."""
-        return json.dumps(self.logs, indent=2, default=str)
+        return json.dumps(list(self.logs), indent=2, default=str)
+
+    def export_ndjson(self, filepath: str) -> None:
+        """
+        Export logs as newline-delimited JSON, one record per line.
+
+        Records are serialized and written one at a time, so the export
+        never holds more than one encoded record. Blocking; from async
+        code run it with asyncio.to_thread().
+
+        Args:
+            filepath: Output file path
+        """
+        # Snapshot the references, the handler may append meanwhile
+        records = list(self.logs)
+
+        with open(filepath, 'wb') as f:
+            for record in records:
+                if ORJSON_AVAILABLE:
+                    f.write(orjson.dumps(record, default=str))
+                else:
+                    f.write(json.dumps(record, default=str).encode('utf-8'))
+                f.write(b'\n')
 
     def export_csv(self, filepath: str) -> None:
-        """Export logs as CSV."""
+        """
+        Export logs as CSV.
+
+        Columns are the union of all record fields, records are written
+        one at a time.
+
+        Args:
+            filepath: Output file path
+        """
         import csv
 
-        if not self.logs:
+        records = list(self.logs)
+        if not records:
             return
 
-        keys = self.logs[0].keys()
+        # Context fields differ between records, collect them all
+        keys = dict.fromkeys(records[0])
+        for record in records:
+            keys.update(dict.fromkeys(record))
 
         with open(filepath, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=keys)
+            writer = csv.DictWriter(f, fieldnames=list(keys), restval='')
             writer.writeheader()
-            writer.writerows(self.logs)
+            for record in records:
+                writer.writerow(record)
 
 
 def setup_logging(log_level: str = "INFO",
@@ -0,0 +1,250 @@
+"""
+Batched UDP I/O for GPS Position System.
+Uses Linux sendmmsg(2)/recvmmsg(2) to move many datagrams with one
+syscall, falls back to sendto()/recvfrom_into() loops on other platforms.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import socket
+import sys
+from typing import List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Upper bound for datagrams handed to the kernel per call
+MAX_BATCH = 100
+
+# Datagrams drained per readiness event by RecvBatch
+RECV_BATCH = 32
+
+
+class _IOVec(ctypes.Structure):
+    _fields_ = [
+        ('iov_base', ctypes.c_void_p),
+        ('iov_len', ctypes.c_size_t),
+    ]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ('msg_name', ctypes.c_void_p),
+        ('msg_namelen', ctypes.c_uint32),
+        ('msg_iov', ctypes.POINTER(_IOVec)),
+        ('msg_iovlen', ctypes.c_size_t),
+        ('msg_control', ctypes.c_void_p),
+        ('msg_controllen', ctypes.c_size_t),
+        ('msg_flags', ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [
+        ('msg_hdr', _MsgHdr),
+        ('msg_len', ctypes.c_uint),
+    ]
+
+
+class _SockAddrIn(ctypes.Structure):
+    _fields_ = [
+        ('sin_family', ctypes.c_ushort),
+        ('sin_port', ctypes.c_ubyte * 2),
+        ('sin_addr', ctypes.c_ubyte * 4),
+        ('sin_zero', ctypes.c_ubyte * 8),
+    ]
+
+
+def _load_sendmmsg():
+    """Look up sendmmsg in libc (Linux only)."""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        func = libc.sendmmsg
+    except (OSError, AttributeError):
+        return None
+    func.argtypes = [ctypes.c_int, ctypes.POINTER(_MMsgHdr),
+                     ctypes.c_uint, ctypes.c_int]
+    func.restype = ctypes.c_int
+    return func
+
+
+def _load_recvmmsg():
+    """Look up recvmmsg in libc (Linux only)."""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        func = libc.recvmmsg
+    except (OSError, AttributeError):
+        return None
+    func.argtypes = [ctypes.c_int, ctypes.POINTER(_MMsgHdr),
+                     ctypes.c_uint, ctypes.c_int, ctypes.c_void_p]
+    func.restype = ctypes.c_int
+    return func
+
+
+_sendmmsg = _load_sendmmsg()
+SENDMMSG_AVAILABLE = _sendmmsg is not None
+
+_recvmmsg = _load_recvmmsg()
+RECVMMSG_AVAILABLE = _recvmmsg is not None
+
+
+def _pack_sockaddr(addr: Tuple[str, int]) -> _SockAddrIn:
+    """Build a sockaddr_in for an IPv4 (host, port) tuple."""
+    sa = _SockAddrIn()
+    sa.sin_family = socket.AF_INET
+    sa.sin_port[:] = addr[1].to_bytes(2, 'big')
+    sa.sin_addr[:] = socket.inet_aton(addr[0])
+    return sa
+
+
+def send_batch(sock: socket.socket, payloads: Sequence[bytes],
+               addr: Optional[Tuple[str, int]] = None) -> int:
+    """
+    Send several datagrams, using one sendmmsg() call per MAX_BATCH.
+
+    Args:
+        sock: UDP socket (IPv4 for the sendmmsg path)
+        payloads: Datagram payloads
+        addr: Destination (host, port); None for a connected socket
+
+    Returns:
+        Number of datagrams sent
+
+    Raises:
+        OSError: If the kernel rejects the send
+    """
+    if not payloads:
+        return 0
+
+    if _sendmmsg is None or sock.family != socket.AF_INET:
+        for payload in payloads:
+            if addr is None:
+                sock.send(payload)
+            else:
+                sock.sendto(payload, addr)
+        return len(payloads)
+
+    sockaddr = _pack_sockaddr(addr) if addr is not None else None
+    sent = 0
+
+    while sent < len(payloads):
+        chunk = payloads[sent:sent + MAX_BATCH]
+        count = len(chunk)
+
+        # Keep buffers referenced until the call returns
+        buffers = [ctypes.create_string_buffer(p, len(p)) for p in chunk]
+        iovecs = (_IOVec * count)()
+        msgs = (_MMsgHdr * count)()
+
+        for i, buf in enumerate(buffers):
+            iovecs[i].iov_base = ctypes.addressof(buf)
+            iovecs[i].iov_len = len(chunk[i])
+            hdr = msgs[i].msg_hdr
+            hdr.msg_iov = ctypes.pointer(iovecs[i])
+            hdr.msg_iovlen = 1
+            if sockaddr is not None:
+                hdr.msg_name = ctypes.addressof(sockaddr)
+                hdr.msg_namelen = ctypes.sizeof(sockaddr)
+
+        result = _sendmmsg(sock.fileno(), msgs, count, 0)
+        if result < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+
+        sent += result
+
+    return sent
+
+
+class RecvBatch:
+    """
+    Preallocated buffers for draining a non-blocking UDP socket.
+
+    Each recv() call receives whatever datagrams are queued, up to the
+    batch size, with one recvmmsg() call on Linux (IPv4) or a
+    recvfrom_into() loop elsewhere. Buffers and kernel structures are set
+    up once and reused for every call.
+    """
+
+    def __init__(self, count: int = RECV_BATCH, size: int = 4096):
+        """
+        Initialize receive batch.
+
+        Args:
+            count: Maximum datagrams per recv() call
+            size: Buffer size per datagram
+        """
+        self.count = count
+        self.size = size
+        self.buffers = [bytearray(size) for _ in range(count)]
+        self._views = [memoryview(buf) for buf in self.buffers]
+
+        if _recvmmsg is None:
+            return
+
+        self._names = (_SockAddrIn * count)()
+        self._iovecs = (_IOVec * count)()
+        self._msgs = (_MMsgHdr * count)()
+        # ctypes views share memory with the bytearrays
+        self._c_buffers = [(ctypes.c_char * size).from_buffer(buf)
+                           for buf in self.buffers]
+
+        for i, c_buf in enumerate(self._c_buffers):
+            self._iovecs[i].iov_base = ctypes.addressof(c_buf)
+            self._iovecs[i].iov_len = size
+            hdr = self._msgs[i].msg_hdr
+            hdr.msg_iov = ctypes.pointer(self._iovecs[i])
+            hdr.msg_iovlen = 1
+            hdr.msg_name = ctypes.addressof(self._names[i])
+
+    def recv(self, sock: socket.socket) -> List[Tuple[memoryview, Tuple[str, int]]]:
+        """
+        Receive all queued datagrams, up to the batch size.
+
+        The returned views point into the batch buffers and are only valid
+        until the next call.
+
+        Args:
+            sock: Non-blocking UDP socket (IPv4 for the recvmmsg path)
+
+        Returns:
+            List of (data, (host, port)); empty if nothing is queued
+
+        Raises:
+            OSError: If the kernel reports an error other than EAGAIN
+        """
+        if _recvmmsg is None or sock.family != socket.AF_INET:
+            received = []
+            for view in self._views:
+                try:
+                    nbytes, addr = sock.recvfrom_into(view)
+                except BlockingIOError:
+                    break
+                received.append((view[:nbytes], addr))
+            return received
+
+        name_len = ctypes.sizeof(_SockAddrIn)
+        for msg in self._msgs:
+            msg.msg_hdr.msg_namelen = name_len
+
+        result = _recvmmsg(sock.fileno(), self._msgs, self.count,
+                           socket.MSG_DONTWAIT, None)
+        if result < 0:
+            err = ctypes.get_errno()
+            if err in (errno.EAGAIN, errno.EWOULDBLOCK):
+                return []
+            raise OSError(err, os.strerror(err))
+
+        received = []
+        for i in range(result):
+            name = self._names[i]
+            addr = (socket.inet_ntoa(bytes(name.sin_addr)),
+                    int.from_bytes(bytes(name.sin_port), 'big'))
+            received.append((self._views[i][:self._msgs[i].msg_len], addr))
+        return received
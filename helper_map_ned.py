@@ -132,23 +132,16 @@ def __nRe__(lat, lon):
 
     
 def __degree2DegreeMinuteAux__(value):
-    val = str(value).split('.')
-    minute = float('0.' + val[1]) * 60.0
-    if minute < 10.0:
-        return float(val[0] + '0' + str(minute))
-    else:
-        return float(val[0] + str(minute))
+    """ Transform DDD.DD to DDDMM.MM """
+    degree = int(value)
+    minute = (value - degree) * 60.0
+    return degree * 100 + minute
         
 
 def __splitDegreeMinutes__(value):
     """ Transform DDDMM.MM to DDD, MM.MM """
-    val = str(value).split('.')
-    val_min = val[0][-2] + val[0][-1] + '.' + val[1]
-    val_deg = ''
-    for i in range(len(val[0])-2): 
-        val_deg = val_deg + val[0][i]
-        
-    return int(val_deg), float(val_min) 
+    degree = int(value / 100)
+    return degree, value - degree * 100
 
     
 if __name__ == '__main__':
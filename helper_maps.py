@@ -4,6 +4,22 @@ import requests
 from io import BytesIO
 from PIL import Image
 
+OSM_TILE_URL = "http://a.tile.openstreetmap.org/%d/%d/%d.png"
+HEADERS = {"User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_4) "
+                         "AppleWebKit/537.36 (KHTML, like Gecko) "
+                         "Chrome/83.0.4103.97 Safari/537.36"}
+
+# created on first use, keeps the connection to the tile server alive
+_session = None
+
+
+def get_session():
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        _session.headers.update(HEADERS)
+    return _session
+
 
 def deg2num(lat_deg, lon_deg, zoom):
     lat_rad = math.radians(lat_deg)
@@ -21,24 +37,45 @@ def num2deg(x_tile, y_tile, zoom):
     return lat_deg, lon_deg
 
 
+def deg2num_np(lat_deg, lon_deg, zoom):
+    # array version of deg2num, e.g. for all fixes of a track at once
+    lat_rad = np.radians(lat_deg)
+    n = float(1 << zoom)
+    x_tile = np.floor((np.asarray(lon_deg) + 180.0) / 360.0 * n).astype(np.int64)
+    y_tile = np.floor(
+        (1.0 - np.log(np.tan(lat_rad) + 1.0 / np.cos(lat_rad)) / np.pi) / 2.0 * n
+    ).astype(np.int64)
+    return x_tile, y_tile
+
+
+def num2deg_np(x_tile, y_tile, zoom):
+    # array version of num2deg
+    n = float(1 << zoom)
+    lon_deg = np.asarray(x_tile) / n * 360.0 - 180.0
+    lat_deg = np.degrees(np.arctan(np.sinh(np.pi * (1 - 2 * np.asarray(y_tile) / n))))
+    return lat_deg, lon_deg
+
+
 def get_image_osm_tile(lat_deg, lon_deg, delta_lat, delta_long, zoom):
-    headers = {"User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_4) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/83.0.4103.97 Safari/537.36"}
-    osm_url = r"http://a.tile.openstreetmap.org/{0}/{1}/{2}.png"
+    session = get_session()
     x_min, y_max = deg2num(lat_deg, lon_deg, zoom)
     x_max, y_min = deg2num(lat_deg + delta_lat, lon_deg + delta_long, zoom)
 
-    img = Image.new('RGB', ((x_max - x_min + 1) * 256 - 1, (y_max - y_min + 1) * 256 - 1))
+    # tiles are copied straight into one RGB array, missing tiles stay black
+    canvas = np.zeros(((y_max - y_min + 1) * 256, (x_max - x_min + 1) * 256, 3), dtype=np.uint8)
     for x_tile in range(x_min, x_max + 1):
         for y_tile in range(y_min, y_max + 1):
             try:
-                img_url = osm_url.format(zoom, x_tile, y_tile)
+                img_url = OSM_TILE_URL % (zoom, x_tile, y_tile)
                 print("Opening: " + img_url)
-                img_str = requests.get(img_url, headers=headers)
-                tile = Image.open(BytesIO(img_str.content))
-                img.paste(tile, box=((x_tile - x_min) * 256, (y_tile - y_min) * 255))
+                img_str = session.get(img_url)
+                tile = np.asarray(Image.open(BytesIO(img_str.content)).convert('RGB'))
+                y_0 = (y_tile - y_min) * 256
+                x_0 = (x_tile - x_min) * 256
+                canvas[y_0:y_0 + 256, x_0:x_0 + 256] = tile
             except Exception as e:
                 print("Couldn't download image because of {}".format(e))
-    return img
+    return Image.fromarray(canvas)
 
 
 if __name__ == '__main__':
@@ -5,17 +5,112 @@ Provides robust validation and error handling for NMEA data.
 
 import re
 import logging
-from typing import Optional, Dict, Any
+from datetime import datetime, time as dt_time, timezone
+from typing import Any, Dict, NamedTuple, Optional, Sequence, Tuple, Union
+import numpy as np
 import pynmea2
 
 logger = logging.getLogger(__name__)
 
+# Optional PositionInfo sources on pynmea2 sentences and their defaults
+_POSITION_FIELDS = {
+    'lat_dir': 'N',
+    'lon_dir': 'E',
+    'timestamp': None,
+    'altitude': None,
+    'num_sats': None,
+    'gps_qual': None,
+}
+
+# Sentence class -> optional fields it provides, None if it has no position
+_FIELDS_CACHE: Dict[type, Optional[Tuple[str, ...]]] = {}
+
+
+def _hex_pairs() -> Dict[Union[str, bytes], int]:
+    """Map every two-digit hex string (any case, str and bytes) to its value."""
+    pairs = {}
+    for value in range(256):
+        high, low = '%X' % (value >> 4), '%X' % (value & 15)
+        for digits in (high + low, high.lower() + low, high + low.lower(),
+                       (high + low).lower()):
+            pairs[digits] = value
+            pairs[digits.encode('ascii')] = value
+    return pairs
+
+
+# Checksum digits to value, for validate_checksum
+_HEX_BYTE = _hex_pairs()
+
+# Zero-padded two-digit fields (time, date, latitude degrees) as bytes
+_TWO_DIGITS = tuple(b'%02d' % i for i in range(100))
+
+
+def xor_checksum(data: bytes) -> int:
+    """
+    XOR of all bytes in data.
+
+    Loads the bytes into one integer and folds it in halves, so the
+    reduction takes log2(len) big-integer operations in C instead of one
+    interpreter step per byte.
+
+    Args:
+        data: Bytes to reduce
+
+    Returns:
+        Checksum value (0-255)
+    """
+    value = int.from_bytes(data, 'little')
+    # Largest power-of-two byte count below len(data), in bits
+    shift = 4 << (len(data) - 1).bit_length() if len(data) > 1 else 0
+    while shift >= 8:
+        value ^= value >> shift
+        shift >>= 1
+    return value & 0xFF
+
+
+def _byte_table(chars: bytes, values: Optional[Sequence[int]] = None,
+                fill: int = 0) -> np.ndarray:
+    """Lookup table over all byte values, set for the given characters."""
+    table = np.full(256, fill, dtype=np.int16)
+    table[np.frombuffer(chars, dtype=np.uint8)] = 1 if values is None else values
+    return table
+
+
+# Byte classes for validate_batch
+_HEX_VALUE = _byte_table(b'0123456789ABCDEFabcdef',
+                         values=list(range(16)) + list(range(10, 16)), fill=-1)
+_IS_ALPHA = _byte_table(b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz').astype(bool)
+
 
 class NMEAValidationError(Exception):
     """Raised when NMEA sentence validation fails."""
     pass
 
 
+class PositionInfo(NamedTuple):
+    """
+    Position fields extracted from an NMEA sentence.
+
+    Attributes:
+        latitude: Signed latitude in decimal degrees
+        longitude: Signed longitude in decimal degrees
+        lat_dir: Latitude hemisphere ('N' or 'S')
+        lon_dir: Longitude hemisphere ('E' or 'W')
+        timestamp: UTC time of fix (optional)
+        altitude: Altitude in meters (optional)
+        num_satellites: Number of satellites in use (optional)
+        gps_quality: GPS fix quality indicator (optional)
+    """
+    latitude: float
+    longitude: float
+    lat_dir: str = 'N'
+    lon_dir: str = 'E'
+    timestamp: Optional[Any] = None
+    altitude: Optional[float] = None
+    num_satellites: Optional[int] = None
+    gps_quality: Optional[int] = None
+
+
 class NMEAValidator:
     """
     Validates and parses NMEA sentences.
@@ -24,29 +119,51 @@ class NMEAValidator:
     with detailed error reporting.
     """
 
-    # NMEA sentence pattern: $XXYYY,data*CC
+    # NMEA sentence pattern: $XXYYY,data*CC, trailing whitespace (CR/LF)
+    # is matched instead of stripped to avoid a copy per sentence.
+    # Explicit case classes instead of IGNORECASE: ASCII only and no
+    # case folding per character. A hand-written field check was measured
+    # at twice the cost of this single anchored match.
+    # The group holds the checksum digits, its start locates the '*'.
     NMEA_PATTERN = re.compile(
-        r'^\$[A-Z]{2}[A-Z]{3},[^*]*\*[0-9A-F]{2}$',
-        re.IGNORECASE
+        r'\$[A-Za-z]{5},[^*]*\*([0-9A-Fa-f]{2})\s*\Z'
+    )
+    NMEA_PATTERN_B = re.compile(
+        rb'\$[A-Za-z]{5},[^*]*\*([0-9A-Fa-f]{2})\s*\Z'
+    )
+
+    # Fast-path patterns for the position sentences we receive most often.
+    # They only match well-formed fixes; anything else goes through pynmea2.
+    RMC_PATTERN = re.compile(
+        r'^\$[A-Z]{2}RMC,(\d{6}(?:\.\d*)?)?,A,'
+        r'(\d{4,5}\.\d+),([NS]),(\d{5}\.\d+),([EW]),'
+    )
+    GGA_PATTERN = re.compile(
+        r'^\$[A-Z]{2}GGA,(\d{6}(?:\.\d*)?)?,'
+        r'(\d{4,5}\.\d+),([NS]),(\d{5}\.\d+),([EW]),'
+        r'([0-8]),(\d*),[^,]*,(-?\d+(?:\.\d*)?)?,'
     )
 
     # Supported sentence types for GPS
-    SUPPORTED_SENTENCES = {
+    SUPPORTED_SENTENCES = frozenset({
         'GPRMC',  # Recommended Minimum Specific GPS/Transit Data
         'GPGGA',  # Global Positioning System Fix Data
         'GPGLL',  # Geographic Position - Latitude/Longitude
         'GPGSA',  # GPS DOP and Active Satellites
         'GPGSV',  # GPS Satellites in View
         'GPVTG',  # Track Made Good and Ground Speed
-    }
+    })
+    # Same set in on-wire form, for probing raw datagrams
+    SUPPORTED_SENTENCES_B = frozenset(s.encode('ascii') for s in SUPPORTED_SENTENCES)
 
     @staticmethod
-    def calculate_checksum(sentence: str) -> str:
+    def calculate_checksum(sentence: Union[str, bytes]) -> str:
         """
         Calculate NMEA checksum for sentence.
 
         Args:
-            sentence: NMEA sentence without $ and *checksum
+            sentence: NMEA sentence without $ and *checksum, as text or
+                raw bytes
 
         Returns:
             Two-character hex checksum
@@ -55,18 +172,18 @@ class NMEAValidator:
             >>> NMEAValidator.calculate_checksum('GPRMC,123456.00,A,4807.404,N')
             '3F'
         """
-        checksum = 0
-        for char in sentence:
-            checksum ^= ord(char)
-        return f"{checksum:02X}"
+        if not isinstance(sentence, bytes):
+            sentence = sentence.encode('ascii')
+        return "%02X" % xor_checksum(sentence)
 
     @staticmethod
-    def validate_checksum(nmea_string: str) -> bool:
+    def validate_checksum(nmea_string: Union[str, bytes]) -> bool:
         """
         Verify NMEA sentence checksum.
 
         Args:
-            nmea_string: Complete NMEA sentence with checksum
+            nmea_string: Complete NMEA sentence with checksum, as text or
+                raw bytes
 
         Returns:
             True if checksum is valid
@@ -75,40 +192,83 @@ class NMEAValidator:
             >>> NMEAValidator.validate_checksum('$GPRMC,data*3F')
             True
         """
-        if '*' not in nmea_string:
+        star = nmea_string.rfind(b'*' if isinstance(nmea_string, bytes) else '*')
+        if star < 0:
             logger.warning("NMEA sentence missing checksum")
             return False
 
-        try:
-            # Split sentence and checksum
-            sentence, provided_checksum = nmea_string.split('*')
+        # Body between optional '$' and '*', checksum digits after it;
+        # slicing ignores trailing CR/LF without splitting the sentence
+        start = 1 if nmea_string[:1] in ('$', b'$') else 0
+        return NMEAValidator._checksum_matches(nmea_string[start:star],
+                                               nmea_string[star + 1:star + 3])
+
+    @staticmethod
+    def _checksum_matches(body: Union[str, bytes], digits: Union[str, bytes]) -> bool:
+        """
+        Compare the checksum of a sentence body with its checksum digits.
+
+        Args:
+            body: Sentence between '$' and '*'
+            digits: Provided checksum digits
 
-            # Remove leading $
-            if sentence.startswith('$'):
-                sentence = sentence[1:]
+        Returns:
+            True if they match
+        """
+        if not isinstance(body, bytes):
+            try:
+                body = body.encode('ascii')
+            except UnicodeEncodeError:
+                logger.debug("Non-ASCII characters in NMEA sentence")
+                return False
 
-            # Calculate expected checksum
-            calculated_checksum = NMEAValidator.calculate_checksum(sentence)
+        # Compare as integers; the table lookup also rejects anything that
+        # is not exactly two hex digits (any case)
+        return _HEX_BYTE.get(digits) == xor_checksum(body)
 
-            # Compare (case-insensitive)
-            return calculated_checksum.upper() == provided_checksum.upper()
+    @staticmethod
+    def _scan_header(nmea_string: Union[str, bytes]) -> Optional[Tuple[Union[str, bytes], int]]:
+        """
+        Check the format and locate the checksum with one regex scan.
 
-        except ValueError as e:
-            logger.error(f"Error parsing checksum: {e}")
-            return False
+        Args:
+            nmea_string: NMEA sentence, as text or raw bytes
+
+        Returns:
+            Tuple of (sentence without leading whitespace, position of '*'
+            in it), or None if the format is invalid. The sentence type is
+            sentence[1:6], the checksum digits follow the '*'.
+        """
+        if isinstance(nmea_string, bytes):
+            pattern = NMEAValidator.NMEA_PATTERN_B
+            start = b'$'
+        else:
+            pattern = NMEAValidator.NMEA_PATTERN
+            start = '$'
+
+        if not nmea_string.startswith(start):
+            # Only copy for the rare case of leading whitespace
+            nmea_string = nmea_string.lstrip()
+            if not nmea_string.startswith(start):
+                return None
+
+        match = pattern.match(nmea_string)
+        if match is None:
+            return None
+        return nmea_string, match.start(1) - 1
 
     @staticmethod
-    def validate_format(nmea_string: str) -> bool:
+    def validate_format(nmea_string: Union[str, bytes]) -> bool:
         """
         Validate NMEA sentence format.
 
         Args:
-            nmea_string: NMEA sentence to validate
+            nmea_string: NMEA sentence to validate, as text or raw bytes
 
         Returns:
             True if format is valid
         """
-        return bool(NMEAValidator.NMEA_PATTERN.match(nmea_string.strip()))
+        return NMEAValidator._scan_header(nmea_string) is not None
 
     @staticmethod
     def get_sentence_type(nmea_string: str) -> Optional[str]:
@@ -121,27 +281,30 @@ class NMEAValidator:
         Returns:
             Sentence type (e.g., 'GPRMC') or None if invalid
         """
-        try:
-            if nmea_string.startswith('$'):
-                # Extract sentence type (first 6 characters after $)
-                return nmea_string[1:7].upper()
-        except IndexError:
-            pass
+        if nmea_string.startswith('$') and len(nmea_string) >= 6:
+            # Talker and sentence id, the 5 characters after $
+            return nmea_string[1:6].upper()
         return None
 
     @staticmethod
-    def is_supported_sentence(nmea_string: str) -> bool:
+    def is_supported_sentence(nmea_string: Union[str, bytes]) -> bool:
         """
         Check if sentence type is supported.
 
+        Probes the five address characters directly against the on-wire
+        (upper case) names, without extracting or normalizing them.
+
         Args:
-            nmea_string: NMEA sentence
+            nmea_string: NMEA sentence, as text or raw bytes
 
         Returns:
             True if sentence type is supported
         """
-        sentence_type = NMEAValidator.get_sentence_type(nmea_string)
-        return sentence_type in NMEAValidator.SUPPORTED_SENTENCES
+        if isinstance(nmea_string, bytes):
+            return (nmea_string[:1] == b'$'
+                    and nmea_string[1:6] in NMEAValidator.SUPPORTED_SENTENCES_B)
+        return (nmea_string[:1] == '$'
+                and nmea_string[1:6] in NMEAValidator.SUPPORTED_SENTENCES)
 
     @staticmethod
     def is_valid_nmea(nmea_string: str, check_checksum: bool = True) -> bool:
@@ -155,18 +318,85 @@ class NMEAValidator:
         Returns:
             True if sentence is valid
         """
-        # Check format
-        if not NMEAValidator.validate_format(nmea_string):
-            logger.debug(f"Invalid NMEA format: {nmea_string}")
+        # Check format, the same scan locates the checksum
+        header = NMEAValidator._scan_header(nmea_string)
+        if header is None:
+            logger.debug("Invalid NMEA format: %s", nmea_string)
             return False
 
         # Check checksum if requested
-        if check_checksum and not NMEAValidator.validate_checksum(nmea_string):
-            logger.debug(f"Invalid NMEA checksum: {nmea_string}")
-            return False
+        if check_checksum:
+            sentence, star = header
+            if not NMEAValidator._checksum_matches(sentence[1:star],
+                                                   sentence[star + 1:star + 3]):
+                logger.debug("Invalid NMEA checksum: %s", nmea_string)
+                return False
 
         return True
 
+    @staticmethod
+    def validate_batch(sentences: Sequence[Union[str, bytes]]) -> np.ndarray:
+        """
+        Validate format and checksum of many sentences at once.
+
+        Packs the sentences into one zero-padded uint8 matrix and checks all
+        of them with array operations, so the per-sentence cost is only the
+        packing. Same result as is_valid_nmea() except that leading
+        whitespace is not accepted.
+
+        Args:
+            sentences: NMEA sentences as text or raw bytes
+
+        Returns:
+            Boolean array, True where the sentence is valid
+        """
+        n = len(sentences)
+        if n == 0:
+            return np.zeros(0, dtype=bool)
+
+        data = []
+        encodable = np.ones(n, dtype=bool)
+        for i, sentence in enumerate(sentences):
+            if isinstance(sentence, str):
+                try:
+                    sentence = sentence.encode('ascii')
+                except UnicodeEncodeError:
+                    encodable[i] = False
+                    sentence = b''
+            data.append(sentence)
+
+        # Fixed-width bytes rows, zero padded; the padding leaves room to
+        # read the two checksum digits and the header of short rows
+        lengths = np.fromiter(map(len, data), dtype=np.int64, count=n)
+        width = max(int(lengths.max()) + 3, 8)
+        arr = np.array(data, dtype='S%d' % width).view(np.uint8).reshape(n, width)
+
+        # Header: '$', five letters, ','
+        valid = encodable & (arr[:, 0] == 36) & (arr[:, 6] == 44)
+        valid &= _IS_ALPHA[arr[:, 1:6]].all(axis=1)
+
+        # First '*' ends the body, two hex digits follow
+        is_star = arr == 42
+        valid &= is_star.any(axis=1)
+        star = is_star.argmax(axis=1)
+        index = np.arange(n)
+        high = _HEX_VALUE[arr[index, star + 1]]
+        low = _HEX_VALUE[arr[index, star + 2]]
+        valid &= (high >= 0) & (low >= 0)
+
+        # Only whitespace may follow the checksum
+        cols = np.arange(width)
+        tail = (cols >= star[:, None] + 3) & (cols < lengths[:, None])
+        is_space = (arr == 32) | ((arr >= 9) & (arr <= 13))
+        valid &= ~(tail & ~is_space).any(axis=1)
+
+        # XOR over everything between '$' and '*'
+        body = (cols > 0) & (cols < star[:, None])
+        checksum = np.bitwise_xor.reduce(np.where(body, arr, 0), axis=1)
+        valid &= checksum == high * 16 + low
+
+        return valid
+
     @staticmethod
     def safe_parse(nmea_string: str, validate: bool = True) -> Optional[pynmea2.NMEASentence]:
         """
@@ -180,70 +410,133 @@ class NMEAValidator:
             Parsed NMEA sentence object or None if parsing fails
         """
         try:
-            # Validate if requested
-            if validate and not NMEAValidator.is_valid_nmea(nmea_string):
-                logger.warning(f"NMEA validation failed: {nmea_string}")
+            # Validate if requested. pynmea2 verifies the checksum while
+            # parsing, so only the format is checked here; check=True makes
+            # it reject sentences without one.
+            if validate and not NMEAValidator.validate_format(nmea_string):
+                logger.warning("NMEA validation failed: %s", nmea_string)
                 return None
 
             # Parse sentence
-            parsed = pynmea2.parse(nmea_string.strip())
+            try:
+                parsed = pynmea2.parse(nmea_string.strip(), check=validate)
+            except pynmea2.ChecksumError:
+                logger.warning("NMEA validation failed: %s", nmea_string)
+                return None
 
-            # Additional validation for position data
-            if hasattr(parsed, 'latitude') and hasattr(parsed, 'longitude'):
-                if not NMEAValidator._validate_position_data(parsed):
-                    logger.warning(f"Invalid position data in NMEA: {nmea_string}")
+            # Additional validation for position data, read each coordinate
+            # once; sentences without position raise AttributeError
+            try:
+                lat = parsed.latitude
+                lon = parsed.longitude
+            except AttributeError:
+                pass
+            else:
+                if (lat is None or lon is None
+                        or not (abs(lat) <= 90.0 and abs(lon) <= 180.0)):
+                    logger.warning("Invalid position data in NMEA: %s", nmea_string)
                     return None
 
             return parsed
 
         except pynmea2.ParseError as e:
-            logger.error(f"NMEA parse error: {e}")
+            logger.error("NMEA parse error: %s", e)
             return None
         except Exception as e:
-            logger.error(f"Unexpected error parsing NMEA: {e}")
+            logger.error("Unexpected error parsing NMEA: %s", e)
             return None
 
     @staticmethod
-    def _validate_position_data(parsed: pynmea2.NMEASentence) -> bool:
+    def parse_position(nmea_string: str, validate: bool = True) -> Optional[PositionInfo]:
         """
-        Validate position data in parsed NMEA sentence.
+        Fast-path position extraction for RMC and GGA sentences.
+
+        Uses precompiled regular expressions instead of pynmea2 and returns
+        the same PositionInfo as extract_position_info().
 
         Args:
-            parsed: Parsed NMEA sentence
+            nmea_string: NMEA sentence to parse
+            validate: Whether to verify the checksum
 
         Returns:
-            True if position data is valid
+            Position info, or None if the sentence is not a valid RMC/GGA
+            fix (callers should then fall back to safe_parse)
         """
-        try:
-            # Check if position fields exist
-            if not hasattr(parsed, 'latitude') or not hasattr(parsed, 'longitude'):
-                return True  # No position data to validate
+        nmea_string = nmea_string.strip()
+        if len(nmea_string) < 7:
+            return None
 
-            # Get latitude and longitude
-            lat = parsed.latitude
-            lon = parsed.longitude
+        sentence_id = nmea_string[3:6]
+        if sentence_id == 'RMC':
+            match = NMEAValidator.RMC_PATTERN.match(nmea_string)
+        elif sentence_id == 'GGA':
+            match = NMEAValidator.GGA_PATTERN.match(nmea_string)
+        else:
+            return None
 
-            # Check for None values
-            if lat is None or lon is None:
-                return False
+        if match is None:
+            return None
+        if validate and not NMEAValidator.validate_checksum(nmea_string):
+            return None
 
-            # Validate ranges
-            if not (-90.0 <= lat <= 90.0):
-                logger.warning(f"Latitude out of range: {lat}")
-                return False
+        groups = match.groups()
+        time_str, lat_str, lat_dir, lon_str, lon_dir = groups[:5]
 
-            if not (-180.0 <= lon <= 180.0):
-                logger.warning(f"Longitude out of range: {lon}")
-                return False
+        latitude = NMEAValidator._dm_to_decimal(lat_str)
+        longitude = NMEAValidator._dm_to_decimal(lon_str)
+        if lat_dir == 'S':
+            latitude = -latitude
+        if lon_dir == 'W':
+            longitude = -longitude
 
-            return True
+        if not (abs(latitude) <= 90.0 and abs(longitude) <= 180.0):
+            logger.warning("Invalid position data in NMEA: %s", nmea_string)
+            return None
 
-        except (AttributeError, TypeError, ValueError) as e:
-            logger.error(f"Error validating position data: {e}")
-            return False
+        timestamp = NMEAValidator._parse_time(time_str)
+
+        if sentence_id == 'GGA':
+            quality, sats, altitude = groups[5:]
+            return PositionInfo(latitude, longitude, lat_dir, lon_dir, timestamp,
+                                float(altitude) if altitude else None,
+                                int(sats) if sats else None,
+                                int(quality))
+
+        return PositionInfo(latitude, longitude, lat_dir, lon_dir, timestamp)
+
+    @staticmethod
+    def _dm_to_decimal(value: str) -> float:
+        """
+        Convert NMEA (d)ddmm.mmmm string to decimal degrees.
+
+        Args:
+            value: Degrees and minutes string
+
+        Returns:
+            Decimal degrees
+        """
+        split = value.index('.') - 2
+        return int(value[:split]) + float(value[split:]) / 60.0
+
+    @staticmethod
+    def _parse_time(value: Optional[str]) -> Optional[dt_time]:
+        """
+        Convert NMEA hhmmss(.ss) string to time object.
+
+        Args:
+            value: Time string or None
+
+        Returns:
+            Time object or None if not present
+        """
+        if not value:
+            return None
+        microsecond = int(float(value[6:]) * 1000000) if len(value) > 7 else 0
+        return dt_time(int(value[0:2]), int(value[2:4]), int(value[4:6]), microsecond,
+                       tzinfo=timezone.utc)
 
     @staticmethod
-    def extract_position_info(parsed: pynmea2.NMEASentence) -> Optional[Dict[str, Any]]:
+    def extract_position_info(parsed: pynmea2.NMEASentence) -> Optional[PositionInfo]:
         """
         Extract position information from parsed NMEA sentence.
 
@@ -251,37 +544,56 @@ class NMEAValidator:
             parsed: Parsed NMEA sentence
 
         Returns:
-            Dictionary with position info or None if not available
+            Position info or None if not available
         """
-        if not hasattr(parsed, 'latitude') or not hasattr(parsed, 'longitude'):
+        # The available fields are fixed per sentence class, look them up
+        # once instead of probing each sentence with hasattr()
+        cls = type(parsed)
+        try:
+            fields = _FIELDS_CACHE[cls]
+        except KeyError:
+            fields = _FIELDS_CACHE[cls] = NMEAValidator._position_fields(cls)
+        if fields is None:
             return None
 
         try:
-            info = {
-                'latitude': parsed.latitude,
-                'longitude': parsed.longitude,
-                'lat_dir': getattr(parsed, 'lat_dir', 'N'),
-                'lon_dir': getattr(parsed, 'lon_dir', 'E'),
-            }
-
-            # Add optional fields if available
-            if hasattr(parsed, 'timestamp'):
-                info['timestamp'] = parsed.timestamp
+            values = _POSITION_FIELDS.copy()
+            for name in fields:
+                values[name] = getattr(parsed, name)
+            num_sats = values['num_sats']
+
+            return PositionInfo(
+                latitude=parsed.latitude,
+                longitude=parsed.longitude,
+                lat_dir=values['lat_dir'],
+                lon_dir=values['lon_dir'],
+                timestamp=values['timestamp'],
+                altitude=values['altitude'],
+                num_satellites=int(num_sats) if num_sats else None,
+                gps_quality=values['gps_qual']
+            )
 
-            if hasattr(parsed, 'altitude'):
-                info['altitude'] = parsed.altitude
-
-            if hasattr(parsed, 'num_sats'):
-                info['num_satellites'] = parsed.num_sats
+        except Exception as e:
+            logger.error("Error extracting position info: %s", e)
+            return None
 
-            if hasattr(parsed, 'gps_qual'):
-                info['gps_quality'] = parsed.gps_qual
+    @staticmethod
+    def _position_fields(cls: type) -> Optional[Tuple[str, ...]]:
+        """
+        Determine which position fields a sentence class provides.
 
-            return info
+        Args:
+            cls: pynmea2 sentence class
 
-        except Exception as e:
-            logger.error(f"Error extracting position info: {e}")
+        Returns:
+            Names from _POSITION_FIELDS the class has, or None if it has
+            no latitude/longitude
+        """
+        if not hasattr(cls, 'latitude') or not hasattr(cls, 'longitude'):
             return None
+        name_to_idx = getattr(cls, 'name_to_idx', {})
+        return tuple(name for name in _POSITION_FIELDS
+                     if name in name_to_idx or hasattr(cls, name))
 
 
 class NMEAGenerator:
@@ -306,36 +618,54 @@ class NMEAGenerator:
         Returns:
             Complete NMEA RMC sentence with checksum
         """
-        import datetime
-
-        if timestamp is None:
-            timestamp = datetime.datetime.utcnow()
-        if date is None:
-            date = datetime.datetime.utcnow()
-
-        # Convert coordinates to NMEA format
-        lat_deg = int(abs(latitude))
-        lat_min = (abs(latitude) - lat_deg) * 60
-        lat_nmea = f"{lat_deg:02d}{lat_min:07.4f}"
-        lat_dir = 'N' if latitude >= 0 else 'S'
+        # Single %-template shared with the bytes variant
+        return NMEAGenerator.generate_rmc_bytes(
+            latitude, longitude, timestamp, speed, course, date
+        ).decode('ascii')
 
-        lon_deg = int(abs(longitude))
-        lon_min = (abs(longitude) - lon_deg) * 60
-        lon_nmea = f"{lon_deg:03d}{lon_min:07.4f}"
-        lon_dir = 'E' if longitude >= 0 else 'W'
-
-        # Format time and date
-        time_str = timestamp.strftime("%H%M%S.%f")[:9]
-        date_str = date.strftime("%d%m%y")
+    @staticmethod
+    def generate_rmc_bytes(latitude: float, longitude: float,
+                           timestamp: Optional[Any] = None,
+                           speed: float = 0.0, course: float = 0.0,
+                           date: Optional[Any] = None) -> bytes:
+        """
+        Generate GPRMC sentence directly as ASCII bytes.
 
-        # Build sentence (without $ and checksum)
-        sentence = (f"GPRMC,{time_str},A,{lat_nmea},{lat_dir},{lon_nmea},{lon_dir},"
-                    f"{speed:.1f},{course:.1f},{date_str},,A")
+        Formats with a fixed %-template and XORs the checksum over the
+        body bytes, so senders can write the result straight to a socket.
 
-        # Calculate and append checksum
-        checksum = NMEAValidator.calculate_checksum(sentence)
+        Args:
+            latitude: Latitude in decimal degrees
+            longitude: Longitude in decimal degrees
+            timestamp: Time (datetime object or None for current)
+            speed: Speed over ground in knots
+            course: Course over ground in degrees
+            date: Date (datetime object or None for current)
 
-        return f"${sentence}*{checksum}"
+        Returns:
+            Complete NMEA RMC sentence with checksum
+        """
+        if timestamp is None:
+            timestamp = datetime.utcnow()
+        if date is None:
+            date = timestamp
+
+        abs_lat = abs(latitude)
+        lat_deg = int(abs_lat)
+        abs_lon = abs(longitude)
+        lon_deg = int(abs_lon)
+
+        digits = _TWO_DIGITS
+        body = b"GPRMC,%s%s%s.%s,A,%s%07.4f,%s,%03d%07.4f,%s,%.1f,%.1f,%s%s%s,,A" % (
+            digits[timestamp.hour], digits[timestamp.minute], digits[timestamp.second],
+            digits[timestamp.microsecond // 10000],
+            digits[lat_deg], (abs_lat - lat_deg) * 60, b'N' if latitude >= 0 else b'S',
+            lon_deg, (abs_lon - lon_deg) * 60, b'E' if longitude >= 0 else b'W',
+            speed, course,
+            digits[date.day], digits[date.month], digits[date.year % 100]
+        )
+
+        return b"$%s*%02X" % (body, xor_checksum(body))
 
 
 if __name__ == "__main__":
@@ -1,11 +1,82 @@
 """Example: Recording GPS data with async receiver."""
 
 import asyncio
+import time
+import numpy as np
+import pynmea2
 from gps_network_async import AsyncNMEAReceiver
 from gps_data_csv_storage import GPSDataCSVStorage
+from gps_kernels import NUMBA_AVAILABLE, validate_positions_batch
 from gps_structured_logging import setup_logging
 from nmea_validator import NMEAValidator
-from datetime import datetime
+
+# Sentences are validated in batches of up to BATCH_SIZE, or whatever
+# arrived within BATCH_INTERVAL seconds
+BATCH_SIZE = 64
+BATCH_INTERVAL = 0.005
+
+# Initial capacity of the recorded position columns, doubled when full
+MAX_POSITIONS = 4096
+
+# Stored for missing satellite count / fix quality
+MISSING = -1
+
+
+def _utc_offsets_ns(stamps: np.ndarray):
+    """Local UTC offset in ns for epoch-ns stamps, matching the naive local
+    times the other writers produce (per stamp only if DST changes inside)."""
+    if stamps.size == 0:
+        return 0
+    first, last = (time.localtime(int(stamps[i]) // 1_000_000_000).tm_gmtoff for i in (0, -1))
+    if first == last:
+        return np.int64(first) * 1_000_000_000
+    return np.array([time.localtime(int(t) // 1_000_000_000).tm_gmtoff for t in stamps],
+                    dtype=np.int64) * 1_000_000_000
+
+
+class PositionColumns:
+    """Recorded positions as preallocated NumPy columns, filled up to count."""
+
+    DTYPES = {
+        'timestamp': np.int64,  # epoch ns
+        'latitude': np.float64,
+        'longitude': np.float64,
+        'altitude': np.float32,
+        'satellites': np.int16,
+        'quality': np.int8,
+    }
+
+    def __init__(self, capacity: int = MAX_POSITIONS):
+        self.count = 0
+        self.arrays = {name: np.empty(capacity, dtype=dtype)
+                       for name, dtype in self.DTYPES.items()}
+
+    def extend(self, **values) -> None:
+        """Append equally long arrays, one per column."""
+        n = len(values['timestamp'])
+        end = self.count + n
+        capacity = len(self.arrays['timestamp'])
+        if end > capacity:
+            capacity = max(capacity * 2, end)
+            for name, array in self.arrays.items():
+                grown = np.empty(capacity, dtype=array.dtype)
+                grown[:self.count] = array[:self.count]
+                self.arrays[name] = grown
+
+        for name, value in values.items():
+            self.arrays[name][self.count:end] = value
+        self.count = end
+
+    def to_columns(self) -> dict:
+        """Filled part as save_positions() columns, ISO (local time) timestamps."""
+        columns = {name: array[:self.count] for name, array in self.arrays.items()}
+        stamps = columns['timestamp']
+        columns['timestamp'] = (stamps + _utc_offsets_ns(stamps)).astype('datetime64[ns]') \
+            .astype('datetime64[us]').astype(str)
+        for name in ('satellites', 'quality'):
+            column = columns[name]
+            columns[name] = np.where(column == MISSING, None, column)
+        return columns
 
 
 async def main():
@@ -15,32 +86,79 @@ async def main():
     # Initialize receiver and storage
     receiver = AsyncNMEAReceiver(host="0.0.0.0", port=19710)
     storage = GPSDataCSVStorage(output_dir="gps_data")
-    positions = []
-
-    # Callback for received NMEA
-    async def on_nmea(nmea_str: str, addr):
-        try:
-            parsed = NMEAValidator.safe_parse(nmea_str)
-            if parsed:
-                info = NMEAValidator.extract_position_info(parsed)
-                if info:
-                    pos = {
-                        'timestamp': datetime.now().isoformat(),
-                        'latitude': info['latitude'],
-                        'longitude': info['longitude'],
-                        'altitude': info.get('altitude', 0.0),
-                        'satellites': info.get('num_satellites'),
-                        'quality': info.get('gps_quality')
-                    }
-                    positions.append(pos)
-                    logger.info(
-                        "position_received",
-                        lat=info['latitude'],
-                        lon=info['longitude'],
-                        source=addr[0]
-                    )
-        except Exception as e:
-            logger.error("nmea_parse_error", error=str(e))
+    positions = PositionColumns()
+
+    pending = []
+
+    def flush():
+        batch = pending[:]
+        pending.clear()
+        valid = NMEAValidator.validate_batch([nmea_str for nmea_str, _, _ in batch])
+
+        # Parse first, range check all positions of the batch at once
+        infos = []
+        sources = []
+        received = []
+        for (nmea_str, addr, received_ns), ok in zip(batch, valid):
+            if not ok:
+                continue
+            # RMC/GGA fast path, checksum already verified by the batch
+            info = NMEAValidator.parse_position(nmea_str, validate=False)
+            if info is None:
+                try:
+                    info = NMEAValidator.extract_position_info(pynmea2.parse(nmea_str.strip()))
+                except pynmea2.ParseError as e:
+                    logger.error("nmea_parse_error", error=str(e))
+                    continue
+            if info:
+                infos.append(info)
+                sources.append(addr[0])
+                received.append(received_ns)
+
+        if not infos:
+            return
+
+        lat = np.array([info.latitude for info in infos], dtype=np.float64)
+        lon = np.array([info.longitude for info in infos], dtype=np.float64)
+        if NUMBA_AVAILABLE:
+            in_range = validate_positions_batch(lat, lon)
+        else:
+            in_range = (np.abs(lat) <= 90.0) & (np.abs(lon) <= 180.0)
+
+        keep = np.flatnonzero(in_range)
+        if keep.size == 0:
+            return
+
+        positions.extend(
+            timestamp=np.array(received, dtype=np.int64)[keep],
+            latitude=lat[keep],
+            longitude=lon[keep],
+            altitude=[infos[i].altitude or 0.0 for i in keep],
+            satellites=[MISSING if infos[i].num_satellites is None
+                        else infos[i].num_satellites for i in keep],
+            quality=[MISSING if infos[i].gps_quality is None
+                     else infos[i].gps_quality for i in keep]
+        )
+
+        for i in keep:
+            logger.info(
+                "position_received",
+                lat=infos[i].latitude,
+                lon=infos[i].longitude,
+                source=sources[i]
+            )
+
+    # Callback for received NMEA, only queues the sentence
+    def on_nmea(nmea_str: str, addr):
+        pending.append((nmea_str, addr, time.time_ns()))
+        if len(pending) >= BATCH_SIZE:
+            flush()
+
+    async def flush_periodically():
+        while True:
+            await asyncio.sleep(BATCH_INTERVAL)
+            if pending:
+                flush()
 
     # Register callback
     receiver.register_callback(on_nmea)
@@ -48,16 +166,20 @@ async def main():
     # Start receiver
     try:
         receiver_task = asyncio.create_task(receiver.start())
+        flush_task = asyncio.create_task(flush_periodically())
 
         # Record for 60 seconds
         await asyncio.sleep(60)
 
         # Stop and save
         await receiver.stop()
+        flush_task.cancel()
+        if pending:
+            flush()
 
-        if positions:
-            storage.save_positions(positions, "recorded_data.csv")
-            logger.info("data_saved", count=len(positions))
+        if positions.count:
+            storage.save_positions(positions.to_columns(), "recorded_data.csv")
+            logger.info("data_saved", count=positions.count)
 
     except KeyboardInterrupt:
         logger.info("recording_stopped")
@@ -11,10 +11,12 @@ import numpy as np
 
 # Import modules to test
 try:
-    from coordinates import Coordinate, Position, CoordinateConverter, CoordinateError
+    from coordinates import (Coordinate, Position, PositionArray,
+                             CoordinateConverter, CoordinateError)
     from nmea_validator import NMEAValidator, NMEAGenerator
     from gps_data_model import GPSDataModel, GPSPosition, GPSTrack
     from config_loader import Config
+    from gps_data_csv_storage import GPSDataCSVStorage, PARQUET_AVAILABLE
 except ImportError as e:
     print(f"Import error: {e}")
     print("Make sure all modules are in the Python path")
@@ -77,6 +79,12 @@ class TestCoordinates:
         expected = 48 * 100 + 0.1234 * 60
         assert abs(dm - expected) < 0.01
 
+    def test_coordinate_to_nmea_string(self):
+        """Test fixed-width NMEA coordinate formatting."""
+        assert Coordinate(48.1234, 'N').to_nmea_string() == '4807.4040'
+        assert Coordinate(5.5, 'S').to_nmea_string() == '0530.0000'
+        assert Coordinate(11.5, 'E').to_nmea_string(lat_format=False) == '01130.0000'
+
     def test_coordinate_signed_decimal(self):
         """Test signed decimal conversion."""
         lat_n = Coordinate(48.0, 'N')
@@ -109,6 +117,50 @@ class TestCoordinates:
         # Distance should be approximately 11.1 km
         assert 10.0 < distance < 12.0
 
+    def test_position_distance_array(self):
+        """Test vectorized distance matches scalar distance."""
+        origin = Position.from_decimal(48.0, 11.0)
+        lats = np.array([48.1, 47.5, -33.9])
+        lons = np.array([11.0, 12.0, 151.2])
+
+        distances = origin.distance_to_array(lats, lons)
+
+        for lat, lon, dist in zip(lats, lons, distances):
+            expected = origin.distance_to(Position.from_decimal(lat, lon))
+            assert abs(dist - expected) < 1e-6
+
+    def test_position_from_decimal_validation(self):
+        """Test from_decimal range checks and matches validated construction."""
+        pos = Position.from_decimal(-48.0, -11.0)
+        assert pos == Position(Coordinate(48.0, 'S'), Coordinate(11.0, 'W'))
+
+        with pytest.raises(CoordinateError):
+            Position.from_decimal(91.0, 0.0)
+        with pytest.raises(CoordinateError):
+            Position.from_decimal(0.0, -181.0)
+
+    def test_position_immutable(self):
+        """Test positions are frozen and hashable."""
+        pos = Position.from_decimal(48.0, 11.0)
+
+        with pytest.raises(AttributeError):
+            pos.altitude = 5.0
+
+        assert hash(pos) == hash(Position.from_decimal(48.0, 11.0))
+
+    def test_position_array_roundtrip(self):
+        """Test SoA container conversion."""
+        positions = [Position.from_decimal(48.0, -11.0, 1.0),
+                     Position.from_decimal(-33.9, 151.2, 2.0)]
+
+        arr = PositionArray.from_positions(positions)
+
+        assert len(arr) == 2
+        assert arr.lat[1] == -33.9
+        assert arr.lon[0] == -11.0
+        assert arr.to_positions() == positions
+        assert abs(arr.distances_from(positions[0])[0]) < 1e-9
+
     def test_coordinate_converter(self):
         """Test coordinate converter utilities."""
         # Test DMS conversion
@@ -117,6 +169,14 @@ class TestCoordinates:
         assert abs(dms[1] - 7) < 1  # minutes
         assert abs(dms[2] - 24.24) < 1  # seconds
 
+        # Test batch DMS conversion matches scalar version
+        values = np.array([48.1234, -11.5678, 0.5])
+        degrees, minutes, seconds = CoordinateConverter.decimal_to_dms_array(values)
+        for i, value in enumerate(values):
+            d, m, sec = CoordinateConverter.decimal_to_dms(value)
+            assert (degrees[i], minutes[i]) == (d, m)
+            assert abs(seconds[i] - sec) < 1e-9
+
         # Test validation
         assert CoordinateConverter.validate_latitude(45.0)
         assert not CoordinateConverter.validate_latitude(95.0)
@@ -136,6 +196,13 @@ class TestNMEAValidator:
         assert len(checksum) == 2
         assert all(c in '0123456789ABCDEF' for c in checksum)
 
+        # Folded XOR matches a plain byte loop for any length
+        for n in (0, 1, 2, 3, 17, len(sentence)):
+            expected = 0
+            for char in sentence[:n]:
+                expected ^= ord(char)
+            assert NMEAValidator.calculate_checksum(sentence[:n]) == f"{expected:02X}"
+
     def test_checksum_validation(self):
         """Test NMEA checksum validation."""
         valid_nmea = "$GPRMC,123456.00,A,4807.404,N,01131.324,E,0.0,0.0,191124,,,A*6C"
@@ -148,10 +215,40 @@ class TestNMEAValidator:
         """Test NMEA format validation."""
         valid_nmea = "$GPRMC,123456.00,A,4807.404,N,01131.324,E,0.0,0.0,191124,,,A*6C"
         assert NMEAValidator.validate_format(valid_nmea)
+        assert NMEAValidator.validate_format(valid_nmea + "\r\n")
+        assert NMEAValidator.validate_format((valid_nmea + "\r\n").encode('ascii'))
 
         invalid_format = "GPRMC,123456.00,A,4807.404,N"
         assert not NMEAValidator.validate_format(invalid_format)
 
+    def test_supported_sentence(self):
+        """Test supported sentence lookup on text and raw bytes."""
+        gga = "$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,46.9,M,,*47"
+
+        assert NMEAValidator.is_supported_sentence(gga)
+        assert NMEAValidator.is_supported_sentence(gga.encode('ascii'))
+        assert not NMEAValidator.is_supported_sentence("$GPZDA,123519,*00")
+        assert not NMEAValidator.is_supported_sentence(b"GPGGA,123519")
+        assert NMEAValidator.calculate_checksum(gga[1:-3].encode('ascii')) == "47"
+
+    def test_validate_batch(self):
+        """Test batch validation against single sentence validation."""
+        valid_nmea = "$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,46.9,M,,*47"
+        sentences = [
+            valid_nmea,
+            valid_nmea.encode('ascii'),
+            valid_nmea[:-2] + "FF",
+            "GPRMC,123456.00,A,4807.404,N",
+            "$GP",
+            "",
+        ]
+
+        result = NMEAValidator.validate_batch(sentences)
+
+        assert result.dtype == bool
+        assert result.tolist() == [True, True, False, False, False, False]
+        assert NMEAValidator.validate_batch([]).size == 0
+
     def test_sentence_type_extraction(self):
         """Test sentence type extraction."""
         nmea = "$GPRMC,123456.00,A,4807.404,N,01131.324,E,0.0,0.0,191124,,,A*6C"
@@ -179,6 +276,41 @@ class TestNMEAValidator:
         # Should return None without raising exception
         assert result is None
 
+    def test_parse_position_fast_path(self):
+        """Test regex fast path matches pynmea2 extraction."""
+        gga = "$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,46.9,M,,*47"
+        rmc = NMEAGenerator.generate_rmc(-48.1234, 11.5678)
+
+        for nmea in (gga, rmc):
+            fast = NMEAValidator.parse_position(nmea)
+            slow = NMEAValidator.extract_position_info(NMEAValidator.safe_parse(nmea))
+            assert fast is not None
+            assert fast == slow
+
+        assert NMEAValidator.parse_position(gga).num_satellites == 8
+
+        # Unsupported or corrupted sentences are left to the slow path
+        assert NMEAValidator.parse_position("$GPGSA,A,3,04,05,,,,,,,,,,,2.5,1.3,2.1*39") is None
+        assert NMEAValidator.parse_position(gga[:-2] + "00") is None
+
+    def test_parse_gga_kernel(self):
+        """Test byte-level GGA kernel agrees with the regex fast path."""
+        from gps_kernels import parse_gga
+
+        gga = "$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,46.9,M,,*47"
+        lat, lon, alt, sats, quality = parse_gga(np.frombuffer(gga.encode(), dtype=np.uint8))
+        info = NMEAValidator.parse_position(gga)
+
+        assert lat == pytest.approx(info.latitude)
+        assert lon == pytest.approx(info.longitude)
+        assert (alt, sats, quality) == (545.4, 8, 1)
+
+        # Bad checksum and other sentence types give NaN
+        bad = parse_gga(np.frombuffer(gga[:-2].encode() + b"00", dtype=np.uint8))
+        assert np.isnan(bad[0])
+        rmc = NMEAGenerator.generate_rmc_bytes(48.0, 11.0)
+        assert np.isnan(parse_gga(np.frombuffer(rmc, dtype=np.uint8))[0])
+
     def test_nmea_generator(self):
         """Test NMEA sentence generation."""
         nmea = NMEAGenerator.generate_rmc(48.1234, 11.5678)
@@ -192,6 +324,19 @@ class TestNMEAValidator:
         # Should be valid format
         assert NMEAValidator.is_valid_nmea(nmea)
 
+    def test_nmea_generator_bytes(self):
+        """Test bytes generator output and string generator parity."""
+        ts = datetime(2024, 11, 19, 12, 34, 56, 789000)
+
+        assert NMEAGenerator.generate_rmc_bytes(48.1234, 11.5678, ts, 1.5, 90.0, ts) == \
+            b"$GPRMC,123456.78,A,4807.4040,N,01134.0680,E,1.5,90.0,191124,,A*4B"
+
+        for lat, lon in ((48.1234, 11.5678), (-33.8688, -151.2093), (0.0, 0.0)):
+            sentence = NMEAGenerator.generate_rmc(lat, lon, ts, 1.5, 90.0, ts)
+            assert NMEAValidator.validate_checksum(sentence)
+            assert sentence.encode('ascii') == \
+                NMEAGenerator.generate_rmc_bytes(lat, lon, ts, 1.5, 90.0, ts)
+
 
 class TestGPSDataModel:
     """Test suite for GPS data model."""
@@ -223,6 +368,8 @@ class TestGPSDataModel:
 
         # Should only keep last 5
         assert model.get_position_count() == 5
+        assert model.get_latitude_data() == pytest.approx([48.05, 48.06, 48.07, 48.08, 48.09])
+        assert model.get_bounds()['min_lat'] == pytest.approx(48.05)
 
     def test_observer_pattern(self):
         """Test observer notifications."""
@@ -240,6 +387,15 @@ class TestGPSDataModel:
         assert len(callback_called) == 1
         assert callback_called[0] == pos
 
+    def test_distance_to_fast(self):
+        """Test equirectangular distance against Haversine for nearby fixes."""
+        pos1 = GPSPosition(48.0, 11.0)
+        pos2 = GPSPosition(48.001, 11.001)
+
+        assert pos1.distance_to_fast(pos2) == pytest.approx(pos1.distance_to(pos2), abs=0.01)
+        assert (GPSPosition(0.0, 179.9999).distance_to_fast(GPSPosition(0.0, -179.9999)) ==
+                pytest.approx(22.24, abs=0.01))
+
     def test_get_statistics(self):
         """Test statistics calculation."""
         model = GPSDataModel()
@@ -256,6 +412,32 @@ class TestGPSDataModel:
         assert stats['stored_positions'] == 2
         assert stats['average_speed'] == 15.0
 
+    def test_positions_snapshot(self):
+        """Test snapshot reuse until the model changes."""
+        model = GPSDataModel()
+        model.add_position(GPSPosition(48.0, 11.0, 0.0))
+
+        first = model.get_positions()
+        assert model.get_positions() is first
+
+        model.add_position(GPSPosition(48.1, 11.0, 0.0))
+        second = model.get_positions()
+        assert second is not first
+        assert len(second) == 2
+        assert model.get_positions(count=1) == (second[-1],)
+
+    def test_position_from_info(self):
+        """Test position creation from extracted NMEA info."""
+        gga = "$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,46.9,M,,*47"
+        info = NMEAValidator.parse_position(gga)
+
+        pos = GPSPosition.from_position_info(info)
+
+        assert pos.latitude == info.latitude
+        assert pos.altitude == 545.4
+        assert pos.satellites == 8
+        assert isinstance(pos.timestamp, datetime)
+
     def test_clear(self):
         """Test clearing model data."""
         model = GPSDataModel()
@@ -356,6 +538,27 @@ class TestConfiguration:
         port = config.get('network.udp_port', 19711)
         assert isinstance(port, int)
 
+    def test_config_freeze(self):
+        """Test flat dotted-path view matches get()."""
+        config = Config()
+        flat = config.freeze()
+
+        assert flat['network.udp_port'] == config.get('network.udp_port')
+        assert flat['network'] == config.get_section('network')
+        assert config.get('network.no_such_key', 42) == 42
+        assert config.get('network.udp_port.deeper', 'x') == 'x'
+
+        with pytest.raises(TypeError):
+            flat['network.udp_port'] = 1
+
+    def test_module_level_get(self):
+        """Test module-level CONFIG and get() use the shared instance."""
+        import config_loader
+
+        assert config_loader.get_config() is Config()
+        assert config_loader.get('network.udp_port') == Config().get('network.udp_port')
+        assert config_loader.get('network.no_such_key', 42) == 42
+
     def test_config_get_section(self):
         """Test section retrieval."""
         config = Config()
@@ -364,6 +567,28 @@ class TestConfiguration:
         assert isinstance(network_config, dict)
 
 
+class TestCSVStorage:
+    """Test suite for CSV/Parquet storage."""
+
+    @pytest.mark.skipif(not PARQUET_AVAILABLE, reason="pyarrow not installed")
+    def test_delete_old_records_parquet(self, tmp_path):
+        """Test cleanup keeps Parquet files readable as Parquet."""
+        import pandas as pd
+
+        storage = GPSDataCSVStorage(str(tmp_path))
+        now = datetime.now()
+        rows = [
+            {'timestamp': now - pd.Timedelta(days=60), 'latitude': 48.0, 'longitude': 11.0},
+            {'timestamp': now, 'latitude': 48.1, 'longitude': 11.1},
+        ]
+        storage.save_positions(rows, 'p.parquet')
+
+        assert storage.delete_old_records('p.parquet', 30) == 1
+        df = pd.read_parquet(tmp_path / 'p.parquet')
+        assert len(df) == 1
+        assert df['latitude'].iloc[0] == 48.1
+
+
 def run_all_tests():
     """Run all tests with pytest."""
     pytest.main([__file__, '-v', '--tb=short'])